@@ -0,0 +1,90 @@
+"""Benchmark comparing the FASTA writers.
+
+Compares the original :py:mod:`textwrap`-based implementation of
+:py:func:`~fqfa.fasta.fasta.write_fasta_record` with the current single-record writer and
+the buffered :py:func:`~fqfa.fasta.fasta.write_fasta_records` writer.
+
+Run from the repository root::
+
+    python benchmarks/fasta_write.py
+
+"""
+
+import io
+import gzip
+import random
+import string
+import textwrap
+import timeit
+from typing import List, Tuple, Callable, IO, Any
+from fqfa.fasta.fasta import write_fasta_record, write_fasta_records
+
+
+def legacy_write_fasta_record(handle: IO[Any], header: str, seq: str, width: int = 60) -> None:
+    """Copy of the original textwrap-based writer, used as the reference."""
+    header = header.strip()
+    seq = seq.translate(str.maketrans("", "", string.whitespace))
+
+    if len(header) == 0:
+        raise ValueError("empty FASTA header")
+    if len(seq) == 0:
+        raise ValueError("empty FASTA sequence")
+
+    print(f">{header}\n{textwrap.fill(seq, width=width)}", file=handle)
+
+
+def make_records(count: int, length: int, seed: int = 0) -> List[Tuple[str, str]]:
+    rng = random.Random(seed)
+    return [(f"record_{i}", "".join(rng.choices("ACGT", k=length))) for i in range(count)]
+
+
+def run_legacy(records: List[Tuple[str, str]], handle: IO[Any]) -> None:
+    for header, seq in records:
+        legacy_write_fasta_record(handle, header, seq)
+
+
+def run_single(records: List[Tuple[str, str]], handle: IO[Any]) -> None:
+    for header, seq in records:
+        write_fasta_record(handle, header, seq)
+
+
+def run_batch(records: List[Tuple[str, str]], handle: IO[Any]) -> None:
+    write_fasta_records(handle, records)
+
+
+def time_writer(writer: Callable[[List[Tuple[str, str]], IO[Any]], None], records: List[Tuple[str, str]]) -> float:
+    return min(timeit.repeat(lambda: writer(records, io.StringIO()), number=1, repeat=3))
+
+
+def time_gzip_batch(records: List[Tuple[str, str]]) -> float:
+    def run() -> None:
+        with gzip.GzipFile(fileobj=io.BytesIO(), mode="wb", compresslevel=1) as handle:
+            write_fasta_records(handle, records)
+
+    return min(timeit.repeat(run, number=1, repeat=3))
+
+
+def main() -> None:
+    datasets = {
+        "100000 x 150 bp": make_records(100000, 150),
+        "10 x 1 Mb": make_records(10, 1000000),
+    }
+    writers = {
+        "textwrap (original)": run_legacy,
+        "write_fasta_record": run_single,
+        "write_fasta_records": run_batch,
+    }
+
+    for name, records in datasets.items():
+        print(name)
+        baseline = None
+        for label, writer in writers.items():
+            elapsed = time_writer(writer, records)
+            if baseline is None:
+                baseline = elapsed
+            print(f"  {label:<28}{elapsed:>8.3f} s{baseline / elapsed:>8.1f}x")
+        print(f"  {'write_fasta_records (gzip)':<28}{time_gzip_batch(records):>8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""Benchmark suite for the parsers, writers, and sequence utilities.
+
+Measures the throughput and peak memory use of
+:py:func:`~fqfa.fastq.fastq.parse_fastq_reads`,
+:py:func:`~fqfa.fastq.fastq.parse_fastq_pe_reads`,
+:py:func:`~fqfa.fasta.fasta.parse_fasta_records`,
+:py:func:`~fqfa.fasta.fasta.write_fasta_record`,
+:py:func:`~fqfa.util.file.open_compressed` (uncompressed, gzip, and bzip2),
+:py:func:`~fqfa.util.translate.translate_dna`,
+:py:func:`~fqfa.util.nucleotide.reverse_complement`, and the validators.
+The input data is randomly generated from a fixed seed in a temporary directory, so
+results are comparable between runs and machines without any external datasets.
+
+Each benchmark is timed several times and the fastest run is reported as records per
+second and megabytes of input per second.
+Peak memory is measured in a separate run using :py:mod:`tracemalloc`, which only
+counts memory allocated by Python.
+
+Run from the repository root and save the results::
+
+    python benchmarks/suite.py --output baseline.json
+
+After making changes, compare against the saved results::
+
+    python benchmarks/suite.py --compare baseline.json
+
+Benchmarks whose throughput drops or whose peak memory grows by more than the
+threshold (default 10%) are flagged, and the exit status is 1 if any are flagged.
+Use ``--scale`` to run on smaller or larger inputs, but only compare results that were
+created with the same scale.
+
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+import fqfa
+from fqfa.fasta.fasta import parse_fasta_records, write_fasta_record
+from fqfa.fastq.fastq import parse_fastq_reads, parse_fastq_pe_reads
+from fqfa.util.file import open_compressed
+from fqfa.util.nucleotide import reverse_complement
+from fqfa.util.translate import translate_dna
+from fqfa.validator.validator import dna_bases_validator, dna_bases_lookup_validator
+
+MEMORY_NOISE = 1 << 16
+"""int: increase in peak memory, in bytes, that is never flagged as a regression.
+
+Benchmarks that stream their input use very little memory, so small absolute changes
+would otherwise be large relative changes.
+
+"""
+
+
+class Benchmark(NamedTuple):
+    """A single benchmark.
+
+    Attributes
+    ----------
+    name : str
+        Unique name of the benchmark, used to match results between runs.
+    records : int
+        Number of records processed by each run.
+    size : int
+        Number of bytes of input processed by each run.
+    run : Callable[[], Any]
+        Function that performs one run.
+
+    """
+
+    name: str
+    records: int
+    size: int
+    run: Callable[[], Any]
+
+
+def make_fastq(count: int, length: int, seed: int) -> str:
+    rng = random.Random(seed)
+    reads = list()
+    for i in range(count):
+        seq = "".join(rng.choices("ACGT", k=length))
+        qual = "".join(rng.choices("#+5?FI", k=length))
+        reads.append(f"@READ:{i} 1:N:0:1\n{seq}\n+\n{qual}\n")
+    return "".join(reads)
+
+
+def make_fasta(count: int, length: int, seed: int) -> str:
+    rng = random.Random(seed)
+    records = list()
+    for i in range(count):
+        seq = "".join(rng.choices("ACGT", k=length))
+        lines = "\n".join(seq[j : j + 60] for j in range(0, length, 60))
+        records.append(f">record_{i}\n{lines}\n")
+    return "".join(records)
+
+
+def make_sequences(count: int, length: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    return ["".join(rng.choices("ACGT", k=length)) for _ in range(count)]
+
+
+def write_file(tmpdir: str, name: str, data: str) -> str:
+    path = os.path.join(tmpdir, name)
+    with open_compressed(path, mode="w") as handle:
+        handle.write(data)
+    return path
+
+
+def consume(iterable: Any) -> None:
+    for _ in iterable:
+        pass
+
+
+def read_blocks(path: str) -> None:
+    with open_compressed(path, mode="rb") as handle:
+        while len(handle.read(1 << 20)) > 0:
+            pass
+
+
+def parse_file(parser: Callable[[Any], Any], path: str, mode: str) -> None:
+    with open_compressed(path, mode=mode) as handle:
+        consume(parser(handle))
+
+
+def parse_pair(fwd_path: str, rev_path: str, revcomp: bool) -> None:
+    with open_compressed(fwd_path, mode="rb") as fwd, open_compressed(rev_path, mode="rb") as rev:
+        consume(parse_fastq_pe_reads(fwd, rev, revcomp=revcomp))
+
+
+def write_records(records: List[List[str]]) -> None:
+    handle = io.StringIO()
+    for header, seq in records:
+        write_fasta_record(handle, header, seq)
+
+
+def create_benchmarks(tmpdir: str, scale: float) -> List[Benchmark]:
+    """Generate the input data and create the benchmarks.
+
+    Parameters
+    ----------
+    tmpdir : str
+        Directory for the input files.
+    scale : float
+        Multiplier for the number of records in each input.
+
+    Returns
+    -------
+    List[Benchmark]
+        The benchmarks.
+
+    """
+    read_count = max(1, int(100000 * scale))
+    record_count = max(1, int(10000 * scale))
+    fastq = make_fastq(read_count, 150, seed=0)
+    fastq_rev = make_fastq(read_count, 150, seed=1)
+    fasta = make_fasta(record_count, 1000, seed=2)
+    sequences = make_sequences(read_count, 150, seed=3)
+    records = [[f"record_{i}", seq] for i, seq in enumerate(make_sequences(record_count, 1000, seed=4))]
+    sequence_size = sum(len(seq) for seq in sequences)
+
+    benchmarks = list()
+    for compression in ("", ".gz", ".bz2"):
+        label = compression[1:] if compression else "raw"
+        fastq_path = write_file(tmpdir, f"reads.fq{compression}", fastq)
+        fasta_path = write_file(tmpdir, f"records.fa{compression}", fasta)
+        benchmarks.append(
+            Benchmark(f"open_compressed[{label}]", read_count, len(fastq), lambda p=fastq_path: read_blocks(p))
+        )
+        for mode in ("r", "rb"):
+            benchmarks.append(
+                Benchmark(
+                    f"parse_fastq_reads[{label},{mode}]",
+                    read_count,
+                    len(fastq),
+                    lambda p=fastq_path, m=mode: parse_file(parse_fastq_reads, p, m),
+                )
+            )
+        benchmarks.append(
+            Benchmark(
+                f"parse_fasta_records[{label},rb]",
+                record_count,
+                len(fasta),
+                lambda p=fasta_path: parse_file(parse_fasta_records, p, "rb"),
+            )
+        )
+
+    fwd_path = os.path.join(tmpdir, "reads.fq")
+    rev_path = write_file(tmpdir, "reads_rev.fq", fastq_rev)
+    for revcomp in (False, True):
+        benchmarks.append(
+            Benchmark(
+                f"parse_fastq_pe_reads[revcomp={revcomp}]",
+                read_count,
+                len(fastq) + len(fastq_rev),
+                lambda r=revcomp: parse_pair(fwd_path, rev_path, r),
+            )
+        )
+
+    benchmarks.extend(
+        [
+            Benchmark(
+                "write_fasta_record",
+                record_count,
+                sum(len(seq) for _, seq in records),
+                lambda: write_records(records),
+            ),
+            Benchmark("translate_dna", read_count, sequence_size, lambda: [translate_dna(seq)[0] for seq in sequences]),
+            Benchmark(
+                "reverse_complement", read_count, sequence_size, lambda: [reverse_complement(seq) for seq in sequences]
+            ),
+            Benchmark(
+                "dna_bases_validator",
+                read_count,
+                sequence_size,
+                lambda: [dna_bases_validator(seq) for seq in sequences],
+            ),
+            Benchmark(
+                "dna_bases_lookup_validator",
+                read_count,
+                sequence_size,
+                lambda: [dna_bases_lookup_validator(seq) for seq in sequences],
+            ),
+        ]
+    )
+    return benchmarks
+
+
+def measure(benchmark: Benchmark, repeat: int) -> Dict[str, Any]:
+    """Time a benchmark and measure its peak memory use.
+
+    Parameters
+    ----------
+    benchmark : Benchmark
+        The benchmark to run.
+    repeat : int
+        Number of timed runs.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The results.
+
+    """
+    seconds = min(timeit.repeat(benchmark.run, number=1, repeat=repeat))
+
+    tracemalloc.start()
+    try:
+        benchmark.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "records": benchmark.records,
+        "bytes": benchmark.size,
+        "seconds": seconds,
+        "records_per_second": benchmark.records / seconds,
+        "mb_per_second": benchmark.size / seconds / 1e6,
+        "peak_memory_bytes": peak,
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a comparison with the baseline results and find the regressions.
+
+    Parameters
+    ----------
+    results : Dict[str, Any]
+        The current results.
+    baseline : Dict[str, Any]
+        The baseline results.
+    threshold : float
+        Largest allowed fractional decrease in throughput or increase in peak memory.
+
+    Returns
+    -------
+    List[str]
+        Names of the benchmarks that regressed.
+
+    """
+    if results["scale"] != baseline.get("scale"):
+        print(f"warning: baseline scale {baseline.get('scale')} differs from current scale {results['scale']}")
+
+    regressions = list()
+    print(f"{'benchmark':<36}{'records/s':>14}{'change':>9}{'peak MB':>10}{'change':>9}")
+    for name, current in results["benchmarks"].items():
+        previous = baseline["benchmarks"].get(name)
+        if previous is None:
+            print(f"{name:<36}{current['records_per_second']:>14,.0f}{'new':>9}")
+            continue
+        speed = current["records_per_second"] / previous["records_per_second"] - 1.0
+        memory_increase = current["peak_memory_bytes"] - previous["peak_memory_bytes"]
+        memory = memory_increase / max(previous["peak_memory_bytes"], 1)
+        flags = list()
+        if speed < -threshold:
+            flags.append("slower")
+        if memory > threshold and memory_increase > MEMORY_NOISE:
+            flags.append("more memory")
+        if len(flags) > 0:
+            regressions.append(name)
+        line = (
+            f"{name:<36}{current['records_per_second']:>14,.0f}{speed:>+9.1%}"
+            f"{current['peak_memory_bytes'] / 1e6:>10.1f}{memory:>+9.1%}"
+        )
+        if len(flags) > 0:
+            line += f"  REGRESSION ({', '.join(flags)})"
+        print(line)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write the results to this JSON file instead of standard output")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare the results with this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fractional change in throughput or peak memory that counts as a regression (default 0.1)",
+    )
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the input sizes (default 1.0)")
+    parser.add_argument("--repeat", type=int, default=3, help="number of timed runs per benchmark (default 3)")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose names contain this string")
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Any] = {
+        "fqfa": fqfa.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "benchmarks": dict(),
+    }
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for benchmark in create_benchmarks(tmpdir, args.scale):
+            if args.filter in benchmark.name:
+                print(f"running {benchmark.name}", file=sys.stderr)
+                results["benchmarks"][benchmark.name] = measure(benchmark, args.repeat)
+    finally:
+        shutil.rmtree(tmpdir)
+
+    if args.output is not None:
+        with open(args.output, "w") as handle:
+            json.dump(results, handle, indent=2)
+    elif args.compare is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare is not None:
+        with open(args.compare) as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold)
+        if len(regressions) > 0:
+            print(f"{len(regressions)} regression(s) found")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Benchmark comparing text and binary mode parsing.
+
+Compares :py:func:`~fqfa.fastq.fastq.parse_fastq_reads` and
+:py:func:`~fqfa.fasta.fasta.parse_fasta_records` on file handles opened by
+:py:func:`~fqfa.util.file.open_compressed` in text mode and in binary mode, for
+uncompressed, gzip, and bzip2 files.
+The input files are generated in a temporary directory.
+
+Run from the repository root::
+
+    python benchmarks/text_vs_binary.py
+
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import timeit
+from typing import Callable, Dict, Any, IO
+from fqfa.fastq.fastq import parse_fastq_reads
+from fqfa.fasta.fasta import parse_fasta_records
+from fqfa.util.file import open_compressed
+
+
+def make_fastq(count: int, length: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    reads = list()
+    for i in range(count):
+        seq = "".join(rng.choices("ACGT", k=length))
+        qual = "".join(rng.choices("#+5?FI", k=length))
+        reads.append(f"@READ:{i} 1:N:0:1\n{seq}\n+\n{qual}\n")
+    return "".join(reads)
+
+
+def make_fasta(count: int, length: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    records = list()
+    for i in range(count):
+        seq = "".join(rng.choices("ACGT", k=length))
+        lines = "\n".join(seq[j : j + 60] for j in range(0, length, 60))
+        records.append(f">record_{i}\n{lines}\n")
+    return "".join(records)
+
+
+def consume(parser: Callable[[IO[Any]], Any], path: str, mode: str) -> None:
+    with open_compressed(path, mode=mode) as handle:
+        for _ in parser(handle):
+            pass
+
+
+def main() -> None:
+    datasets: Dict[str, Any] = {
+        "FASTQ (100000 x 150 bp)": (parse_fastq_reads, make_fastq(100000, 150), ".fq"),
+        "FASTA (10000 x 1000 bp)": (parse_fasta_records, make_fasta(10000, 1000), ".fa"),
+    }
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for name, (parser, data, ext) in datasets.items():
+            print(name)
+            for compression in ("", ".gz", ".bz2"):
+                path = os.path.join(tmpdir, f"data{ext}{compression}")
+                with open_compressed(path, mode="w") as handle:
+                    handle.write(data)
+
+                results = dict()
+                for mode in ("r", "rb"):
+                    results[mode] = min(
+                        timeit.repeat(lambda: consume(parser, path, mode), number=1, repeat=3)  # noqa: B023
+                    )
+                label = compression[1:] if compression else "raw"
+                print(
+                    f"  {label:<6}text{results['r']:>8.3f} s"
+                    f"    binary{results['rb']:>8.3f} s{results['r'] / results['rb']:>8.2f}x"
+                )
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark comparing regular expression and lookup table-based validators.
+
+Compares validators created by :py:func:`~fqfa.validator.create.create_validator` and
+:py:func:`~fqfa.validator.create.create_lookup_validator` on random read-length
+sequences, as strings and as bytes, for valid sequences and for sequences with an
+invalid character near the end.
+
+Run from the repository root::
+
+    python benchmarks/validators.py
+
+"""
+
+import random
+import re
+import timeit
+from typing import Any, Callable, List
+from fqfa.validator.create import create_validator, create_lookup_validator
+
+
+def make_sequences(count: int, length: int, invalid: bool, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    seqs = list()
+    for _ in range(count):
+        seq = "".join(rng.choices("ACGTN", k=length))
+        if invalid:
+            seq = seq[:-2] + "X" + seq[-1:]
+        seqs.append(seq)
+    return seqs
+
+
+def run(validator: Callable[[Any], Any], seqs: List[Any]) -> float:
+    return min(timeit.repeat(lambda: [validator(seq) for seq in seqs], number=1, repeat=5))
+
+
+def main() -> None:
+    count = 100000
+    validators = {
+        "regex": (create_validator("ACGTN"), re.compile(b"[ACGTN]+").fullmatch),
+        "lookup": (create_lookup_validator("ACGTN"), create_lookup_validator("ACGTN")),
+        "lookup (position)": (
+            create_lookup_validator("ACGTN", report_position=True),
+            create_lookup_validator("ACGTN", report_position=True),
+        ),
+    }
+
+    for length in (50, 150, 300):
+        for invalid in (False, True):
+            seqs = make_sequences(count, length, invalid)
+            byte_seqs = [seq.encode("ascii") for seq in seqs]
+            print(f"{count} x {length} bp, {'invalid' if invalid else 'valid'}")
+            baseline = None
+            for name, (str_validator, bytes_validator) in validators.items():
+                str_time = run(str_validator, seqs)
+                bytes_time = run(bytes_validator, byte_seqs)
+                if baseline is None:
+                    baseline = str_time
+                print(
+                    f"  {name:<18}str{str_time:>8.3f} s{baseline / str_time:>6.2f}x"
+                    f"    bytes{bytes_time:>8.3f} s{baseline / bytes_time:>6.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,30 +1,125 @@
-from fqfa.fasta.fasta import parse_fasta_records, write_fasta_record
+import importlib
+from typing import Any, List
+from fqfa.fasta.fasta import (
+    parse_fasta_records,
+    parse_fasta_records_chunked,
+    scan_fasta_records,
+    write_fasta_record,
+    write_fasta_records,
+)
+from fqfa.fasta.index import FastaIndex
 from fqfa.fastq.fastq import parse_fastq_reads, parse_fastq_pe_reads
+from fqfa.twobit.twobit import PackedSequence, read_twobit, write_twobit
+from fqfa.util.bgzf import BgzfReader, BgzfWriter
 from fqfa.util.file import open_compressed, has_fasta_ext, has_fastq_ext
-from fqfa.util.infer import infer_sequence_type, infer_all_sequence_types
+from fqfa.util.infer import infer_sequence_type, infer_all_sequence_types, infer_file_sequence_type, SequenceTypeReport
 from fqfa.util.nucleotide import (
     reverse_complement,
     convert_dna_to_rna,
     convert_rna_to_dna,
+    reverse_complement_inplace,
+    convert_dna_to_rna_inplace,
+    convert_rna_to_dna_inplace,
+    reverse_complement_batch,
+    convert_dna_to_rna_batch,
+    convert_rna_to_dna_batch,
+)
+from fqfa.util.orf import Orf, find_orfs, find_orfs_in_records
+from fqfa.util.translate import (
+    translate_dna,
+    translate_six_frames,
+    ncbi_genetic_code_to_dict,
+    ncbi_genetic_code_to_table,
+    ncbi_translation_table,
+    TranslationTable,
 )
-from fqfa.util.translate import translate_dna, ncbi_genetic_code_to_dict
 
 __version__ = "1.3.1"
 
+_LAZY_MODULES = {
+    "aparse_fastq_reads": "fqfa.util.aio",
+    "aparse_fasta_records": "fqfa.util.aio",
+    "hamming_distance": "fqfa.util.distance",
+    "levenshtein_distance": "fqfa.util.distance",
+    "HammingLibrary": "fqfa.util.distance",
+    "find_pairs_within_distance": "fqfa.util.distance",
+    "encode_kmer": "fqfa.util.kmer",
+    "decode_kmer": "fqfa.util.kmer",
+    "kmer_codes": "fqfa.util.kmer",
+    "KmerCounter": "fqfa.util.kmer",
+    "parallel_map": "fqfa.util.parallel",
+    "parallel_map_fasta_records": "fqfa.util.parallel",
+}
+"""Dict[str, str]: names exported by the package that are imported from their module
+the first time they are used, because the modules import asyncio, multiprocessing,
+or NumPy, which would slow down importing fqfa.
+
+"""
+
 __all__ = [
     "__version__",
     "parse_fasta_records",
+    "parse_fasta_records_chunked",
+    "scan_fasta_records",
     "write_fasta_record",
+    "write_fasta_records",
+    "FastaIndex",
     "parse_fastq_reads",
     "parse_fastq_pe_reads",
+    "PackedSequence",
+    "read_twobit",
+    "write_twobit",
+    "aparse_fastq_reads",
+    "aparse_fasta_records",
+    "BgzfReader",
+    "BgzfWriter",
+    "hamming_distance",
+    "levenshtein_distance",
+    "HammingLibrary",
+    "find_pairs_within_distance",
     "open_compressed",
     "has_fasta_ext",
     "has_fastq_ext",
     "infer_sequence_type",
     "infer_all_sequence_types",
+    "infer_file_sequence_type",
+    "SequenceTypeReport",
+    "encode_kmer",
+    "decode_kmer",
+    "kmer_codes",
+    "KmerCounter",
     "reverse_complement",
     "convert_dna_to_rna",
     "convert_rna_to_dna",
+    "reverse_complement_inplace",
+    "convert_dna_to_rna_inplace",
+    "convert_rna_to_dna_inplace",
+    "reverse_complement_batch",
+    "convert_dna_to_rna_batch",
+    "convert_rna_to_dna_batch",
+    "parallel_map",
+    "parallel_map_fasta_records",
+    "Orf",
+    "find_orfs",
+    "find_orfs_in_records",
     "translate_dna",
+    "translate_six_frames",
     "ncbi_genetic_code_to_dict",
+    "ncbi_genetic_code_to_table",
+    "ncbi_translation_table",
+    "TranslationTable",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module 'fqfa' has no attribute '{name}'")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_MODULES))
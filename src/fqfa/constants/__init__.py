@@ -1,16 +1,19 @@
 from fqfa.constants.iupac.dna import (
     DNA_BASES,
     DNA_AMBIGUITY,
+    DNA_AMBIGUITY_BASES,
     DNA_CHARACTERS,
     DNA_COMPLEMENTS,
 )
 from fqfa.constants.iupac.rna import RNA_BASES
 from fqfa.constants.iupac.protein import AA_CODES, AA_CODES_AMBIGUITY, AA_CODES_ALL
 from fqfa.constants.translation.table import CODON_TABLE
+from fqfa.constants.translation.ncbi import NCBI_GENETIC_CODES
 
 __all__ = [
     "DNA_BASES",
     "DNA_AMBIGUITY",
+    "DNA_AMBIGUITY_BASES",
     "DNA_CHARACTERS",
     "DNA_COMPLEMENTS",
     "RNA_BASES",
@@ -18,4 +21,5 @@ __all__ = [
     "AA_CODES_AMBIGUITY",
     "AA_CODES_ALL",
     "CODON_TABLE",
+    "NCBI_GENETIC_CODES",
 ]
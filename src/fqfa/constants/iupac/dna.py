@@ -4,7 +4,7 @@
 
 from typing import List, Dict
 
-__all__ = ["DNA_BASES", "DNA_AMBIGUITY", "DNA_CHARACTERS", "DNA_COMPLEMENTS"]
+__all__ = ["DNA_BASES", "DNA_AMBIGUITY", "DNA_AMBIGUITY_BASES", "DNA_CHARACTERS", "DNA_COMPLEMENTS"]
 
 DNA_BASES: List[str] = [
     "A",  # Adenine
@@ -58,6 +58,23 @@ DNA_AMBIGUITY: List[str] = [
 
 """
 
+DNA_AMBIGUITY_BASES: Dict[str, str] = {
+    "W": "AT",
+    "S": "CG",
+    "M": "AC",
+    "K": "GT",
+    "R": "AG",
+    "Y": "CT",
+    "B": "CGT",
+    "D": "AGT",
+    "H": "ACT",
+    "V": "ACG",
+    "N": "ACGT",
+}
+"""Dict[str, str]: Map from IUPAC ambiguity characters to the DNA bases they represent.
+
+"""
+
 DNA_CHARACTERS: List[str] = DNA_BASES + DNA_AMBIGUITY
 """List[str]: Bases and IUPAC ambiguity characters for DNA sequence.
 
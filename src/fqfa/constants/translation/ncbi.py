@@ -0,0 +1,187 @@
+"""Constants defining the NCBI genetic codes.
+
+"""
+
+from typing import Dict, NamedTuple
+
+__all__ = ["NcbiGeneticCode", "NCBI_BASE1", "NCBI_BASE2", "NCBI_BASE3", "NCBI_GENETIC_CODES"]
+
+
+class NcbiGeneticCode(NamedTuple):
+    """Rows of an NCBI `transl_table` that differ between genetic codes.
+
+    Each character corresponds to the codon formed by the characters at the same
+    position in :py:data:`NCBI_BASE1`, :py:data:`NCBI_BASE2`, and
+    :py:data:`NCBI_BASE3`.
+
+    Attributes
+    ----------
+    name : str
+        Name of the genetic code.
+    aas : str
+        The `AAs` row, containing the single-letter amino acid code for each codon.
+    starts : str
+        The `Starts` row, containing `M` for each start codon.
+
+    """
+
+    name: str
+    aas: str
+    starts: str
+
+
+NCBI_BASE1 = "TTTTTTTTTTTTTTTTCCCCCCCCCCCCCCCCAAAAAAAAAAAAAAAAGGGGGGGGGGGGGGGG"
+"""str: The `Base1` row shared by all NCBI genetic codes.
+
+"""
+
+NCBI_BASE2 = "TTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGG"
+"""str: The `Base2` row shared by all NCBI genetic codes.
+
+"""
+
+NCBI_BASE3 = "TCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAG"
+"""str: The `Base3` row shared by all NCBI genetic codes.
+
+"""
+
+NCBI_GENETIC_CODES: Dict[int, NcbiGeneticCode] = {
+    1: NcbiGeneticCode(
+        "Standard",
+        "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------**--*----M---------------M----------------------------",
+    ),
+    2: NcbiGeneticCode(
+        "Vertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG",
+        "----------**--------------------MMMM----------**---M------------",
+    ),
+    3: NcbiGeneticCode(
+        "Yeast Mitochondrial",
+        "FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**----------------------MM---------------M------------",
+    ),
+    4: NcbiGeneticCode(
+        "Mold, Protozoan, and Coelenterate Mitochondrial and Mycoplasma/Spiroplasma",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--MM------**-------M------------MMMM---------------M------------",
+    ),
+    5: NcbiGeneticCode(
+        "Invertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG",
+        "---M------**--------------------MMMM---------------M------------",
+    ),
+    6: NcbiGeneticCode(
+        "Ciliate, Dasycladacean and Hexamita Nuclear",
+        "FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    9: NcbiGeneticCode(
+        "Echinoderm and Flatworm Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+        "----------**-----------------------M---------------M------------",
+    ),
+    10: NcbiGeneticCode(
+        "Euplotid Nuclear",
+        "FFLLSSSSYY**CCCWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**-----------------------M----------------------------",
+    ),
+    11: NcbiGeneticCode(
+        "Bacterial, Archaeal and Plant Plastid",
+        "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------**--*----M------------MMMM---------------M------------",
+    ),
+    12: NcbiGeneticCode(
+        "Alternative Yeast Nuclear",
+        "FFLLSSSSYY**CC*WLLLSPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**--*----M---------------M----------------------------",
+    ),
+    13: NcbiGeneticCode(
+        "Ascidian Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSGGVVVVAAAADDEEGGGG",
+        "---M------**----------------------MM---------------M------------",
+    ),
+    14: NcbiGeneticCode(
+        "Alternative Flatworm Mitochondrial",
+        "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+        "-----------*-----------------------M----------------------------",
+    ),
+    16: NcbiGeneticCode(
+        "Chlorophycean Mitochondrial",
+        "FFLLSSSSYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------*---*--------------------M----------------------------",
+    ),
+    21: NcbiGeneticCode(
+        "Trematode Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNNKSSSSVVVVAAAADDEEGGGG",
+        "----------**-----------------------M---------------M------------",
+    ),
+    22: NcbiGeneticCode(
+        "Scenedesmus obliquus Mitochondrial",
+        "FFLLSS*SYY*LCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "------*---*---*--------------------M----------------------------",
+    ),
+    23: NcbiGeneticCode(
+        "Thraustochytrium Mitochondrial",
+        "FF*LSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--*-------**--*-----------------M--M---------------M------------",
+    ),
+    24: NcbiGeneticCode(
+        "Rhabdopleuridae Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+        "---M------**-------M---------------M---------------M------------",
+    ),
+    25: NcbiGeneticCode(
+        "Candidate Division SR1 and Gracilibacteria",
+        "FFLLSSSSYY**CCGWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------**-----------------------M---------------M------------",
+    ),
+    26: NcbiGeneticCode(
+        "Pachysolen tannophilus Nuclear",
+        "FFLLSSSSYY**CC*WLLLAPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**--*----M---------------M----------------------------",
+    ),
+    27: NcbiGeneticCode(
+        "Karyorelict Nuclear",
+        "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    28: NcbiGeneticCode(
+        "Condylostoma Nuclear",
+        "FFLLSSSSYYQQCCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**--*--------------------M----------------------------",
+    ),
+    29: NcbiGeneticCode(
+        "Mesodinium Nuclear",
+        "FFLLSSSSYYYYCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    30: NcbiGeneticCode(
+        "Peritrich Nuclear",
+        "FFLLSSSSYYEECC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "--------------*--------------------M----------------------------",
+    ),
+    31: NcbiGeneticCode(
+        "Blastocrithidia Nuclear",
+        "FFLLSSSSYYEECCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "----------**-----------------------M----------------------------",
+    ),
+    32: NcbiGeneticCode(
+        "Balanophoraceae Plastid",
+        "FFLLSSSSYY*WCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        "---M------*---*----M------------MMMM---------------M------------",
+    ),
+    33: NcbiGeneticCode(
+        "Cephalodiscidae Mitochondrial",
+        "FFLLSSSSYYY*CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSSKVVVVAAAADDEEGGGG",
+        "---M-------*-------M---------------M---------------M------------",
+    ),
+}
+"""Dict[int, NcbiGeneticCode]: Map from NCBI `transl_table` numbers to the genetic codes.
+
+The table numbers are not contiguous, as codes 7, 8, 15, and 17 to 20 have been
+withdrawn or merged into other codes.
+Use :py:func:`~fqfa.util.translate.ncbi_translation_table` to obtain a ready-to-use
+translation table.
+
+"""
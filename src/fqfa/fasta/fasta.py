@@ -2,14 +2,59 @@
 
 """
 
-import textwrap
-import string
-from typing import TextIO, Generator, Tuple
+from itertools import chain
+from typing import TextIO, BinaryIO, IO, Any, AnyStr, Generator, Tuple, Iterator, Iterable, List, Optional, NamedTuple
 
-__all__ = ["parse_fasta_records", "write_fasta_record"]
+__all__ = [
+    "FastaRecordSummary",
+    "parse_fasta_records",
+    "parse_fasta_records_chunked",
+    "scan_fasta_records",
+    "write_fasta_record",
+    "write_fasta_records",
+]
 
+_WRITE_BUFFER_SIZE = 1 << 20
+"""int: approximate number of characters to accumulate before writing to the file handle.
 
-def parse_fasta_records(handle: TextIO) -> Generator[Tuple[str, str], None, None]:
+"""
+
+_NON_GC_BYTES = bytes(c for c in range(256) if c not in b"GCgc")
+"""bytes: all byte values other than G and C, used to delete non-GC bases.
+
+"""
+
+_NON_N_BYTES = bytes(c for c in range(256) if c not in b"Nn")
+"""bytes: all byte values other than N, used to delete non-N bases.
+
+"""
+
+
+class FastaRecordSummary(NamedTuple):
+    """Summary of a single FASTA record produced by
+    :py:func:`~fqfa.fasta.fasta.scan_fasta_records`.
+
+    Attributes
+    ----------
+    header : str
+        The header line with leading '>' removed.
+    length : int
+        Number of characters in the sequence.
+    gc_count : Optional[int]
+        Number of G and C bases (either case), or None if base counts were not
+        requested.
+    n_count : Optional[int]
+        Number of N bases (either case), or None if base counts were not requested.
+
+    """
+
+    header: str
+    length: int
+    gc_count: Optional[int] = None
+    n_count: Optional[int] = None
+
+
+def parse_fasta_records(handle: IO[AnyStr]) -> Generator[Tuple[AnyStr, AnyStr], None, None]:
     """Generator function that returns tuples of FASTA headers and their associated
     sequences.
 
@@ -18,23 +63,33 @@ def parse_fasta_records(handle: TextIO) -> Generator[Tuple[str, str], None, None
     concatenated together.
     No validation of the characters in the FASTA record is performed.
 
+    If the handle is opened in binary mode, the headers and sequences are bytes and the
+    data is never decoded.
+
     Parameters
     ----------
-    handle : TextIO
-        Open text file handle to parse.
+    handle : IO[AnyStr]
+        Open text or binary file handle to parse.
 
     Yields
     -------
-    Tuple[str, str]
+    Tuple[AnyStr, AnyStr]
         Tuple containing the header line (with leading '>' removed) and the sequence.
 
     """
+    lines = iter(handle)
+    first = next(lines, None)
+    if first is None:  # empty file
+        return
+    marker = b">" if isinstance(first, bytes) else ">"
+    empty = first[:0]
+
     header = None
     seq_lines = None
-    for line in handle:
-        if line.startswith(">"):
+    for line in chain((first,), lines):
+        if line.startswith(marker):  # type: ignore[arg-type]
             if header is not None:  # not the first record
-                yield header, "".join(seq_lines)
+                yield header, empty.join(seq_lines)
             seq_lines = list()
             header = line[1:].rstrip()
         else:
@@ -42,32 +97,235 @@ def parse_fasta_records(handle: TextIO) -> Generator[Tuple[str, str], None, None
                 seq_lines.append(line.strip())
 
     if header is not None:
-        yield header, "".join(seq_lines)
+        yield header, empty.join(seq_lines)
     else:  # no FASTA records in file
         return
 
 
-def write_fasta_record(handle: TextIO, header: str, seq: str, width: int = 60) -> None:
-    """Writes a FASTA record to an open file handle.
+def scan_fasta_records(
+    handle: BinaryIO, base_counts: bool = False, encoding: str = "utf-8"
+) -> Generator[FastaRecordSummary, None, None]:
+    """Generator function that returns the header and sequence length of each FASTA
+    record without building the sequences.
 
-    Leading and trailing whitespace will be removed from the header and all whitespace
-    will be removed from the
-    sequence before generating output.
+    This is much faster than :py:func:`~fqfa.fasta.fasta.parse_fasta_records` when only
+    record names and lengths are needed, for example to create a manifest.
+    The file must be opened in binary mode, as all counting is performed on the raw
+    bytes.
+
+    Header and sequence line handling is the same as
+    :py:func:`~fqfa.fasta.fasta.parse_fasta_records`, so the length is the length of
+    the sequence that would be returned by that function.
+
+    Parameters
+    ----------
+    handle : BinaryIO
+        Open binary file handle to parse.
+    base_counts : bool
+        If True, also count the G/C and N bases in each record. Default False.
+    encoding : str
+        Text encoding used to decode the header lines. Default "utf-8".
+
+    Yields
+    -------
+    FastaRecordSummary
+        Summary of the record.
+
+    """
+    header = None
+    length = 0
+    gc_count = 0
+    n_count = 0
+    for line in handle:
+        if line.startswith(b">"):
+            if header is not None:  # not the first record
+                if base_counts:
+                    yield FastaRecordSummary(header, length, gc_count, n_count)
+                else:
+                    yield FastaRecordSummary(header, length)
+            header = line[1:].rstrip().decode(encoding)
+            length = 0
+            gc_count = 0
+            n_count = 0
+        elif header is not None:  # not the first record
+            line = line.strip()
+            length += len(line)
+            if base_counts:
+                gc_count += len(line.translate(None, _NON_GC_BYTES))
+                n_count += len(line.translate(None, _NON_N_BYTES))
+
+    if header is not None:
+        if base_counts:
+            yield FastaRecordSummary(header, length, gc_count, n_count)
+        else:
+            yield FastaRecordSummary(header, length)
+
+
+class _FastaChunkIterator:
+    """Iterator over fixed-size chunks of the sequence belonging to a single FASTA record.
+
+    Lines are consumed from the shared line iterator only as chunks are requested.
+    The header line of the next record (if any) is stored in ``next_header`` once it is
+    encountered.
+
+    Parameters
+    ----------
+    lines : Iterator[str]
+        Iterator over the lines of the file, positioned after the record's header line.
+    chunk_size : int
+        Number of bases in each chunk.
+    overlap : int
+        Number of bases shared between the end of a chunk and the start of the next.
+
+    """
+
+    def __init__(self, lines: Iterator[str], chunk_size: int, overlap: int) -> None:
+        self.next_header: Optional[str] = None
+        self._lines = lines
+        self._chunk_size = chunk_size
+        self._overlap = overlap
+        self._buffer = ""
+        self._offset = 0
+        self._pieces: List[str] = list()
+        self._emitted = False
+        self._exhausted = False
+
+    def __iter__(self) -> "_FastaChunkIterator":
+        return self
+
+    def __next__(self) -> str:
+        # chunks are sliced from the buffer starting at the offset, so a long line is
+        # only copied again once less than a chunk of it is left
+        available = len(self._buffer) - self._offset
+        while not self._exhausted and available < self._chunk_size:
+            line = next(self._lines, None)
+            if line is None:
+                self._exhausted = True
+            elif line.startswith(">"):
+                self.next_header = line
+                self._exhausted = True
+            else:
+                line = line.strip()
+                self._pieces.append(line)
+                available += len(line)
+
+        if len(self._pieces) > 0:
+            self._buffer = self._buffer[self._offset :] + "".join(self._pieces)
+            self._offset = 0
+            self._pieces = list()
+
+        if available >= self._chunk_size:
+            chunk = self._buffer[self._offset : self._offset + self._chunk_size]
+            self._offset += self._chunk_size - self._overlap
+        elif available > 0 and (not self._emitted or available > self._overlap):
+            chunk = self._buffer[self._offset :]
+            self._buffer = ""
+            self._offset = 0
+        else:
+            self._buffer = ""
+            self._offset = 0
+            raise StopIteration
+
+        self._emitted = True
+        return chunk
+
+    def skip(self) -> None:
+        """Discard the rest of the record's sequence without building any chunks.
+
+        Returns
+        -------
+        None
+
+        """
+        while not self._exhausted:
+            line = next(self._lines, None)
+            if line is None:
+                self._exhausted = True
+            elif line.startswith(">"):
+                self.next_header = line
+                self._exhausted = True
+        self._buffer = ""
+        self._offset = 0
+        self._pieces = list()
+
+
+def parse_fasta_records_chunked(
+    handle: TextIO, chunk_size: int = 1000000, overlap: int = 0
+) -> Generator[Tuple[str, Iterator[str]], None, None]:
+    """Generator function that returns tuples of FASTA headers and iterators over
+    fixed-size chunks of their associated sequences.
+
+    This is intended for very long records (such as chromosomes) where building the
+    full sequence string is undesirable.
+    Memory use depends on the chunk size rather than the length of the record.
+
+    Each chunk contains ``chunk_size`` bases except for the last chunk of a record,
+    which may be shorter.
+    If ``overlap`` is greater than 0, each chunk after the first begins with the last
+    ``overlap`` bases of the previous chunk.
+    Setting ``overlap`` to ``k - 1`` ensures that every k-mer in the sequence is
+    contained in exactly one chunk.
+
+    The chunk iterator reads from the same file handle as this generator, so it is only
+    valid until the next record is requested.
+    Any chunks that were not consumed are skipped.
+
+    Header and sequence line handling is the same as
+    :py:func:`~fqfa.fasta.fasta.parse_fasta_records`.
 
     Parameters
     ----------
     handle : TextIO
-        Open text file handle to write to.
-    header : str
+        Open text file handle to parse.
+    chunk_size : int
+        Number of bases in each chunk. Default 1000000.
+    overlap : int
+        Number of bases shared by consecutive chunks. Default 0.
+
+    Yields
+    -------
+    Tuple[str, Iterator[str]]
+        Tuple containing the header line (with leading '>' removed) and an iterator over
+        the sequence chunks.
+
+    Raises
+    ------
+    ValueError
+        If the chunk size is less than 1.
+    ValueError
+        If the overlap is negative or not less than the chunk size.
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk size must be at least 1")
+    if overlap < 0 or overlap >= chunk_size:
+        raise ValueError("overlap must be non-negative and less than the chunk size")
+
+    lines = iter(handle)
+    header = next((line for line in lines if line.startswith(">")), None)
+    while header is not None:
+        chunks = _FastaChunkIterator(lines, chunk_size, overlap)
+        yield header[1:].rstrip(), chunks
+        chunks.skip()
+        header = chunks.next_header
+
+
+def _format_fasta_record(header: AnyStr, seq: AnyStr, width: int) -> AnyStr:
+    """Format a FASTA record as a string or byte string, hard-wrapping the sequence.
+
+    Parameters
+    ----------
+    header : AnyStr
         Header string for the FASTA record, without the leading '>'
-    seq : str
+    seq : AnyStr
         Sequence for the FASTA record.
     width : int
-        Width to use when hard-wrapping the sequence. Default 60.
+        Width to use when hard-wrapping the sequence.
 
     Returns
     -------
-    None
+    AnyStr
+        The formatted FASTA record, including the trailing newline.
 
     Raises
     ------
@@ -75,14 +333,156 @@ def write_fasta_record(handle: TextIO, header: str, seq: str, width: int = 60) -
         If the header is empty.
     ValueError
         If the sequence is empty.
+    ValueError
+        If the width is less than 1.
+    TypeError
+        If only one of the header and sequence is bytes.
 
     """
+    if isinstance(header, bytes) != isinstance(seq, bytes):
+        raise TypeError("FASTA header and sequence must both be strings or both be bytes")
+
     header = header.strip()
-    seq = seq.translate(str.maketrans("", "", string.whitespace))
+    seq = seq[:0].join(seq.split())
 
     if len(header) == 0:
         raise ValueError("empty FASTA header")
     if len(seq) == 0:
         raise ValueError("empty FASTA sequence")
+    if width < 1:
+        raise ValueError("width must be at least 1")
+
+    if isinstance(seq, bytes):
+        lines = b"\n".join([seq[i : i + width] for i in range(0, len(seq), width)])
+        return b">" + header + b"\n" + lines + b"\n"
+    elif len(seq) <= width:
+        return f">{header}\n{seq}\n"
+    else:
+        lines = "\n".join([seq[i : i + width] for i in range(0, len(seq), width)])
+        return f">{header}\n{lines}\n"
+
+
+def write_fasta_record(handle: IO[AnyStr], header: AnyStr, seq: AnyStr, width: int = 60) -> None:
+    """Writes a FASTA record to an open file handle.
+
+    Leading and trailing whitespace will be removed from the header and all whitespace
+    will be removed from the
+    sequence before generating output.
+
+    The header and sequence can also be bytes, in which case the handle must be opened
+    in binary mode.
+
+    Parameters
+    ----------
+    handle : IO[AnyStr]
+        Open text or binary file handle to write to.
+    header : AnyStr
+        Header string for the FASTA record, without the leading '>'
+    seq : AnyStr
+        Sequence for the FASTA record.
+    width : int
+        Width to use when hard-wrapping the sequence. Default 60.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the header is empty.
+    ValueError
+        If the sequence is empty.
+    ValueError
+        If the width is less than 1.
+    TypeError
+        If only one of the header and sequence is bytes.
+
+    """
+    handle.write(_format_fasta_record(header, seq, width))
+
+
+def write_fasta_records(
+    handle: IO[Any], records: Iterable[Tuple[AnyStr, AnyStr]], width: int = 60, buffer_size: int = _WRITE_BUFFER_SIZE
+) -> int:
+    """Writes many FASTA records to an open file handle.
+
+    Records are formatted in the same way as
+    :py:func:`~fqfa.fasta.fasta.write_fasta_record`, but output is accumulated and
+    written in large blocks rather than once per record.
+    This is substantially faster when writing many short records.
+
+    The handle may be opened in text or binary mode (including compressed file handles
+    opened in binary mode).
+    If the handle does not accept text, the output is encoded as UTF-8.
+    Records can also be bytes (such as the output of
+    :py:func:`~fqfa.fasta.fasta.parse_fasta_records` for a file opened in binary mode),
+    in which case the handle must be opened in binary mode and the output is written
+    without any encoding.
+
+    Parameters
+    ----------
+    handle : IO[Any]
+        Open text or binary file handle to write to.
+    records : Iterable[Tuple[AnyStr, AnyStr]]
+        Iterable of header and sequence tuples, such as the output of
+        :py:func:`~fqfa.fasta.fasta.parse_fasta_records`.
+    width : int
+        Width to use when hard-wrapping the sequence. Default 60.
+    buffer_size : int
+        Approximate number of characters to accumulate before each write.
+
+    Returns
+    -------
+    int
+        The number of records written.
+
+    Raises
+    ------
+    ValueError
+        If any header is empty.
+    ValueError
+        If any sequence is empty.
+    ValueError
+        If the width is less than 1.
+    TypeError
+        If string and bytes records are mixed.
+
+    """
+    binary: Optional[bool] = None
+    count = 0
+    pieces: List[Any] = list()
+    size = 0
+
+    def flush() -> None:
+        nonlocal binary
+        data = pieces[0][:0].join(pieces)
+        if isinstance(data, bytes):
+            handle.write(data)
+        elif binary is None:
+            try:
+                handle.write(data)
+            except TypeError:
+                binary = True
+                handle.write(data.encode("utf-8"))
+            else:
+                binary = False
+        elif binary:
+            handle.write(data.encode("utf-8"))
+        else:
+            handle.write(data)
+        pieces.clear()
+
+    for header, seq in records:
+        record = _format_fasta_record(header, seq, width)
+        pieces.append(record)
+        size += len(record)
+        count += 1
+        if size >= buffer_size:
+            flush()
+            size = 0
+
+    if len(pieces) > 0:
+        flush()
 
-    print(f">{header}\n{textwrap.fill(seq, width=width)}", file=handle)
+    return count
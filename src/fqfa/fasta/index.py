@@ -0,0 +1,165 @@
+"""Dictionary-style random access to the records in a FASTA file.
+
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Tuple, Iterator, BinaryIO, Any, Mapping
+
+__all__ = ["FastaIndex"]
+
+
+class FastaIndex(Mapping[str, str]):
+    """Read-only mapping from FASTA headers to sequences that loads sequences on demand.
+
+    The file is scanned once when the object is created to find the byte offsets of
+    each record.
+    Sequences are read from the file when they are requested and the most recently
+    used sequences are kept in a bounded cache.
+
+    Headers are processed in the same way as
+    :py:func:`~fqfa.fasta.fasta.parse_fasta_records` (leading '>' and trailing
+    whitespace removed) and sequence lines are stripped and concatenated.
+    Lines before the start of the first record are ignored.
+
+    The file must not be compressed, because sequences are read by seeking to their
+    offsets.
+    Instances keep the file open until :py:meth:`close` is called, and can be used as a
+    context manager.
+    Instances are not safe to share between threads.
+
+    Parameters
+    ----------
+    path : str
+        Path to the FASTA file.
+    cache_size : int
+        Maximum number of sequences to keep in the cache. Default 16. Use 0 to disable
+        caching.
+    encoding : str
+        Text encoding of the file. Default "utf-8".
+
+    Raises
+    ------
+    FileNotFoundError
+        If path does not correspond to a file.
+    ValueError
+        If the cache size is negative.
+    ValueError
+        If the file contains duplicate headers.
+
+    """
+
+    def __init__(self, path: str, cache_size: int = 16, encoding: str = "utf-8") -> None:
+        if not os.path.isfile(path):
+            raise FileNotFoundError("could not find file to open")
+        if cache_size < 0:
+            raise ValueError("cache size must be non-negative")
+
+        self._cache_size = cache_size
+        self._encoding = encoding
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._handle: BinaryIO = open(path, mode="rb")
+        try:
+            self._offsets = self._scan()
+        except Exception:
+            self._handle.close()
+            raise
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        """Find the start and end byte offsets of each record's sequence lines.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, int]]
+            Dictionary mapping headers to the offsets of the first byte after the header
+            line and the first byte after the last sequence line.
+
+        Raises
+        ------
+        ValueError
+            If the file contains duplicate headers.
+
+        """
+        offsets: Dict[str, Tuple[int, int]] = dict()
+        header = None
+        start = 0
+        position = 0
+        for line in self._handle:
+            if line.startswith(b">"):
+                if header is not None:
+                    offsets[header] = (start, position)
+                header = line[1:].rstrip().decode(self._encoding)
+                if header in offsets:
+                    raise ValueError(f"duplicate FASTA header '{header}'")
+                start = position + len(line)
+            position += len(line)
+
+        if header is not None:
+            offsets[header] = (start, position)
+
+        return offsets
+
+    def __getitem__(self, header: str) -> str:
+        """Return the sequence for the record with the given header.
+
+        Parameters
+        ----------
+        header : str
+            Record header, without the leading '>'.
+
+        Returns
+        -------
+        str
+            The record's sequence.
+
+        Raises
+        ------
+        KeyError
+            If there is no record with the given header.
+
+        """
+        try:
+            seq = self._cache[header]
+        except KeyError:
+            pass
+        else:
+            self._cache.move_to_end(header)
+            return seq
+
+        start, end = self._offsets[header]
+        self._handle.seek(start)
+        data = self._handle.read(end - start)
+        seq = b"".join([line.strip() for line in data.split(b"\n")]).decode(self._encoding)
+
+        if self._cache_size > 0:
+            self._cache[header] = seq
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return seq
+
+    def __contains__(self, header: object) -> bool:
+        return header in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __enter__(self) -> "FastaIndex":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file handle and clear the cache.
+
+        Returns
+        -------
+        None
+
+        """
+        self._handle.close()
+        self._cache.clear()
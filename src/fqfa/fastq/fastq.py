@@ -2,20 +2,30 @@
 
 """
 
-from typing import TextIO, Generator, Tuple
-from itertools import zip_longest
+from typing import IO, Any, Generator, Tuple, List, Optional
+from itertools import zip_longest, islice
 from fqfa.fastq.fastqread import FastqRead
+from fqfa.util.nucleotide import reverse_complement_batch
 
 __all__ = ["parse_fastq_reads", "parse_fastq_pe_reads"]
 
+_REVCOMP_BATCH_SIZE = 1000
+"""int: number of read pairs reverse-complemented together by parse_fastq_pe_reads.
 
-def parse_fastq_reads(handle: TextIO) -> Generator[FastqRead, None, None]:
+"""
+
+
+def parse_fastq_reads(handle: IO[Any]) -> Generator[FastqRead, None, None]:
     """Generator function that returns FASTQ reads as objects.
 
+    If the handle is opened in binary mode, the reads' text fields are bytes and the data
+    is never decoded.
+    This is faster than reading in text mode, particularly for compressed files.
+
     Parameters
     ----------
-    handle : TextIO
-        Open text file handle to parse.
+    handle : IO[Any]
+        Open text or binary file handle to parse.
 
     Yields
     -------
@@ -42,20 +52,25 @@ def parse_fastq_reads(handle: TextIO) -> Generator[FastqRead, None, None]:
 
 
 def parse_fastq_pe_reads(
-    handle_fwd: TextIO, handle_rev: TextIO, revcomp: bool = False
+    handle_fwd: IO[Any], handle_rev: IO[Any], revcomp: bool = False
 ) -> Generator[Tuple[FastqRead, FastqRead], None, None]:
     """Generator function that returns FASTQ read pairs as a tuple of objects.
 
+    Both handles should be opened in the same mode (text or binary), as described for
+    :py:func:`~fqfa.fastq.fastq.parse_fastq_reads`.
+
     Parameters
     ----------
-    handle_fwd : TextIO
-        Open text file handle to parse for forward reads.
+    handle_fwd : IO[Any]
+        Open text or binary file handle to parse for forward reads.
 
-    handle_rev : TextIO
-        Open text file handle to parse for reverse reads.
+    handle_rev : IO[Any]
+        Open text or binary file handle to parse for reverse reads.
 
     revcomp : bool
         Whether to reverse-complement the reverse reads. Default False.
+        Reverse reads are reverse-complemented in batches of 1000 pairs, so each batch
+        is read from the files before its first pair is returned.
 
     Returns
     -------
@@ -74,6 +89,59 @@ def parse_fastq_pe_reads(
         This usually contains the machine ID and read coordinates, and is therefore
         expected to match for PE data.
 
+    """
+    pairs = _paired_reads(handle_fwd, handle_rev)
+    if not revcomp:
+        yield from pairs
+        return
+
+    # reverse-complement in batches, yielding any pairs read before an error is raised
+    while True:
+        batch: List[Tuple[FastqRead, FastqRead]] = list()
+        error: Optional[Exception] = None
+        try:
+            batch.extend(islice(pairs, _REVCOMP_BATCH_SIZE))
+        except Exception as e:
+            error = e
+
+        sequences = reverse_complement_batch([rev.sequence for _, rev in batch])
+        for (_, rev), sequence in zip(batch, sequences):
+            rev.sequence = sequence
+            rev.quality.reverse()
+        yield from batch
+
+        if error is not None:
+            raise error
+        if len(batch) < _REVCOMP_BATCH_SIZE:
+            return
+
+
+def _paired_reads(handle_fwd: IO[Any], handle_rev: IO[Any]) -> Generator[Tuple[FastqRead, FastqRead], None, None]:
+    """Generator function that returns matched FASTQ read pairs.
+
+    Parameters
+    ----------
+    handle_fwd : IO[Any]
+        Open text or binary file handle to parse for forward reads.
+
+    handle_rev : IO[Any]
+        Open text or binary file handle to parse for reverse reads.
+
+    Yields
+    -------
+    Tuple[FastqRead, FastqRead]
+        Tuple of forward and reverse FastqRead objects.
+
+    Raises
+    ------
+    ValueError
+        If a record is incomplete.
+    ValueError
+        If the two file handles have a different number of reads.
+    ValueError
+        If the read header portion before the first whitespace doesn't match between
+        read pairs.
+
     """
     fwd_generator = parse_fastq_reads(handle_fwd)
     rev_generator = parse_fastq_reads(handle_rev)
@@ -84,6 +152,4 @@ def parse_fastq_pe_reads(
         elif fwd.header.split()[0] != rev.header.split()[0]:  # type: ignore[union-attr]
             raise ValueError("forward and reverse read headers do not match")
         else:
-            if revcomp:
-                rev.reverse_complement()  # type: ignore[union-attr]
             yield fwd, rev  # type: ignore[misc]
@@ -2,14 +2,46 @@
 
 """
 
+from functools import lru_cache
 from dataclasses import dataclass, field, InitVar
-from typing import List, Optional, ClassVar, Callable, Match
+from typing import List, Optional, Callable, Union, Tuple
 from fqfa.util.nucleotide import reverse_complement
-from fqfa.validator.create import create_validator
+from fqfa.validator.create import create_lookup_validator
 from fqfa.constants.iupac.dna import DNA_BASES
 
 __all__ = ["FastqRead"]
 
+_SEQUENCE_VALIDATOR: Callable[[Union[str, bytes]], Optional[int]] = create_lookup_validator(
+    DNA_BASES + ["N"], report_position=True
+)
+"""Callable[[Union[str, bytes]], Optional[int]]: validator that returns the position of
+the first character in a read sequence other than A, C, G, T, or N.
+
+"""
+
+
+@lru_cache(maxsize=None)
+def _quality_tables(quality_encoding_value: int) -> Tuple[bytes, bytes]:
+    """Create the translation tables used to check and convert ASCII-encoded quality
+    values.
+
+    Parameters
+    ----------
+    quality_encoding_value : int
+        The ASCII value of base quality 0.
+
+    Returns
+    -------
+    Tuple[bytes, bytes]
+        Translation table that converts ASCII-encoded quality values to integer quality
+        values, and the ASCII values of the valid quality values (0-93) for use as the
+        ``delete`` argument of :py:meth:`bytes.translate`.
+
+    """
+    table = bytes((i - quality_encoding_value) % 256 for i in range(256))
+    valid = bytes(i for i in range(256) if 0 <= i - quality_encoding_value <= 93)
+    return table, valid
+
 
 @dataclass
 class FastqRead:
@@ -17,26 +49,31 @@ class FastqRead:
 
     Most methods modify the read in-place rather than returning a modified copy.
 
+    The text fields can either all be strings or all be bytes.
+    Reads created from bytes (for example by
+    :py:func:`~fqfa.fastq.fastq.parse_fastq_reads` with a file opened in binary mode)
+    keep their header and sequence as bytes, which avoids decoding the data.
+
     Parameters
     ----------
-    header : str
+    header : Union[str, bytes]
         The first header line in the FASTQ read, beginning with '@'.
-    sequence : str
+    sequence : Union[str, bytes]
         The nucleotide sequence of the FASTQ read, consisting of only bases "ACGTN".
-    header2 : str
+    header2 : Union[str, bytes]
         The second header line in the FASTQ read, beginning with '+'.
-    quality_string : str
+    quality_string : Union[str, bytes]
         The base quality values, ASCII encoded.
     quality_encoding_value : int
         The ASCII value of base quality 0. Default is 33.
 
     Attributes
     ----------
-    header : str
+    header : Union[str, bytes]
         The first header line in the FASTQ read, beginning with '@'.
-    sequence : str
+    sequence : Union[str, bytes]
         The nucleotide sequence of the FASTQ read, consisting of only bases "ACGTN".
-    header2 : str
+    header2 : Union[str, bytes]
         The second header line in the FASTQ read, beginning with '+'.
     quality : List[int]
         The base quality values as a list of integers.
@@ -45,15 +82,14 @@ class FastqRead:
 
     """
 
-    header: str
-    sequence: str
-    header2: str
+    header: Union[str, bytes]
+    sequence: Union[str, bytes]
+    header2: Union[str, bytes]
     quality: List[int] = field(init=False)
-    quality_string: InitVar[str]
+    quality_string: InitVar[Union[str, bytes]]
     quality_encoding_value: int = 33
-    _sequence_validator: ClassVar[Callable[[str], Optional[Match[str]]]] = create_validator(DNA_BASES + ["N"])
 
-    def __post_init__(self, quality_string: str) -> None:
+    def __post_init__(self, quality_string: Union[str, bytes]) -> None:
         """Perform some basic checks on the input and converts the quality string into a
         list of integers.
 
@@ -63,7 +99,7 @@ class FastqRead:
 
         Parameters
         ----------
-        quality_string : str
+        quality_string : Union[str, bytes]
             ASCII-encoded quality values.
 
         Returns
@@ -82,28 +118,93 @@ class FastqRead:
             If the secondary header string doesn't start with '+'.
         ValueError
             If the quality values are outside the allowed range (0-93).
+        TypeError
+            If the fields are a mixture of strings and bytes.
 
         """
         if len(self.sequence) != len(quality_string):
             raise ValueError("unequal number of quality values and bases")
 
-        if not self.header.startswith("@"):
+        if isinstance(self.sequence, bytes):
+            quality_string_bytes = self._check_bytes_fields(quality_string)
+        else:
+            quality_string_bytes = self._check_str_fields(quality_string)
+
+        position = _SEQUENCE_VALIDATOR(self.sequence)
+        if position is not None:
+            raise ValueError(f"unexpected characters in sequence at position {position + 1}")
+        if len(self.sequence) == 0:
+            raise ValueError("unexpected characters in sequence")
+
+        table, valid = _quality_tables(self.quality_encoding_value)
+        invalid = quality_string_bytes.translate(None, valid)
+        if len(invalid) > 0:
+            if min(invalid) < self.quality_encoding_value:
+                raise ValueError("sequence quality value below 0")
+            else:
+                raise ValueError("sequence quality value above 93")
+
+        self.quality = list(quality_string_bytes.translate(table))
+
+    def _check_bytes_fields(self, quality_string: Union[str, bytes]) -> bytes:
+        """Check the header fields of a read whose sequence is bytes.
+
+        Parameters
+        ----------
+        quality_string : Union[str, bytes]
+            ASCII-encoded quality values.
+
+        Returns
+        -------
+        bytes
+            The quality string.
+
+        Raises
+        ------
+        TypeError
+            If any of the other fields are strings.
+        ValueError
+            If the header strings don't start with '@' and '+'.
+
+        """
+        if not (
+            isinstance(self.header, bytes) and isinstance(self.header2, bytes) and isinstance(quality_string, bytes)
+        ):
+            raise TypeError("FASTQ fields must be all strings or all bytes")
+        if not self.header.startswith(b"@"):
             raise ValueError("unexpected value for FASTQ header")
-        if not self.header2.startswith("+"):
+        if not self.header2.startswith(b"+"):
             raise ValueError("unexpected value for FASTQ header")
+        return quality_string
 
-        if not self._sequence_validator(self.sequence):  # type: ignore
-            # mypy false positive: https://github.com/python/mypy/issues/5485
-            raise ValueError("unexpected characters in sequence")
+    def _check_str_fields(self, quality_string: Union[str, bytes]) -> bytes:
+        """Check the header fields of a read whose sequence is a string.
 
-        quality_string_bytes = quality_string.encode("ascii")
-        qev = self.quality_encoding_value
-        self.quality = [qsb - qev for qsb in quality_string_bytes]
+        Parameters
+        ----------
+        quality_string : Union[str, bytes]
+            ASCII-encoded quality values.
+
+        Returns
+        -------
+        bytes
+            The quality string encoded as ASCII.
 
-        if min(self.quality) < 0:
-            raise ValueError("sequence quality value below 0")
-        if max(self.quality) > 93:
-            raise ValueError("sequence quality value above 93")
+        Raises
+        ------
+        TypeError
+            If any of the other fields are bytes.
+        ValueError
+            If the header strings don't start with '@' and '+'.
+
+        """
+        if not (isinstance(self.header, str) and isinstance(self.header2, str) and isinstance(quality_string, str)):
+            raise TypeError("FASTQ fields must be all strings or all bytes")
+        if not self.header.startswith("@"):
+            raise ValueError("unexpected value for FASTQ header")
+        if not self.header2.startswith("+"):
+            raise ValueError("unexpected value for FASTQ header")
+        return quality_string.encode("ascii")
 
     def __len__(self) -> int:
         """The object's length is defined as the length of the sequence.
@@ -125,8 +226,25 @@ class FastqRead:
             Reconstruction of the original FASTQ record.
 
         """
+        if isinstance(self.sequence, bytes):
+            return bytes(self).decode("ascii")
         quality_string = "".join([chr(q + self.quality_encoding_value) for q in self.quality])
-        return "\n".join((self.header, self.sequence, self.header2, quality_string))
+        return "\n".join((self.header, self.sequence, self.header2, quality_string))  # type: ignore[arg-type]
+
+    def __bytes__(self) -> bytes:
+        """Formats the object as a four-line FASTQ record encoded as ASCII.
+
+        Returns
+        -------
+        bytes
+            Reconstruction of the original FASTQ record.
+
+        """
+        if not isinstance(self.sequence, bytes):
+            return str(self).encode("ascii")
+        qev = self.quality_encoding_value
+        quality_string = bytes([q + qev for q in self.quality])
+        return b"\n".join((self.header, self.sequence, self.header2, quality_string))  # type: ignore[arg-type]
 
     def average_quality(self) -> float:
         """Calculates and returns the read's mean quality value.
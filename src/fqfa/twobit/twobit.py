@@ -0,0 +1,456 @@
+"""Packed 2-bit nucleotide sequences and functions for working with UCSC .2bit files.
+
+"""
+
+import re
+import struct
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Iterable, List, Tuple, Union, Pattern
+
+__all__ = ["PackedSequence", "read_twobit", "write_twobit"]
+
+_TWOBIT_SIGNATURE = 0x1A412743
+"""int: magic number at the start of a .2bit file.
+
+"""
+
+_ENCODE_TABLE = bytes(
+    {ord("T"): 0, ord("C"): 1, ord("A"): 2, ord("G"): 3, ord("t"): 0, ord("c"): 1, ord("a"): 2, ord("g"): 3}.get(c, 0)
+    for c in range(256)
+)
+"""bytes: translation table from bases to their 2-bit codes in the .2bit base order (TCAG).
+
+Characters other than ACGT are encoded as T, as they are recorded separately as N blocks.
+
+"""
+
+_DECODE_TABLE = bytes.maketrans(b"\x00\x01\x02\x03", b"TCAG")
+"""bytes: translation table from 2-bit codes to bases.
+
+"""
+
+_N_RUN = re.compile(rb"[^ACGTacgt]+")
+"""Pattern[bytes]: pattern matching runs of characters that are stored as N blocks.
+
+"""
+
+_MASK_RUN = re.compile(rb"[a-z]+")
+"""Pattern[bytes]: pattern matching runs of lowercase (soft-masked) characters.
+
+"""
+
+
+def _pack_codes(codes: bytes) -> bytes:
+    """Pack a byte string of 2-bit codes into four codes per byte.
+
+    The first code is stored in the most significant bits of each byte.
+    Rather than looping over bytes in Python, the codes for each position in the packed
+    bytes are combined as large integers, since the shifted codes never overlap between
+    bytes.
+
+    Parameters
+    ----------
+    codes : bytes
+        Byte string where each byte is a value between 0 and 3.
+
+    Returns
+    -------
+    bytes
+        The packed byte string, padded with zero codes to a multiple of four.
+
+    """
+    codes = codes + bytes(-len(codes) % 4)
+    size = len(codes) // 4
+    packed = 0
+    for i, shift in enumerate((6, 4, 2, 0)):
+        packed |= int.from_bytes(codes[i::4], "big") << shift
+    return packed.to_bytes(size, "big")
+
+
+def _unpack_codes(packed: bytes) -> bytes:
+    """Unpack a byte string packed by :py:func:`_pack_codes` into one code per byte.
+
+    Parameters
+    ----------
+    packed : bytes
+        The packed byte string.
+
+    Returns
+    -------
+    bytes
+        Byte string of 2-bit codes, four per packed byte.
+
+    """
+    size = len(packed)
+    value = int.from_bytes(packed, "big")
+    mask = int.from_bytes(b"\x03" * size, "big")
+    codes = bytearray(size * 4)
+    for i, shift in enumerate((6, 4, 2, 0)):
+        codes[i::4] = ((value >> shift) & mask).to_bytes(size, "big")
+    return bytes(codes)
+
+
+def _find_runs(pattern: Pattern[bytes], seq: bytes) -> Tuple[Tuple[int, int], ...]:
+    """Find the start and length of each run matching the pattern.
+
+    Parameters
+    ----------
+    pattern : Pattern[bytes]
+        Compiled pattern matching a run.
+    seq : bytes
+        Sequence to search.
+
+    Returns
+    -------
+    Tuple[Tuple[int, int], ...]
+        Tuple of (start, length) tuples.
+
+    """
+    return tuple((m.start(), m.end() - m.start()) for m in pattern.finditer(seq))
+
+
+@dataclass(frozen=True)
+class PackedSequence:
+    """Dataclass representing a nucleotide sequence packed into 2 bits per base.
+
+    The packed representation follows the UCSC .2bit format.
+    Bases are stored four per byte, and runs of N bases and runs of lowercase
+    (soft-masked) bases are stored separately as (start, length) blocks.
+    Any character other than ACGT (in either case) is stored as N.
+
+    Subsequences can be extracted without unpacking the whole sequence.
+
+    Parameters
+    ----------
+    packed : bytes
+        The packed bases.
+    length : int
+        The number of bases in the sequence.
+    n_blocks : Tuple[Tuple[int, int], ...]
+        Start positions (0-indexed) and lengths of runs of N bases.
+    mask_blocks : Tuple[Tuple[int, int], ...]
+        Start positions (0-indexed) and lengths of runs of soft-masked bases.
+
+    Raises
+    ------
+    ValueError
+        If the length of the packed bases does not match the sequence length.
+
+    """
+
+    packed: bytes
+    length: int
+    n_blocks: Tuple[Tuple[int, int], ...] = ()
+    mask_blocks: Tuple[Tuple[int, int], ...] = ()
+
+    def __post_init__(self) -> None:
+        if len(self.packed) != (self.length + 3) // 4:
+            raise ValueError("packed data does not match the sequence length")
+
+    @classmethod
+    def from_sequence(cls, seq: Union[str, bytes]) -> "PackedSequence":
+        """Create a packed sequence from a sequence string.
+
+        Parameters
+        ----------
+        seq : Union[str, bytes]
+            The sequence to pack.
+
+        Returns
+        -------
+        PackedSequence
+            The packed sequence.
+
+        """
+        if isinstance(seq, str):
+            seq = seq.encode("ascii")
+        return cls(
+            packed=_pack_codes(seq.translate(_ENCODE_TABLE)),
+            length=len(seq),
+            n_blocks=_find_runs(_N_RUN, seq),
+            mask_blocks=_find_runs(_MASK_RUN, seq),
+        )
+
+    def __len__(self) -> int:
+        """The object's length is defined as the length of the sequence.
+
+        Returns
+        -------
+        int
+            The number of bases in the sequence.
+
+        """
+        return self.length
+
+    def __str__(self) -> str:
+        """Unpacks the full sequence.
+
+        Returns
+        -------
+        str
+            The unpacked sequence.
+
+        """
+        return self.subsequence(0, self.length)
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        """Unpacks a single base or a contiguous range of bases.
+
+        Parameters
+        ----------
+        key : Union[int, slice]
+            Position or slice using standard Python indexing.
+
+        Returns
+        -------
+        str
+            The unpacked base or bases.
+
+        Raises
+        ------
+        IndexError
+            If an integer position is out of range.
+        ValueError
+            If the slice has a step other than 1.
+
+        """
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.length)
+            if step != 1:
+                raise ValueError("slice step must be 1")
+            return self.subsequence(start, max(start, stop))
+        else:
+            if key < 0:
+                key += self.length
+            if not 0 <= key < self.length:
+                raise IndexError("sequence index out of range")
+            return self.subsequence(key, key + 1)
+
+    def subsequence(self, start: int, end: int) -> str:
+        """Unpacks the bases between ``start`` (inclusive) and ``end`` (exclusive).
+
+        Bases are numbered starting at 0, as in Python slicing.
+        Only the packed bytes covering the requested range are unpacked.
+
+        Parameters
+        ----------
+        start : int
+            The first base to return (0-indexed).
+        end : int
+            The position after the last base to return (0-indexed).
+
+        Returns
+        -------
+        str
+            The unpacked bases.
+
+        Raises
+        ------
+        ValueError
+            If the range is not within the sequence.
+
+        """
+        if not 0 <= start <= end <= self.length:
+            raise ValueError("invalid subsequence coordinates")
+
+        first_byte = start // 4
+        offset = first_byte * 4
+        codes = _unpack_codes(self.packed[first_byte : (end + 3) // 4])
+        bases = bytearray(codes[start - offset : end - offset].translate(_DECODE_TABLE))
+
+        for block_start, block_end in self._overlapping_blocks(self.n_blocks, start, end):
+            bases[block_start - start : block_end - start] = b"N" * (block_end - block_start)
+        for block_start, block_end in self._overlapping_blocks(self.mask_blocks, start, end):
+            bases[block_start - start : block_end - start] = bases[block_start - start : block_end - start].lower()
+
+        return bases.decode("ascii")
+
+    @staticmethod
+    def _overlapping_blocks(blocks: Tuple[Tuple[int, int], ...], start: int, end: int) -> List[Tuple[int, int]]:
+        """Find the parts of sorted, non-overlapping blocks that fall within a range.
+
+        Parameters
+        ----------
+        blocks : Tuple[Tuple[int, int], ...]
+            Sorted (start, length) tuples.
+        start : int
+            Start of the range (inclusive).
+        end : int
+            End of the range (exclusive).
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            List of (start, end) tuples clipped to the range.
+
+        """
+        result = list()
+        i = max(bisect_right(blocks, (start, float("inf"))) - 1, 0)
+        while i < len(blocks) and blocks[i][0] < end:
+            block_start = max(blocks[i][0], start)
+            block_end = min(blocks[i][0] + blocks[i][1], end)
+            if block_start < block_end:
+                result.append((block_start, block_end))
+            i += 1
+        return result
+
+
+def read_twobit(handle: BinaryIO) -> Dict[str, PackedSequence]:
+    """Read all sequences from a UCSC .2bit file.
+
+    Sequences are kept in their packed form.
+    Files written on big- or little-endian machines and files using 64-bit offsets
+    (version 1) are supported.
+
+    Parameters
+    ----------
+    handle : BinaryIO
+        Open binary file handle to read.
+
+    Returns
+    -------
+    Dict[str, PackedSequence]
+        Dictionary mapping sequence names to packed sequences, in file order.
+
+    Raises
+    ------
+    ValueError
+        If the file does not begin with the .2bit signature.
+    ValueError
+        If the file version is not supported.
+    ValueError
+        If the file is truncated.
+
+    """
+    data = handle.read()
+    if len(data) < 16:
+        raise ValueError("truncated .2bit file")
+
+    if struct.unpack_from("<I", data)[0] == _TWOBIT_SIGNATURE:
+        byte_order = "<"
+    elif struct.unpack_from(">I", data)[0] == _TWOBIT_SIGNATURE:
+        byte_order = ">"
+    else:
+        raise ValueError("invalid .2bit file signature")
+
+    _, version, count, _ = struct.unpack_from(f"{byte_order}IIII", data)
+    if version == 0:
+        offset_format = f"{byte_order}I"
+    elif version == 1:
+        offset_format = f"{byte_order}Q"
+    else:
+        raise ValueError("unsupported .2bit file version")
+    offset_size = struct.calcsize(offset_format)
+
+    try:
+        index = list()
+        position = 16
+        for _ in range(count):
+            name_size = data[position]
+            name = data[position + 1 : position + 1 + name_size].decode("ascii")
+            position += 1 + name_size
+            index.append((name, struct.unpack_from(offset_format, data, position)[0]))
+            position += offset_size
+
+        sequences = dict()
+        for name, position in index:
+            length, n_count = struct.unpack_from(f"{byte_order}II", data, position)
+            position += 8
+            n_values = struct.unpack_from(f"{byte_order}{2 * n_count}I", data, position)
+            position += 8 * n_count
+            (mask_count,) = struct.unpack_from(f"{byte_order}I", data, position)
+            position += 4
+            mask_values = struct.unpack_from(f"{byte_order}{2 * mask_count}I", data, position)
+            position += 8 * mask_count + 4  # skip the reserved field
+            packed = data[position : position + (length + 3) // 4]
+            sequences[name] = PackedSequence(
+                packed=packed,
+                length=length,
+                n_blocks=tuple(zip(n_values[:n_count], n_values[n_count:])),
+                mask_blocks=tuple(zip(mask_values[:mask_count], mask_values[mask_count:])),
+            )
+    except (struct.error, IndexError, ValueError):
+        raise ValueError("truncated .2bit file")
+
+    return sequences
+
+
+def write_twobit(handle: BinaryIO, records: Iterable[Tuple[str, Union[str, PackedSequence]]]) -> None:
+    """Write sequences to a UCSC .2bit file.
+
+    The records can be packed sequences or sequence strings, so the output of
+    :py:func:`~fqfa.fasta.fasta.parse_fasta_records` can be written directly.
+    Any character other than ACGT (in either case) is stored as N, and lowercase
+    characters are stored as soft-masked.
+
+    Parameters
+    ----------
+    handle : BinaryIO
+        Open binary file handle to write to.
+    records : Iterable[Tuple[str, Union[str, PackedSequence]]]
+        Iterable of name and sequence tuples.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If a name is empty, longer than 255 bytes, or not ASCII.
+    ValueError
+        If a name is duplicated.
+    ValueError
+        If the file would be too large for 32-bit offsets.
+
+    """
+    packed_records: List[Tuple[bytes, PackedSequence]] = list()
+    names = set()
+    for name, seq in records:
+        try:
+            name_bytes = name.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError("sequence names must be ASCII")
+        if not 0 < len(name_bytes) < 256:
+            raise ValueError("sequence names must be between 1 and 255 characters")
+        if name_bytes in names:
+            raise ValueError(f"duplicate sequence name '{name}'")
+        names.add(name_bytes)
+        if not isinstance(seq, PackedSequence):
+            seq = PackedSequence.from_sequence(seq)
+        packed_records.append((name_bytes, seq))
+
+    chunks = [struct.pack("<IIII", _TWOBIT_SIGNATURE, 0, len(packed_records), 0)]
+    offset = 16 + sum(5 + len(name_bytes) for name_bytes, _ in packed_records)
+    record_chunks = list()
+    for name_bytes, seq in packed_records:
+        if offset > 0xFFFFFFFF:
+            raise ValueError("sequences are too large for a .2bit file")
+        chunks.append(struct.pack(f"<B{len(name_bytes)}sI", len(name_bytes), name_bytes, offset))
+        n_count = len(seq.n_blocks)
+        mask_count = len(seq.mask_blocks)
+        record = b"".join(
+            (
+                struct.pack(
+                    f"<II{2 * n_count}I",
+                    seq.length,
+                    n_count,
+                    *(start for start, _ in seq.n_blocks),
+                    *(size for _, size in seq.n_blocks),
+                ),
+                struct.pack(
+                    f"<I{2 * mask_count}II",
+                    mask_count,
+                    *(start for start, _ in seq.mask_blocks),
+                    *(size for _, size in seq.mask_blocks),
+                    0,
+                ),
+                seq.packed,
+            )
+        )
+        record_chunks.append(record)
+        offset += len(record)
+
+    for chunk in chunks + record_chunks:
+        handle.write(chunk)
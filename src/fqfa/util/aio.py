@@ -0,0 +1,302 @@
+"""Asynchronous generator functions for reading FASTA and FASTQ files from asyncio code.
+
+"""
+
+import os
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncGenerator, List, Tuple, Optional, IO, Any, Union
+from fqfa.fastq.fastqread import FastqRead
+from fqfa.util.file import open_compressed
+
+__all__ = ["aparse_fastq_reads", "aparse_fasta_records"]
+
+_CHUNK_SIZE = 1 << 18
+"""int: number of bytes or characters read from the file at once.
+
+"""
+
+
+class _WorkerFile:
+    """File that is opened, read, and closed by a dedicated worker thread.
+
+    All calls are made by the same thread in the order they were submitted, so the
+    file is closed only after any pending read has finished.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        File path to be opened with :py:func:`~fqfa.util.file.open_compressed`. The
+        file is opened by the first read.
+    mode : str
+        Either "r" for text mode or "rb" for binary mode.
+    encoding : Optional[str]
+        Text file encoding, used only in text mode.
+
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"], mode: str, encoding: Optional[str]) -> None:
+        self._path = path
+        self._mode = mode
+        self._encoding = encoding
+        self._handle: Optional[IO[Any]] = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def _read(self, size: int) -> Any:
+        if self._handle is None:
+            self._handle = open_compressed(self._path, encoding=self._encoding, mode=self._mode)
+        return self._handle.read(size)
+
+    def _close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+
+    def read(self, loop: asyncio.AbstractEventLoop, size: int) -> "asyncio.Future[Any]":
+        """Read from the file on the worker thread.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop.
+        size : int
+            Number of bytes or characters to read.
+
+        Returns
+        -------
+        asyncio.Future[Any]
+            Future containing the data read, which is empty at the end of the file.
+
+        """
+        return loop.run_in_executor(self._executor, self._read, size)
+
+    async def close(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the file on the worker thread after any pending read, then stop the
+        thread.
+
+        Parameters
+        ----------
+        loop : asyncio.AbstractEventLoop
+            The event loop.
+
+        Returns
+        -------
+        None
+
+        """
+        try:
+            await loop.run_in_executor(self._executor, self._close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+
+def _split_lines(data: Any, newline: Any) -> Tuple[Optional[List[Any]], Any]:
+    """Split the complete lines from the start of the data.
+
+    Parameters
+    ----------
+    data : Any
+        String or bytes read from the file, starting at the beginning of a line.
+    newline : Any
+        The newline character, as a string or bytes.
+
+    Returns
+    -------
+    Tuple[Optional[List[Any]], Any]
+        List of the complete lines with the trailing newlines removed, or None if there
+        are no complete lines, and the remaining incomplete line.
+
+    """
+    end = data.rfind(newline)
+    if end < 0:
+        return None, data
+    return data[:end].split(newline), data[end + 1 :]
+
+
+async def _read_line_batches(
+    path: Union[str, "os.PathLike[str]"], mode: str, encoding: Optional[str], chunk_size: int
+) -> AsyncGenerator[List[Any], None]:
+    """Asynchronous generator function that returns the lines of a file in batches.
+
+    The file is opened, read, and closed by a dedicated worker thread, so file access
+    and decompression never block the event loop.
+    At most one chunk is read ahead of the consumer.
+    All calls made by the worker thread are serialized, so the file is closed only after
+    any pending read has finished, even if the generator is closed or cancelled.
+    Closing the generator waits until the file has been closed.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        File path to be opened with :py:func:`~fqfa.util.file.open_compressed`.
+    mode : str
+        Either "r" for text mode or "rb" for binary mode.
+    encoding : Optional[str]
+        Text file encoding, used only in text mode.
+    chunk_size : int
+        Number of bytes or characters read from the file at once.
+
+    Yields
+    -------
+    List[Any]
+        List of complete lines, with the trailing newlines removed.
+
+    Raises
+    ------
+    ValueError
+        If the mode is not "r" or "rb".
+    ValueError
+        If the chunk size is less than 1.
+
+    """
+    if mode not in ("r", "rb"):
+        raise ValueError(f"invalid mode '{mode}'")
+    if chunk_size < 1:
+        raise ValueError("chunk size must be at least 1")
+
+    loop = asyncio.get_event_loop()
+    worker = _WorkerFile(path, mode, encoding)
+    pending = worker.read(loop, chunk_size)
+    try:
+        newline = b"\n" if mode == "rb" else "\n"
+        leftover = newline[:0]
+        while True:
+            chunk = await pending
+            if len(chunk) == 0:
+                break
+            pending = worker.read(loop, chunk_size)
+
+            lines, leftover = _split_lines(leftover + chunk, newline)
+            if lines is not None:
+                yield lines
+                await asyncio.sleep(0)  # let other tasks run between chunks
+
+        if len(leftover) > 0:
+            yield [leftover]
+    finally:
+        pending.cancel()
+        await worker.close(loop)
+
+
+async def aparse_fastq_reads(
+    path: Union[str, "os.PathLike[str]"], mode: str = "r", encoding: Optional[str] = None, chunk_size: int = _CHUNK_SIZE
+) -> AsyncGenerator[FastqRead, None]:
+    """Asynchronous generator function that returns FASTQ reads as objects.
+
+    This is the asyncio equivalent of :py:func:`~fqfa.fastq.fastq.parse_fastq_reads`
+    and is used with ``async for``.
+    The file is opened using :py:func:`~fqfa.util.file.open_compressed` and read in
+    large chunks by a worker thread, so reading and decompression do not block the
+    event loop.
+    Reads are parsed on the event loop, which is given the chance to run other tasks
+    after each chunk.
+
+    Only one chunk is read ahead of the reads being consumed, so a slow consumer
+    limits the rate at which the file is read.
+    The file is closed when the generator finishes, is closed with ``aclose``, or the
+    task iterating over it is cancelled.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        File path to be opened.
+    mode : str
+        Either "r" for text mode or "rb" for binary mode, as described for
+        :py:func:`~fqfa.fastq.fastq.parse_fastq_reads`. Default "r".
+    encoding : Optional[str]
+        Text file encoding, used only in text mode.
+    chunk_size : int
+        Number of bytes or characters read from the file at once. Default 262144.
+
+    Yields
+    -------
+    FastqRead
+        FastqRead object for the read.
+
+    Raises
+    ------
+    FileNotFoundError
+        If path does not correspond to a file.
+    ValueError
+        If the mode is not "r" or "rb".
+    ValueError
+        If the chunk size is less than 1.
+    ValueError
+        If a record is incomplete.
+
+    """
+    batches = _read_line_batches(path, mode, encoding, chunk_size)
+    try:
+        lines: List[Any] = list()
+        async for batch in batches:
+            lines.extend(batch)
+            complete = len(lines) - len(lines) % 4
+            for i in range(0, complete, 4):
+                yield FastqRead(*[x.rstrip() for x in lines[i : i + 4]])
+            del lines[:complete]
+
+        if len(lines) > 0:
+            raise ValueError("incomplete FASTQ record")
+    finally:
+        await batches.aclose()
+
+
+async def aparse_fasta_records(
+    path: Union[str, "os.PathLike[str]"], mode: str = "r", encoding: Optional[str] = None, chunk_size: int = _CHUNK_SIZE
+) -> AsyncGenerator[Tuple[Any, Any], None]:
+    """Asynchronous generator function that returns tuples of FASTA headers and their
+    associated sequences.
+
+    This is the asyncio equivalent of :py:func:`~fqfa.fasta.fasta.parse_fasta_records`
+    and is used with ``async for``.
+    File reading is performed as described for
+    :py:func:`~fqfa.util.aio.aparse_fastq_reads`.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        File path to be opened.
+    mode : str
+        Either "r" for text mode or "rb" for binary mode, as described for
+        :py:func:`~fqfa.fasta.fasta.parse_fasta_records`. Default "r".
+    encoding : Optional[str]
+        Text file encoding, used only in text mode.
+    chunk_size : int
+        Number of bytes or characters read from the file at once. Default 262144.
+
+    Yields
+    -------
+    Tuple[Any, Any]
+        Tuple containing the header line (with leading '>' removed) and the sequence, as
+        strings in text mode or bytes in binary mode.
+
+    Raises
+    ------
+    FileNotFoundError
+        If path does not correspond to a file.
+    ValueError
+        If the mode is not "r" or "rb".
+    ValueError
+        If the chunk size is less than 1.
+
+    """
+    marker = b">" if mode == "rb" else ">"
+    empty = marker[:0]
+    header = None
+    seq_lines: List[Any] = list()
+
+    batches = _read_line_batches(path, mode, encoding, chunk_size)
+    try:
+        async for batch in batches:
+            for line in batch:
+                if line.startswith(marker):
+                    if header is not None:  # not the first record
+                        yield header, empty.join(seq_lines)
+                    seq_lines = list()
+                    header = line[1:].rstrip()
+                elif header is not None:  # not the first record
+                    seq_lines.append(line.strip())
+
+        if header is not None:
+            yield header, empty.join(seq_lines)
+    finally:
+        await batches.aclose()
@@ -0,0 +1,561 @@
+"""Classes and functions for reading and writing BGZF (blocked gzip) files.
+
+BGZF files are gzip files made up of a series of independently-compressed blocks of up
+to 64 KiB.
+They can be read by any gzip decompressor, but because each block is independent the
+blocks can also be decompressed in parallel and positions within the file can be
+addressed using virtual offsets.
+A virtual offset combines the position of the start of a compressed block in the file
+(upper 48 bits) with a position within the decompressed block (lower 16 bits), as used
+by htslib.
+
+"""
+
+import io
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import IO, Any, Deque, List, Optional, Tuple, Union
+
+__all__ = [
+    "BgzfReader",
+    "BgzfWriter",
+    "bgzf_block_offsets",
+    "make_virtual_offset",
+    "split_virtual_offset",
+]
+
+_BGZF_HEADER = struct.Struct("<4BI2BH2BHH")
+"""Struct: layout of the fixed header of a BGZF block written by this module.
+
+"""
+
+_BGZF_MAX_BLOCK_DATA = 0xFF00
+"""int: maximum number of uncompressed bytes stored in a block, leaving space for
+incompressible data to fit within the 64 KiB block size limit.
+
+"""
+
+_BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+"""bytes: empty block used to mark the end of a BGZF file.
+
+"""
+
+
+def make_virtual_offset(block_start: int, within_block: int) -> int:
+    """Combine a block start position and an offset within the block into a virtual
+    offset.
+
+    Parameters
+    ----------
+    block_start : int
+        Position of the start of the compressed block in the file.
+    within_block : int
+        Position within the decompressed block.
+
+    Returns
+    -------
+    int
+        The virtual offset.
+
+    Raises
+    ------
+    ValueError
+        If either value is out of range.
+
+    """
+    if not 0 <= within_block < 0x10000:
+        raise ValueError("offset within block must be between 0 and 65535")
+    if not 0 <= block_start < 0x1000000000000:
+        raise ValueError("block start must be between 0 and 2^48 - 1")
+    return (block_start << 16) | within_block
+
+
+def split_virtual_offset(virtual_offset: int) -> Tuple[int, int]:
+    """Split a virtual offset into the block start position and the offset within the
+    block.
+
+    Parameters
+    ----------
+    virtual_offset : int
+        The virtual offset.
+
+    Returns
+    -------
+    Tuple[int, int]
+        Position of the start of the compressed block in the file and the position
+        within the decompressed block.
+
+    """
+    return virtual_offset >> 16, virtual_offset & 0xFFFF
+
+
+def _read_block(handle: IO[bytes]) -> Optional[Tuple[bytes, int, int, int]]:
+    """Read the next compressed block from a BGZF file without decompressing it.
+
+    Parameters
+    ----------
+    handle : IO[bytes]
+        Open binary file handle positioned at the start of a block.
+
+    Returns
+    -------
+    Optional[Tuple[bytes, int, int, int]]
+        Tuple containing the compressed data, the CRC32 and size of the uncompressed
+        data, and the total size of the block in bytes. None at the end of the file.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a valid BGZF block.
+
+    """
+    header = handle.read(12)
+    if len(header) == 0:
+        return None
+    if len(header) < 12 or header[:4] != b"\x1f\x8b\x08\x04":
+        raise ValueError("invalid BGZF block header")
+
+    (extra_length,) = struct.unpack_from("<H", header, 10)
+    extra = handle.read(extra_length)
+    block_size = None
+    position = 0
+    while position + 4 <= len(extra):
+        subfield_id = extra[position : position + 2]
+        (subfield_length,) = struct.unpack_from("<H", extra, position + 2)
+        if subfield_id == b"BC" and subfield_length == 2:
+            (block_size,) = struct.unpack_from("<H", extra, position + 4)
+            block_size += 1
+        position += 4 + subfield_length
+    if block_size is None:
+        raise ValueError("missing BGZF block size")
+
+    remainder = handle.read(block_size - 12 - extra_length)
+    if len(remainder) != block_size - 12 - extra_length or len(remainder) < 8:
+        raise ValueError("truncated BGZF block")
+    crc, data_size = struct.unpack_from("<II", remainder, len(remainder) - 8)
+
+    return remainder[:-8], crc, data_size, block_size
+
+
+def _decompress_block(compressed: bytes, crc: int, data_size: int) -> bytes:
+    """Decompress and check the data from a single block.
+
+    Parameters
+    ----------
+    compressed : bytes
+        Raw deflate data.
+    crc : int
+        Expected CRC32 of the uncompressed data.
+    data_size : int
+        Expected size of the uncompressed data.
+
+    Returns
+    -------
+    bytes
+        The uncompressed data.
+
+    Raises
+    ------
+    ValueError
+        If the uncompressed data does not match the size or CRC32.
+
+    """
+    data = zlib.decompress(compressed, -15)
+    if len(data) != data_size or zlib.crc32(data) != crc:
+        raise ValueError("corrupted BGZF block")
+    return data
+
+
+def _compress_block(data: bytes, compresslevel: int) -> bytes:
+    """Compress data into a single BGZF block.
+
+    Parameters
+    ----------
+    data : bytes
+        Uncompressed data, no longer than 65280 bytes.
+    compresslevel : int
+        zlib compression level.
+
+    Returns
+    -------
+    bytes
+        The complete block including the header and footer.
+
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    header = _BGZF_HEADER.pack(31, 139, 8, 4, 0, 0, 255, 6, 66, 67, 2, len(compressed) + 25)
+    return header + compressed + struct.pack("<II", zlib.crc32(data), len(data))
+
+
+def bgzf_block_offsets(handle: IO[bytes]) -> List[int]:
+    """Find the start position of every non-empty block in a BGZF file.
+
+    Only the block headers are read, so this is much faster than decompressing the
+    file.
+    The positions can be converted to virtual offsets with
+    :py:func:`~fqfa.util.bgzf.make_virtual_offset` to divide a file between workers.
+
+    Parameters
+    ----------
+    handle : IO[bytes]
+        Open binary file handle positioned at the start of a block.
+
+    Returns
+    -------
+    List[int]
+        List of block start positions.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a valid BGZF file.
+
+    """
+    offsets = list()
+    position = handle.tell()
+    block = _read_block(handle)
+    while block is not None:
+        if block[2] > 0:
+            offsets.append(position)
+        position += block[3]
+        block = _read_block(handle)
+    return offsets
+
+
+class BgzfReader(io.BufferedIOBase):
+    """Binary file object for reading BGZF files.
+
+    Blocks are read sequentially, but can be decompressed in parallel using a pool of
+    threads.
+    The :py:meth:`tell` and :py:meth:`seek` methods use virtual offsets rather than
+    positions in the uncompressed data.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str], IO[bytes]]
+        File path to be opened, or an open binary file handle. Handles passed in are
+        closed when the reader is closed.
+    threads : int
+        Number of threads to use for decompression. Default 1, which decompresses
+        blocks in the calling thread.
+
+    Raises
+    ------
+    ValueError
+        If the number of threads is less than 1.
+
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]", IO[bytes]], threads: int = 1) -> None:
+        super().__init__()
+        if threads < 1:
+            raise ValueError("number of threads must be at least 1")
+        if isinstance(path, (str, os.PathLike)):
+            self._handle: IO[bytes] = open(path, mode="rb")
+        else:
+            self._handle = path
+        self._executor = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+        self._max_pending = 4 * threads
+        self._pending: Deque[Tuple[int, int, "Future[bytes]"]] = deque()
+        try:
+            self._next_block_start = self._handle.tell()
+        except (AttributeError, OSError):  # stream without positions
+            self._next_block_start = 0
+        self._block_start = self._next_block_start
+        self._block_end = self._next_block_start
+        self._block_data = b""
+        self._within_block = 0
+        self._eof = False
+
+    def _submit_blocks(self) -> None:
+        """Read compressed blocks and queue them for decompression."""
+        while not self._eof and len(self._pending) < self._max_pending:
+            block = _read_block(self._handle)
+            if block is None:
+                self._eof = True
+                break
+            compressed, crc, data_size, block_size = block
+            start = self._next_block_start
+            self._next_block_start += block_size
+            if data_size == 0:
+                continue
+            if self._executor is not None:
+                future = self._executor.submit(_decompress_block, compressed, crc, data_size)
+            else:
+                future = Future()
+                future.set_result(_decompress_block(compressed, crc, data_size))
+            self._pending.append((start, start + block_size, future))
+
+    def _load_block(self) -> bool:
+        """Make the next non-empty block current.
+
+        Returns
+        -------
+        bool
+            False if there are no more blocks, else True.
+
+        """
+        if len(self._pending) == 0:
+            self._submit_blocks()
+        if len(self._pending) == 0:
+            self._block_start = self._next_block_start
+            self._block_end = self._next_block_start
+            self._block_data = b""
+            self._within_block = 0
+            return False
+        self._block_start, self._block_end, future = self._pending.popleft()
+        self._block_data = future.result()
+        self._within_block = 0
+        self._submit_blocks()
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return self._handle.seekable()
+
+    def tell(self) -> int:
+        """Return the virtual offset of the current position.
+
+        Returns
+        -------
+        int
+            The virtual offset.
+
+        """
+        if self._within_block >= len(self._block_data):
+            return make_virtual_offset(self._block_end, 0)
+        return make_virtual_offset(self._block_start, self._within_block)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Move to a virtual offset.
+
+        Parameters
+        ----------
+        offset : int
+            Virtual offset, such as a value returned by :py:meth:`tell`.
+        whence : int
+            Must be :py:data:`io.SEEK_SET`.
+
+        Returns
+        -------
+        int
+            The new virtual offset.
+
+        Raises
+        ------
+        ValueError
+            If whence is not :py:data:`io.SEEK_SET`.
+        ValueError
+            If the offset within the block is beyond the end of the block.
+
+        """
+        if whence != io.SEEK_SET:
+            raise ValueError("BGZF files only support seeking to virtual offsets")
+        block_start, within_block = split_virtual_offset(offset)
+
+        for _, _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._handle.seek(block_start)
+        self._next_block_start = block_start
+        self._eof = False
+
+        self._load_block()
+        if self._block_start != block_start and within_block > 0:
+            raise ValueError("invalid virtual offset")
+        if within_block > len(self._block_data):
+            raise ValueError("invalid virtual offset")
+        self._within_block = within_block
+        return self.tell()
+
+    def read1(self, size: int = -1) -> bytes:
+        if self._within_block >= len(self._block_data):
+            if not self._load_block():
+                return b""
+        if size is None or size < 0:
+            end = len(self._block_data)
+        else:
+            end = min(self._within_block + size, len(self._block_data))
+        data = self._block_data[self._within_block : end]
+        self._within_block = end
+        return data
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        chunks = list()
+        if size is None or size < 0:
+            chunk = self.read1()
+            while len(chunk) > 0:
+                chunks.append(chunk)
+                chunk = self.read1()
+        else:
+            while size > 0:
+                chunk = self.read1(size)
+                if len(chunk) == 0:
+                    break
+                chunks.append(chunk)
+                size -= len(chunk)
+        return b"".join(chunks)
+
+    def readinto(self, b: Any) -> int:
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        limit = -1 if size is None else size
+        chunks = list()
+        while limit != 0:
+            if self._within_block >= len(self._block_data):
+                if not self._load_block():
+                    break
+            end = self._block_data.find(b"\n", self._within_block)
+            end = len(self._block_data) if end == -1 else end + 1
+            if limit > 0:
+                end = min(end, self._within_block + limit)
+                limit -= end - self._within_block
+            chunk = self._block_data[self._within_block : end]
+            self._within_block = end
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        if not self.closed:
+            for _, _, future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+            self._handle.close()
+        super().close()
+
+
+class BgzfWriter(io.BufferedIOBase):
+    """Binary file object for writing BGZF files.
+
+    Data is divided into blocks that can be compressed in parallel using a pool of
+    threads.
+    The :py:meth:`tell` method returns the virtual offset of the next byte to be
+    written, which can be used to build an index of records as they are written.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str], IO[bytes]]
+        File path to be opened, or an open binary file handle. Handles passed in are
+        closed when the writer is closed.
+    compresslevel : int
+        zlib compression level. Default 6.
+    threads : int
+        Number of threads to use for compression. Default 1, which compresses blocks in
+        the calling thread.
+
+    Raises
+    ------
+    ValueError
+        If the number of threads is less than 1.
+
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]", IO[bytes]], compresslevel: int = 6, threads: int = 1
+    ) -> None:
+        super().__init__()
+        if threads < 1:
+            raise ValueError("number of threads must be at least 1")
+        if isinstance(path, (str, os.PathLike)):
+            self._handle: IO[bytes] = open(path, mode="wb")
+        else:
+            self._handle = path
+        self._compresslevel = compresslevel
+        self._executor = ThreadPoolExecutor(max_workers=threads) if threads > 1 else None
+        self._max_pending = 4 * threads
+        self._pending: Deque["Future[bytes]"] = deque()
+        self._buffer = bytearray()
+        try:
+            self._position = self._handle.tell()
+        except (AttributeError, OSError):  # stream without positions
+            self._position = 0
+
+    def _write_block(self, block: bytes) -> None:
+        self._handle.write(block)
+        self._position += len(block)
+
+    def _emit(self, data: bytes) -> None:
+        """Compress a block of data and write it, or queue it for compression."""
+        if self._executor is None:
+            self._write_block(_compress_block(data, self._compresslevel))
+        else:
+            self._pending.append(self._executor.submit(_compress_block, data, self._compresslevel))
+            while len(self._pending) >= self._max_pending:
+                self._write_block(self._pending.popleft().result())
+
+    def _drain(self) -> None:
+        """Write all blocks that are waiting to be compressed."""
+        while len(self._pending) > 0:
+            self._write_block(self._pending.popleft().result())
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        self._buffer += b
+        if len(self._buffer) >= _BGZF_MAX_BLOCK_DATA:
+            view = memoryview(self._buffer)
+            start = 0
+            while len(self._buffer) - start >= _BGZF_MAX_BLOCK_DATA:
+                self._emit(bytes(view[start : start + _BGZF_MAX_BLOCK_DATA]))
+                start += _BGZF_MAX_BLOCK_DATA
+            view.release()
+            del self._buffer[:start]
+        return len(b)
+
+    def tell(self) -> int:
+        """Return the virtual offset of the next byte to be written.
+
+        Any blocks waiting to be compressed are written first, since the position of
+        the current block depends on their compressed size.
+
+        Returns
+        -------
+        int
+            The virtual offset.
+
+        """
+        self._drain()
+        return make_virtual_offset(self._position, len(self._buffer))
+
+    def flush(self) -> None:
+        """Write all buffered data as complete blocks and flush the underlying handle.
+
+        Returns
+        -------
+        None
+
+        """
+        if self.closed or self._handle.closed:
+            return
+        if len(self._buffer) > 0:
+            self._emit(bytes(self._buffer))
+            self._buffer.clear()
+        self._drain()
+        self._handle.flush()
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self.flush()
+                self._write_block(_BGZF_EOF)
+            finally:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=True)
+                self._handle.close()
+        super().close()
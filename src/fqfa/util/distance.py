@@ -0,0 +1,594 @@
+"""Functions and classes for calculating distances between sequences such as barcodes.
+
+"""
+
+from collections import defaultdict
+from operator import ne
+from typing import AnyStr, Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None  # type: ignore[assignment]
+
+__all__ = ["hamming_distance", "levenshtein_distance", "HammingLibrary", "find_pairs_within_distance"]
+
+
+def _bin_popcount(x: int) -> int:
+    """Count the set bits in a non-negative integer.
+
+    Used on Python versions before 3.10, which lack :py:meth:`int.bit_count`.
+
+    Parameters
+    ----------
+    x : int
+        Non-negative integer.
+
+    Returns
+    -------
+    int
+        Number of bits set to 1.
+
+    """
+    return bin(x).count("1")
+
+
+_popcount = getattr(int, "bit_count", _bin_popcount)
+"""Callable[[int], int]: function that counts the set bits in a non-negative integer.
+
+"""
+
+
+def _as_bytes(seq: AnyStr) -> bytes:
+    """Convert a string to bytes using one byte per character.
+
+    Parameters
+    ----------
+    seq : AnyStr
+        String or bytes-like object.
+
+    Returns
+    -------
+    bytes
+        The sequence as bytes.
+
+    Raises
+    ------
+    ValueError
+        If the string contains non-ASCII characters.
+
+    """
+    if isinstance(seq, str):
+        try:
+            return seq.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError("sequences must contain only ASCII characters")
+    return bytes(seq)
+
+
+def _check_use_numpy(use_numpy: Optional[bool]) -> bool:
+    """Decide whether to use NumPy.
+
+    Parameters
+    ----------
+    use_numpy : Optional[bool]
+        True to require NumPy, False to avoid it, or None to use it if it is installed.
+
+    Returns
+    -------
+    bool
+        True if NumPy should be used.
+
+    Raises
+    ------
+    NotImplementedError
+        If NumPy is requested but not installed.
+
+    """
+    if use_numpy is None:
+        return _np is not None
+    if use_numpy and _np is None:
+        raise NotImplementedError("NumPy support requires the numpy package")
+    return use_numpy
+
+
+def _equal_length_bytes(seqs: Sequence[AnyStr]) -> List[bytes]:
+    """Convert equal-length sequences to bytes.
+
+    Parameters
+    ----------
+    seqs : Sequence[AnyStr]
+        Strings or bytes-like objects.
+
+    Returns
+    -------
+    List[bytes]
+        The sequences as bytes.
+
+    Raises
+    ------
+    ValueError
+        If the sequences have different lengths.
+
+    """
+    data = [_as_bytes(seq) for seq in seqs]
+    if any(len(x) != len(data[0]) for x in data):
+        raise ValueError("sequences must have the same length")
+    return data
+
+
+def hamming_distance(a: AnyStr, b: AnyStr) -> int:
+    """Calculate the number of positions at which two equal-length sequences differ.
+
+    Parameters
+    ----------
+    a : AnyStr
+        First sequence.
+    b : AnyStr
+        Second sequence.
+
+    Returns
+    -------
+    int
+        The Hamming distance.
+
+    Raises
+    ------
+    ValueError
+        If the sequences have different lengths.
+
+    """
+    if len(a) != len(b):
+        raise ValueError("sequences must have the same length")
+    return sum(map(ne, a, b))
+
+
+def _levenshtein_row(previous: List[int], i: int, x: Any, b: AnyStr, max_distance: int) -> Tuple[List[int], int]:
+    """Calculate a row of the banded edit distance matrix.
+
+    Only the cells within ``max_distance`` of the diagonal are calculated, and
+    distances greater than ``max_distance`` are stored as ``max_distance + 1``.
+
+    Parameters
+    ----------
+    previous : List[int]
+        The previous row of the matrix.
+    i : int
+        Index of the row, starting from 1.
+    x : Any
+        The character of the first sequence for this row.
+    b : AnyStr
+        The second sequence.
+    max_distance : int
+        Largest distance of interest.
+
+    Returns
+    -------
+    Tuple[List[int], int]
+        The row and its smallest distance.
+
+    """
+    limit = max_distance + 1
+    m = len(b)
+    current = [limit] * (m + 1)
+    if i < limit:
+        current[0] = i
+    row_min = current[0]
+    for j in range(max(1, i - max_distance), min(m, i + max_distance) + 1):
+        cost = previous[j - 1] + (x != b[j - 1])
+        if previous[j] + 1 < cost:
+            cost = previous[j] + 1
+        if current[j - 1] + 1 < cost:
+            cost = current[j - 1] + 1
+        if cost > limit:
+            cost = limit
+        current[j] = cost
+        if cost < row_min:
+            row_min = cost
+    return current, row_min
+
+
+def levenshtein_distance(a: AnyStr, b: AnyStr, max_distance: Optional[int] = None) -> Optional[int]:
+    """Calculate the edit distance between two sequences.
+
+    The edit distance is the minimum number of single-character insertions, deletions,
+    and substitutions needed to change one sequence into the other.
+    The sequences can have different lengths.
+
+    If ``max_distance`` is given, only the diagonal band of the dynamic programming
+    matrix that can contain distances up to ``max_distance`` is calculated, and the
+    calculation stops as soon as the distance is known to be greater.
+    This is much faster than calculating the exact distance when most pairs of
+    sequences are dissimilar.
+
+    Parameters
+    ----------
+    a : AnyStr
+        First sequence.
+    b : AnyStr
+        Second sequence.
+    max_distance : Optional[int]
+        Largest distance of interest, or None to always calculate the exact distance.
+
+    Returns
+    -------
+    Optional[int]
+        The edit distance, or None if it is greater than ``max_distance``.
+
+    Raises
+    ------
+    ValueError
+        If the maximum distance is negative.
+
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    n = len(a)
+    m = len(b)
+    if max_distance is None:
+        max_distance = n
+    elif max_distance < 0:
+        raise ValueError("maximum distance must be non-negative")
+
+    if n - m > max_distance:
+        return None
+    if m == 0:
+        return n
+
+    limit = max_distance + 1  # stands in for any distance greater than max_distance
+    previous = [j if j < limit else limit for j in range(m + 1)]
+    for i in range(1, n + 1):
+        current, row_min = _levenshtein_row(previous, i, a[i - 1], b, max_distance)
+        if row_min > max_distance:  # distances never decrease from one row to the next
+            return None
+        previous = current
+
+    return previous[m] if previous[m] <= max_distance else None
+
+
+class HammingLibrary:
+    """Collection of equal-length sequences prepared for bulk Hamming distance queries.
+
+    The sequences are converted once when the object is created, so that each query
+    compares against every sequence without any per-sequence Python overhead.
+    If NumPy is available, the sequences are stored as a two-dimensional array of bytes
+    and each query is a single vectorized comparison.
+    Otherwise, each sequence is stored as an integer with one byte per character, and
+    differences are found by XOR and counting the non-zero bytes.
+
+    Parameters
+    ----------
+    seqs : Sequence[AnyStr]
+        Sequences, which must all have the same length.
+    use_numpy : Optional[bool]
+        If True, use NumPy; if False, use integers. If None (the default), NumPy is
+        used if it is installed.
+
+    Raises
+    ------
+    ValueError
+        If the sequences have different lengths.
+    NotImplementedError
+        If NumPy is requested but not installed.
+
+    """
+
+    def __init__(self, seqs: Sequence[AnyStr], use_numpy: Optional[bool] = None) -> None:
+        use_numpy = _check_use_numpy(use_numpy)
+        data = _equal_length_bytes(seqs)
+        self.length = len(data[0]) if len(data) > 0 else 0
+
+        self._size = len(data)
+        self._use_numpy = use_numpy
+        if use_numpy:
+            self._array = _np.frombuffer(b"".join(data), dtype=_np.uint8).reshape(len(data), self.length)
+        else:
+            self._values = [int.from_bytes(x, "big") for x in data]
+            self._low_bits = int.from_bytes(b"\x01" * self.length, "big")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _check_query(self, query: AnyStr) -> bytes:
+        data = _as_bytes(query)
+        if len(data) != self.length:
+            raise ValueError("query must have the same length as the library sequences")
+        return data
+
+    def distances(self, query: AnyStr) -> List[int]:
+        """Calculate the Hamming distance between the query and every sequence.
+
+        Parameters
+        ----------
+        query : AnyStr
+            Query sequence with the same length as the library sequences.
+
+        Returns
+        -------
+        List[int]
+            Distance to each sequence, in library order.
+
+        Raises
+        ------
+        ValueError
+            If the query has a different length.
+
+        """
+        data = self._check_query(query)
+        if self._use_numpy:
+            row = _np.frombuffer(data, dtype=_np.uint8)
+            return (self._array != row).sum(axis=1).tolist()  # type: ignore[no-any-return]
+
+        target = int.from_bytes(data, "big")
+        low_bits = self._low_bits
+        result = list()
+        for value in self._values:
+            # fold each byte of the XOR into its lowest bit, then count the set bits
+            x = value ^ target
+            x |= x >> 4
+            x |= x >> 2
+            x |= x >> 1
+            result.append(_popcount(x & low_bits))
+        return result
+
+    def within(self, query: AnyStr, max_distance: int) -> List[int]:
+        """Find the sequences within a given Hamming distance of the query.
+
+        Parameters
+        ----------
+        query : AnyStr
+            Query sequence with the same length as the library sequences.
+        max_distance : int
+            Largest distance to include.
+
+        Returns
+        -------
+        List[int]
+            Indices of the matching sequences, in library order.
+
+        Raises
+        ------
+        ValueError
+            If the query has a different length.
+
+        """
+        if self._use_numpy:
+            data = self._check_query(query)
+            row = _np.frombuffer(data, dtype=_np.uint8)
+            return _np.flatnonzero((self._array != row).sum(axis=1) <= max_distance).tolist()  # type: ignore
+        return [i for i, d in enumerate(self.distances(query)) if d <= max_distance]
+
+
+_PAIR_BLOCK_SIZE = 1 << 22
+"""int: approximate number of base comparisons performed at once when comparing the
+members of a bucket using NumPy.
+
+"""
+
+_NUMPY_BUCKET_SIZE = 32
+"""int: smallest bucket compared using NumPy when the backend is chosen automatically.
+
+Smaller buckets are compared faster using integers, as the cost of setting up the
+NumPy operations is larger than the comparisons themselves.
+
+"""
+
+
+def _bucket_pairs_numpy(
+    array: Any, members: List[int], max_distance: int, earlier: List[Tuple[int, int]]
+) -> List[Tuple[int, int, int]]:
+    """Find the pairs within a bucket that are within the maximum distance using NumPy.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Two-dimensional array of bytes with one row per sequence.
+    members : List[int]
+        Indices of the sequences in the bucket, in increasing order.
+    max_distance : int
+        Largest distance to include.
+    earlier : List[Tuple[int, int]]
+        Start and end positions of the segments used by earlier buckets. Pairs that
+        share any of these segments are skipped.
+
+    Returns
+    -------
+    List[Tuple[int, int, int]]
+        List of tuples containing the indices of the two sequences and their distance.
+
+    """
+    index = _np.asarray(members)
+    rows = array[index]
+    count, length = rows.shape
+    block = max(1, _PAIR_BLOCK_SIZE // (count * max(length, 1)))
+
+    result: List[Tuple[int, int, int]] = list()
+    for start in range(0, count, block):
+        equal = rows[start : start + block, None, :] == rows[None, :, :]
+        distances = length - equal.sum(axis=2)
+        keep = distances <= max_distance
+        keep &= _np.arange(count)[None, :] > _np.arange(start, start + len(equal))[:, None]
+        for s, e in earlier:
+            keep &= ~equal[:, :, s:e].all(axis=2)
+        first, second = _np.nonzero(keep)
+        result.extend(zip(index[first + start].tolist(), index[second].tolist(), distances[first, second].tolist()))
+    return result
+
+
+def _bucket_pairs_python(
+    values: List[int], keys: List[List[bytes]], low_bits: int, members: List[int], max_distance: int, segment: int
+) -> List[Tuple[int, int, int]]:
+    """Find the pairs within a bucket that are within the maximum distance using integers.
+
+    Parameters
+    ----------
+    values : List[int]
+        Each sequence as an integer with one byte per character.
+    keys : List[List[bytes]]
+        The segments of each sequence.
+    low_bits : int
+        Integer with the lowest bit of each byte set.
+    members : List[int]
+        Indices of the sequences in the bucket, in increasing order.
+    max_distance : int
+        Largest distance to include.
+    segment : int
+        Index of the segment used to create the bucket. Pairs that share any earlier
+        segment are skipped.
+
+    Returns
+    -------
+    List[Tuple[int, int, int]]
+        List of tuples containing the indices of the two sequences and their distance.
+
+    """
+    result: List[Tuple[int, int, int]] = list()
+    for n, i in enumerate(members):
+        for j in members[n + 1 :]:
+            # skip pairs that were already compared for an earlier segment
+            if any(keys[i][q] == keys[j][q] for q in range(segment)):
+                continue
+            x = values[i] ^ values[j]
+            x |= x >> 4
+            x |= x >> 2
+            x |= x >> 1
+            distance = _popcount(x & low_bits)
+            if distance <= max_distance:
+                result.append((i, j, distance))
+    return result
+
+
+class _BucketComparer:
+    """Compares the sequences in buckets that share a segment.
+
+    NumPy is used for buckets with at least
+    :py:data:`~fqfa.util.distance._NUMPY_BUCKET_SIZE` members when the backend is chosen
+    automatically.
+
+    Parameters
+    ----------
+    data : List[bytes]
+        Sequences, which must all have the same length.
+    segments : List[Tuple[int, int]]
+        Start and end positions of each segment.
+    max_distance : int
+        Largest distance to include.
+    use_numpy : Optional[bool]
+        True to always use NumPy, False to never use it, or None to choose by bucket
+        size.
+
+    """
+
+    def __init__(
+        self, data: List[bytes], segments: List[Tuple[int, int]], max_distance: int, use_numpy: Optional[bool]
+    ) -> None:
+        length = len(data[0])
+        self.segments = segments
+        self.max_distance = max_distance
+        self.min_numpy_size = 0 if use_numpy else _NUMPY_BUCKET_SIZE
+        self.array: Any = None
+        if use_numpy is not False:
+            self.array = _np.frombuffer(b"".join(data), dtype=_np.uint8).reshape(len(data), length)
+        self.values: List[int] = list()
+        self.keys: List[List[bytes]] = list()
+        self.low_bits = int.from_bytes(b"\x01" * length, "big")
+        if use_numpy is not True:
+            self.values = [int.from_bytes(x, "big") for x in data]
+            self.keys = [[x[s:e] for s, e in segments] for x in data]
+
+    def pairs(self, members: List[int], segment: int) -> List[Tuple[int, int, int]]:
+        """Find the pairs within a bucket that are within the maximum distance.
+
+        Parameters
+        ----------
+        members : List[int]
+            Indices of the sequences in the bucket, in increasing order.
+        segment : int
+            Index of the segment used to create the bucket.
+
+        Returns
+        -------
+        List[Tuple[int, int, int]]
+            List of tuples containing the indices of the two sequences and their
+            distance.
+
+        """
+        if self.array is not None and len(members) >= self.min_numpy_size:
+            return _bucket_pairs_numpy(self.array, members, self.max_distance, self.segments[:segment])
+        return _bucket_pairs_python(self.values, self.keys, self.low_bits, members, self.max_distance, segment)
+
+
+def find_pairs_within_distance(
+    seqs: Sequence[AnyStr], max_distance: int, use_numpy: Optional[bool] = None
+) -> List[Tuple[int, int, int]]:
+    """Find all pairs of equal-length sequences within a given Hamming distance.
+
+    Each sequence is divided into ``max_distance + 1`` segments.
+    By the pigeonhole principle, two sequences within ``max_distance`` of each other
+    must have at least one identical segment, so only sequences that share a segment
+    are compared.
+    This avoids comparing every pair of sequences, which is impractical for large
+    barcode sets, provided that the segments are long enough to be selective.
+    If NumPy is available, large groups of sequences that share a segment are compared
+    using vectorized operations, and small groups (as found for small distances, where
+    the segments are long) are compared using integers, which is faster for them.
+
+    Parameters
+    ----------
+    seqs : Sequence[AnyStr]
+        Sequences, which must all have the same length.
+    max_distance : int
+        Largest distance to include.
+    use_numpy : Optional[bool]
+        If True, use NumPy; if False, use integers. If None (the default), NumPy is
+        used for groups of at least 32 sequences if it is installed.
+
+    Returns
+    -------
+    List[Tuple[int, int, int]]
+        List of tuples containing the indices of the two sequences (the smaller index
+        first) and their distance, sorted by index.
+
+    Raises
+    ------
+    ValueError
+        If the sequences have different lengths.
+    ValueError
+        If the maximum distance is negative.
+    NotImplementedError
+        If NumPy is requested but not installed.
+
+    """
+    if max_distance < 0:
+        raise ValueError("maximum distance must be non-negative")
+    if use_numpy is not None:
+        _check_use_numpy(use_numpy)
+    elif _np is None:
+        use_numpy = False
+    if len(seqs) == 0:
+        return list()
+
+    data = _equal_length_bytes(seqs)
+    length = len(data[0])
+
+    if max_distance >= length:  # every pair is within the distance
+        return [(i, j, hamming_distance(data[i], data[j])) for i in range(len(data)) for j in range(i + 1, len(data))]
+
+    parts = max_distance + 1
+    bounds = [(length * p) // parts for p in range(parts + 1)]
+    segments = list(zip(bounds[:-1], bounds[1:]))
+
+    comparer = _BucketComparer(data, segments, max_distance, use_numpy)
+
+    result: List[Tuple[int, int, int]] = list()
+    for p, (start, end) in enumerate(segments):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        for i, x in enumerate(data):
+            buckets[x[start:end]].append(i)
+
+        for members in buckets.values():
+            if len(members) >= 2:
+                result.extend(comparer.pairs(members, p))
+
+    result.sort()
+    return result
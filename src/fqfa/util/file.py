@@ -2,61 +2,663 @@
 
 """
 
+import io
 import os
+import re
 import bz2
 import gzip
-from typing import Optional, IO, Any
+import lzma
+import queue
+import threading
+from typing import Optional, IO, Any, Union, Callable, Dict, cast
+from fqfa.util.bgzf import BgzfReader, BgzfWriter
+
+try:  # Python 3.14 and later
+    from compression import zstd as _zstd  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import zstandard as _zstd  # type: ignore
+    except ImportError:
+        _zstd = None
 
 __all__ = ["open_compressed", "has_fastq_ext", "has_fasta_ext"]
 
-_COMPRESSION_EXTENSIONS = [".bz2", ".gz"]
+_COMPRESSION_EXTENSIONS = [".bz2", ".gz", ".bgz", ".xz", ".lzma", ".zst"]
 """List[str]: list of recognized compression extensions.
 
 """
 
+_EXTENSION_COMPRESSION = {
+    ".gz": "gzip",
+    ".bgz": "bgzf",
+    ".bz2": "bzip2",
+    ".xz": "xz",
+    ".lzma": "lzma",
+    ".zst": "zstd",
+}
+"""Dict[str, str]: compression method used when writing files with each recognized
+compression extension.
+
+"""
+
+_MAGIC_NUMBERS = [
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bzip2"),
+    (b"\xfd7zXZ\x00", "lzma"),
+    (b"\x5d\x00\x00", "lzma"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+]
+"""List[Tuple[bytes, str]]: list of file signatures and the corresponding compression
+method.
+
+"""
+
+_BZIP2_HEADER = re.compile(rb"BZh[1-9](?:1AY&SY|\x17rE8P\x90)")
+"""Pattern[bytes]: pattern matching the start of a bzip2 stream.
+
+The "BZh" signature is followed by the block size digit and the magic number of either
+the first block or the end of the stream, so text files that start with "BZh" are not
+mistaken for bzip2 files.
+
+"""
+
+_MAGIC_LENGTH = 16
+"""int: number of bytes needed to identify the compression method, including the BGZF
+extra field in the gzip header.
+
+"""
+
+
+_READ_AHEAD_BLOCK_SIZE = 1 << 20
+"""int: number of decompressed bytes read by the background thread at once.
+
+"""
+
+_READ_AHEAD_BLOCKS = 8
+"""int: maximum number of decompressed blocks waiting to be read.
+
+"""
+
+_BINARY_BUFFER_SIZE = 1 << 16
+"""int: buffer size used when reading compressed files in binary mode.
+
+"""
+
+_WRITE_BEHIND_BUFFER_SIZE = 1 << 20
+"""int: number of uncompressed bytes passed to the background thread at once.
+
+"""
+
+_WRITE_BEHIND_BLOCKS = 8
+"""int: maximum number of uncompressed blocks waiting to be written.
+
+"""
+
+_MODES = {m + t: (m, t == "b") for m in "rwax" for t in ("", "t", "b")}
+"""Dict[str, Tuple[str, bool]]: map from the file modes accepted by open_compressed to
+the base mode and whether the file is opened in binary mode.
+
+"""
+
 
-def open_compressed(path: str, encoding: Optional[str] = None) -> IO[Any]:
-    """Open the file handle for reading using the correct (optional) decompression
-    method.
+class _ReadAheadReader(io.RawIOBase):
+    """Raw binary stream that reads from another stream using a background thread.
 
-    Compression status is determined by the file extension.
-    Recognized file extensions are ``.bz2`` for bzip2 compression and ``.gz`` for gzip
-    compression.
-    If there is any other file extension (or no extension), the file is opened normally.
-    The file is opened in text mode.
+    The background thread reads large blocks into a bounded queue ahead of the consumer.
+    Since the standard library decompressors release the GIL, this allows
+    decompression to run in parallel with parsing.
 
     Parameters
     ----------
-    path : str
+    handle : IO[bytes]
+        Open binary file handle to read from. It is closed when this stream is closed.
+    block_size : int
+        Number of bytes to read at once.
+    max_blocks : int
+        Maximum number of blocks waiting to be read.
+
+    """
+
+    def __init__(
+        self, handle: IO[bytes], block_size: int = _READ_AHEAD_BLOCK_SIZE, max_blocks: int = _READ_AHEAD_BLOCKS
+    ) -> None:
+        super().__init__()
+        self._handle = handle
+        self._block_size = block_size
+        self._queue: "queue.Queue[Union[bytes, BaseException]]" = queue.Queue(maxsize=max_blocks)
+        self._stop = threading.Event()
+        self._buffer = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _produce(self) -> None:
+        """Read blocks from the handle until the end of the file. Runs in the
+        background thread.
+
+        Exceptions are passed to the consumer through the queue.
+
+        """
+        try:
+            while not self._stop.is_set():
+                block = self._handle.read(self._block_size)
+                self._put(block)
+                if len(block) == 0:
+                    break
+        except BaseException as e:
+            self._put(e)
+
+    def _put(self, item: Union[bytes, BaseException]) -> None:
+        """Add an item to the queue, giving up if the stream is closed while waiting.
+
+        """
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            else:
+                break
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        if len(self._buffer) == 0 and not self._eof:
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            elif len(item) == 0:
+                self._eof = True
+            else:
+                self._buffer = memoryview(item)
+
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            while True:  # unblock the background thread if it is waiting on the queue
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._thread.join()
+            self._handle.close()
+        super().close()
+
+
+class _WriteBehindWriter(io.RawIOBase):
+    """Raw binary stream that writes to another stream using a background thread.
+
+    Data is passed to the background thread through a bounded queue.
+    Since the standard library compressors release the GIL, this allows compression to
+    run in parallel with the code producing the output.
+    Any exception raised by the background thread is raised by the next call to
+    :py:meth:`write`, :py:meth:`flush`, or :py:meth:`close`.
+
+    Parameters
+    ----------
+    handle : IO[bytes]
+        Open binary file handle to write to. It is closed when this stream is closed.
+    max_blocks : int
+        Maximum number of blocks waiting to be written.
+
+    """
+
+    def __init__(self, handle: IO[bytes], max_blocks: int = _WRITE_BEHIND_BLOCKS) -> None:
+        super().__init__()
+        self._handle = handle
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_blocks)
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._consume, daemon=True)
+        self._thread.start()
+
+    def _consume(self) -> None:
+        """Write blocks to the handle until the end marker is received. Runs in the
+        background thread.
+
+        """
+        while True:
+            block = self._queue.get()
+            try:
+                if block is None:
+                    break
+                if self._error is None:
+                    self._handle.write(block)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _check_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        self._check_error()
+        self._queue.put(bytes(b))
+        return len(b)
+
+    def flush(self) -> None:
+        if not self.closed:
+            self._queue.join()
+            self._check_error()
+
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._queue.put(None)
+                self._thread.join()
+                self._check_error()
+            finally:
+                self._handle.close()
+                super().close()
+
+
+def _detect_compression(handle: IO[bytes]) -> Optional[str]:
+    """Identify the compression method of a binary file handle from its first bytes.
+
+    The position of the handle is not changed.
+
+    Parameters
+    ----------
+    handle : IO[bytes]
+        Open binary file handle that supports either ``peek`` or ``seek``.
+
+    Returns
+    -------
+    Optional[str]
+        Name of the compression method, or None if the data is not compressed.
+
+    Raises
+    ------
+    ValueError
+        If the handle supports neither ``peek`` nor ``seek``.
+
+    """
+    if hasattr(handle, "peek"):
+        start = handle.peek(_MAGIC_LENGTH)[:_MAGIC_LENGTH]  # type: ignore[attr-defined]
+    elif handle.seekable():
+        position = handle.tell()
+        start = handle.read(_MAGIC_LENGTH)
+        handle.seek(position)
+    else:
+        raise ValueError("file handle must support peek or seek")
+
+    for magic, compression in _MAGIC_NUMBERS:
+        if start.startswith(magic):
+            if compression == "bzip2" and _BZIP2_HEADER.match(start) is None:
+                continue
+            if compression == "gzip" and len(start) >= 16 and start[3] & 4 and start[12:14] == b"BC":
+                return "bgzf"
+            return compression
+    return None
+
+
+def _open_reader(
+    path: Union[str, "os.PathLike[str]", IO[bytes]], compression: Optional[str], threads: int = 1
+) -> IO[bytes]:
+    """Open a binary file handle for reading using the given decompression method.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str], IO[bytes]]
+        File path to be opened, or an open binary file handle.
+    compression : Optional[str]
+        Name of the compression method, or None if the data is not compressed.
+    threads : int
+        Number of threads to use for decompression, if supported by the compression
+        method. Default 1.
+
+    Returns
+    -------
+    IO[bytes]
+        Open binary file handle.
+
+    Raises
+    ------
+    NotImplementedError
+        If a recognized compression method lacks an implementation.
+
+    """
+    if compression == "bgzf":
+        return cast(IO[bytes], BgzfReader(path, threads=threads))
+    elif compression == "gzip":
+        return cast(IO[bytes], gzip.open(path, mode="rb"))
+    elif compression == "bzip2":
+        return bz2.open(path, mode="rb")
+    elif compression == "lzma":
+        return lzma.open(path, mode="rb")
+    elif compression == "zstd":
+        if _zstd is None:
+            raise NotImplementedError("zstd support requires the zstandard package")
+        return _zstd.open(path, mode="rb")  # type: ignore[no-any-return]
+    elif isinstance(path, (str, os.PathLike)):
+        return open(path, mode="rb")
+    else:
+        return path
+
+
+def _open_zstd_writer(path: Union[str, "os.PathLike[str]"], mode: str, compresslevel: Optional[int]) -> IO[bytes]:
+    """Open a zstd-compressed binary file handle for writing.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        File path to be opened.
+    mode : str
+        One of "wb", "ab", or "xb".
+    compresslevel : Optional[int]
+        Compression level, or None to use the default.
+
+    Returns
+    -------
+    IO[bytes]
+        Open binary file handle.
+
+    Raises
+    ------
+    NotImplementedError
+        If neither Python 3.14's zstd module nor the zstandard package is available.
+
+    """
+    if _zstd is None:
+        raise NotImplementedError("zstd support requires the zstandard package")
+    if compresslevel is None:
+        return _zstd.open(path, mode=mode)  # type: ignore[no-any-return]
+    if _zstd.__name__ == "zstandard":
+        return _zstd.open(path, mode=mode, cctx=_zstd.ZstdCompressor(level=compresslevel))  # type: ignore
+    return _zstd.open(path, mode=mode, level=compresslevel)  # type: ignore[no-any-return]
+
+
+_GZIP_COMPRESSLEVEL = 6
+"""int: default compression level for gzip and BGZF output.
+
+The same default is used for both so that gzip output written using several threads
+(as BGZF) is compressed the same way as output written using one thread.
+
+"""
+
+_WRITERS: Dict[str, Callable[[Union[str, "os.PathLike[str]"], str, Optional[int]], IO[Any]]] = {
+    "gzip": lambda path, mode, level: cast(
+        IO[Any], gzip.open(path, mode=mode, compresslevel=_GZIP_COMPRESSLEVEL if level is None else level)
+    ),
+    "bzip2": lambda path, mode, level: bz2.open(path, mode=mode, compresslevel=9 if level is None else level),
+    "xz": lambda path, mode, level: lzma.open(path, mode=mode, preset=level),
+    "lzma": lambda path, mode, level: lzma.open(path, mode=mode, format=lzma.FORMAT_ALONE, preset=level),
+    "zstd": _open_zstd_writer,
+}
+"""Dict[str, Callable[[Union[str, os.PathLike[str]], str, Optional[int]], IO[Any]]]:
+map from compression method to a function that opens a binary file handle for writing
+given the path, mode, and compression level (None for the default).
+BGZF is not included, as it is written using :py:class:`~fqfa.util.bgzf.BgzfWriter`.
+
+"""
+
+
+def _open_writer(
+    path: Union[str, "os.PathLike[str]"],
+    compression: Optional[str],
+    mode: str,
+    compresslevel: Optional[int] = None,
+    threads: int = 1,
+) -> IO[bytes]:
+    """Open a binary file handle for writing using the given compression method.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
         File path to be opened.
+    compression : Optional[str]
+        Name of the compression method, or None to write uncompressed data.
+    mode : str
+        One of "w", "a", or "x".
+    compresslevel : Optional[int]
+        Compression level, or None to use the default for the compression method.
+    threads : int
+        Number of threads to use for compression. Default 1.
+
+    Returns
+    -------
+    IO[bytes]
+        Open binary file handle.
+
+    Raises
+    ------
+    NotImplementedError
+        If a recognized compression method lacks an implementation.
+
+    """
+    binary_mode = mode + "b"
+    if compression == "gzip" and threads > 1:
+        compression = "bgzf"
+
+    if compression == "bgzf":
+        writer = BgzfWriter(
+            open(path, mode=binary_mode),
+            compresslevel=_GZIP_COMPRESSLEVEL if compresslevel is None else compresslevel,
+            threads=threads,
+        )
+        return cast(IO[bytes], writer)
+    opener = _WRITERS.get(compression)  # type: ignore[arg-type]
+    if opener is None:
+        return open(path, mode=binary_mode)
+
+    handle: IO[bytes] = opener(path, binary_mode, compresslevel)
+    if threads > 1:
+        handle = io.BufferedWriter(_WriteBehindWriter(handle), buffer_size=_WRITE_BEHIND_BUFFER_SIZE)
+    return handle
+
+
+def _open_compressed_reader(
+    path: Union[str, "os.PathLike[str]", IO[bytes]],
+    binary: bool,
+    encoding: Optional[str],
+    read_ahead: bool,
+    threads: int,
+) -> IO[Any]:
+    """Open a file for reading as described for :py:func:`~fqfa.util.file.open_compressed`.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str], IO[bytes]]
+        File path to be opened, or an open binary file handle.
+    binary : bool
+        True to return a binary file handle, False for a text file handle.
     encoding : Optional[str]
-        Text file encoding as described for :py:class:`io.TextIOWrapper`.
+        Text file encoding.
+    read_ahead : bool
+        If True, read and decompress the file using a background thread.
+    threads : int
+        Number of threads used to decompress BGZF files.
 
     Returns
     -------
     IO[Any]
-        Open text file handle.
+        Open text or binary file handle.
 
     Raises
     ------
     FileNotFoundError
         If path does not correspond to a file.
     NotImplementedError
-        If a recognized compression extension lacks an implementation.
+        If a recognized compression method lacks an implementation.
 
     """
-    if not os.path.isfile(path):
-        raise FileNotFoundError("could not find file to open")
-    _, ext = os.path.splitext(path)
-    if ext.lower() in _COMPRESSION_EXTENSIONS:
-        if ext.lower() == ".bz2":
-            return bz2.open(path, mode="rt", encoding=encoding)
-        elif ext.lower() == ".gz":
-            return gzip.open(path, mode="rt", encoding=encoding)
-        else:  # pragma no cover
-            raise NotImplementedError("unsupported compression type")
+    if isinstance(path, (str, os.PathLike)):
+        if not os.path.isfile(path):
+            raise FileNotFoundError("could not find file to open")
+        with open(path, mode="rb") as f:
+            compression = _detect_compression(f)
     else:
-        return open(path, mode="rt", encoding=encoding)
+        compression = _detect_compression(path)
+
+    handle = _open_reader(path, compression, threads=threads)
+    if read_ahead:
+        handle = io.BufferedReader(_ReadAheadReader(handle))
+    if binary:
+        if not isinstance(handle, io.BufferedReader):
+            # reading lines through a C buffer is much faster than the decompressors' readline,
+            # and the decompressors provide the raw stream methods that BufferedReader uses
+            handle = io.BufferedReader(cast(io.RawIOBase, handle), buffer_size=_BINARY_BUFFER_SIZE)
+        return handle
+    return io.TextIOWrapper(handle, encoding=encoding)
+
+
+def _open_compressed_writer(
+    path: Union[str, "os.PathLike[str]", IO[bytes]],
+    base_mode: str,
+    binary: bool,
+    encoding: Optional[str],
+    compresslevel: Optional[int],
+    threads: int,
+) -> IO[Any]:
+    """Open a file for writing as described for :py:func:`~fqfa.util.file.open_compressed`.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str], IO[bytes]]
+        File path to be opened.
+    base_mode : str
+        One of "w", "a", or "x".
+    binary : bool
+        True to return a binary file handle, False for a text file handle.
+    encoding : Optional[str]
+        Text file encoding.
+    compresslevel : Optional[int]
+        Compression level, or None to use the default for the compression method.
+    threads : int
+        Number of threads used to compress the output.
+
+    Returns
+    -------
+    IO[Any]
+        Open text or binary file handle.
+
+    Raises
+    ------
+    ValueError
+        If a file handle is provided instead of a path.
+    NotImplementedError
+        If a recognized compression method lacks an implementation.
+
+    """
+    if not isinstance(path, (str, os.PathLike)):
+        raise ValueError("writing requires a file path")
+    _, ext = os.path.splitext(path)
+    compression = _EXTENSION_COMPRESSION.get(ext.lower())
+    handle = _open_writer(path, compression, base_mode, compresslevel=compresslevel, threads=threads)
+    if binary:
+        return handle
+    return io.TextIOWrapper(handle, encoding=encoding)
+
+
+def open_compressed(
+    path: Union[str, "os.PathLike[str]", IO[bytes]],
+    encoding: Optional[str] = None,
+    read_ahead: bool = False,
+    threads: int = 1,
+    mode: str = "r",
+    compresslevel: Optional[int] = None,
+) -> IO[Any]:
+    """Open the file handle using the correct (optional) compression method.
+
+    When reading, compression status is determined by the first bytes of the file
+    rather than the file extension, so misnamed files and streams are handled
+    correctly.
+    Supported methods are gzip (including BGZF), bzip2, xz/lzma and, if the
+    ``zstandard`` package is installed (or on Python 3.14 and later), zstd.
+    If the data is not compressed, the file is opened normally.
+
+    The file is opened in text mode unless the mode ends in "b".
+    In binary mode, lines are returned as bytes and no decoding is performed.
+    Since sequencing data is ASCII, the parsing functions in fqfa accept binary file
+    handles, which is faster than decoding the data.
+
+    If ``read_ahead`` is True, reading and decompression are performed in large blocks
+    by a background thread, which runs in parallel with the code consuming the
+    returned handle.
+    This typically speeds up parsing of compressed files on multi-core machines.
+    The handle should be closed when it is no longer needed to stop the thread.
+
+    BGZF files are read using :py:class:`~fqfa.util.bgzf.BgzfReader`, which can
+    decompress blocks in parallel using ``threads`` threads.
+    To seek using virtual offsets, use :py:class:`~fqfa.util.bgzf.BgzfReader`
+    directly.
+
+    When writing, the compression method is determined by the file extension.
+    Recognized file extensions are ``.gz`` for gzip, ``.bgz`` for BGZF, ``.bz2`` for
+    bzip2, ``.xz`` for xz, ``.lzma`` for legacy lzma, and ``.zst`` for zstd.
+    Any other file extension is written uncompressed.
+    If ``threads`` is greater than 1, gzip output is written as BGZF (which remains
+    readable by any gzip decompressor) with blocks compressed in parallel, and other
+    compression methods compress the output on a background thread.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str], IO[bytes]]
+        File path to be opened. When reading, this can also be an open binary file
+        handle that supports either ``peek`` or ``seek``.
+    encoding : Optional[str]
+        Text file encoding as described for :py:class:`io.TextIOWrapper`. Must be None
+        in binary mode.
+    read_ahead : bool
+        If True, read and decompress the file using a background thread. Default False.
+        Ignored when writing.
+    threads : int
+        Number of threads used to decompress BGZF files or to compress output.
+        Default 1.
+    mode : str
+        One of "r" for reading, "w" for writing, "a" for appending, or "x" for
+        exclusive creation, optionally followed by "t" for text mode or "b" for binary
+        mode. Default "r".
+    compresslevel : Optional[int]
+        Compression level used when writing, or None to use the default for the
+        compression method. The default for gzip and BGZF is 6, regardless of the
+        number of threads.
+
+    Returns
+    -------
+    IO[Any]
+        Open text or binary file handle.
+
+    Raises
+    ------
+    FileNotFoundError
+        If path does not correspond to a file when reading.
+    ValueError
+        If the mode is not recognized.
+    ValueError
+        If an encoding is given in binary mode.
+    ValueError
+        If the number of threads is less than 1.
+    ValueError
+        If a file handle is provided instead of a path when writing.
+    NotImplementedError
+        If a recognized compression method lacks an implementation.
+
+    """
+    try:
+        base_mode, binary = _MODES[mode]
+    except KeyError:
+        raise ValueError(f"invalid mode '{mode}'")
+    if binary and encoding is not None:
+        raise ValueError("binary mode doesn't take an encoding argument")
+    if threads < 1:
+        raise ValueError("number of threads must be at least 1")
+
+    if base_mode != "r":
+        return _open_compressed_writer(path, base_mode, binary, encoding, compresslevel, threads)
+    return _open_compressed_reader(path, binary, encoding, read_ahead, threads)
 
 
 def has_fastq_ext(path: str) -> bool:
@@ -2,16 +2,110 @@
 
 """
 
-from typing import Optional, List
-from fqfa.validator.validator import (
-    dna_bases_validator,
-    dna_characters_validator,
-    rna_bases_validator,
-    amino_acids_validator,
-    amino_acids_all_validator,
-)
+import os
+import random
+from itertools import chain
+from typing import Optional, List, Dict, AnyStr, IO, NamedTuple, Tuple, Union, cast
+from fqfa.fasta.fasta import parse_fasta_records
+from fqfa.util.file import open_compressed, _detect_compression
+from fqfa.constants.iupac.dna import DNA_BASES, DNA_CHARACTERS
+from fqfa.constants.iupac.rna import RNA_BASES
+from fqfa.constants.iupac.protein import AA_CODES, AA_CODES_ALL
 
-__all__ = ["infer_sequence_type", "infer_all_sequence_types"]
+__all__ = ["infer_sequence_type", "infer_all_sequence_types", "SequenceTypeReport", "infer_file_sequence_type"]
+
+_DNA = 1
+_DNA_IUPAC = 2
+_RNA = 4
+_PROTEIN = 8
+_PROTEIN_IUPAC = 16
+
+
+def _character_types() -> Dict[str, int]:
+    """Create the map from each valid character to the sequence types that allow it.
+
+    Returns
+    -------
+    Dict[str, int]
+        Map from each character to a bitmask of the sequence types whose alphabets
+        contain it.
+
+    """
+    result: Dict[str, int] = dict()
+    for flag, alphabet in (
+        (_DNA, DNA_BASES),
+        (_DNA_IUPAC, DNA_CHARACTERS),
+        (_RNA, RNA_BASES),
+        (_PROTEIN, AA_CODES.keys()),
+        (_PROTEIN_IUPAC, AA_CODES_ALL.keys()),
+    ):
+        for c in alphabet:
+            result[c] = result.get(c, 0) | flag
+    return result
+
+
+_CHARACTER_TYPES = _character_types()
+"""Dict[str, int]: map from each valid character to a bitmask of the sequence types
+whose alphabets contain it.
+
+"""
+
+_TYPES_TABLE = bytes(_CHARACTER_TYPES.get(chr(i), 0) for i in range(256))
+"""bytes: translation table from ASCII characters to their sequence type bitmasks,
+with invalid characters translated to 0.
+
+"""
+
+_TYPE_PRIORITY = [
+    (_DNA, "dna"),
+    (_RNA, "rna"),
+    (_PROTEIN, "protein"),
+    (_DNA_IUPAC, "dna-iupac"),
+    (_PROTEIN_IUPAC, "protein-iupac"),
+]
+"""List[Tuple[int, str]]: sequence type flags and names in the order of preference used
+by :py:func:`infer_sequence_type`.
+
+"""
+
+_TYPES_VALUES = sorted(set(_CHARACTER_TYPES.values()))
+"""List[int]: the distinct bitmasks in the translation table.
+
+"""
+
+
+def _sequence_types(seq: AnyStr) -> int:
+    """Find the sequence types whose alphabets contain every character of the sequence.
+
+    The sequence is translated into the bitmask of each character in a single pass.
+    Only a handful of distinct bitmasks exist, so the result is found by combining the
+    bitmasks that are present in the translated sequence.
+
+    Parameters
+    ----------
+    seq : AnyStr
+        The string or bytes to infer the type of.
+
+    Returns
+    -------
+    int
+        Bitmask of the matching sequence types. Empty sequences match no types.
+
+    """
+    if isinstance(seq, str):
+        try:
+            masks = seq.encode("ascii").translate(_TYPES_TABLE)
+        except UnicodeEncodeError:
+            return 0
+    else:
+        masks = seq.translate(_TYPES_TABLE)
+    if len(masks) == 0 or 0 in masks:
+        return 0
+    result = _DNA | _DNA_IUPAC | _RNA | _PROTEIN | _PROTEIN_IUPAC
+    for value in _TYPES_VALUES:
+        if value in masks:
+            result &= value
+    return result
 
 
 def infer_sequence_type(seq: str, report_iupac: bool = True) -> Optional[str]:
@@ -39,18 +133,19 @@ def infer_sequence_type(seq: str, report_iupac: bool = True) -> Optional[str]:
         None if the sequence didn't match any sequence types.
 
     """
-    if dna_bases_validator(seq):
+    types = _sequence_types(seq)
+    if types & _DNA:
         return "dna"
-    elif rna_bases_validator(seq):
+    elif types & _RNA:
         return "rna"
-    elif amino_acids_validator(seq):
+    elif types & _PROTEIN:
         return "protein"
-    elif dna_characters_validator(seq):
+    elif types & _DNA_IUPAC:
         if report_iupac:
             return "dna-iupac"
         else:
             return "dna"
-    elif amino_acids_all_validator(seq):
+    elif types & _PROTEIN_IUPAC:
         if report_iupac:
             return "protein-iupac"
         else:
@@ -84,26 +179,27 @@ def infer_all_sequence_types(seq: str, report_iupac: bool = True) -> Optional[Li
         None if the sequence didn't match any sequence types.
 
     """
+    types = _sequence_types(seq)
     valid = list()
 
-    if dna_bases_validator(seq):
+    if types & _DNA:
         valid.append("dna")
         if report_iupac:
             valid.append("dna-iupac")
-    elif dna_characters_validator(seq):
+    elif types & _DNA_IUPAC:
         if report_iupac:
             valid.append("dna-iupac")
         else:
             valid.append("dna")
 
-    if rna_bases_validator(seq):
+    if types & _RNA:
         valid.append("rna")
 
-    if amino_acids_validator(seq):
+    if types & _PROTEIN:
         valid.append("protein")
         if report_iupac:
             valid.append("protein-iupac")
-    elif amino_acids_all_validator(seq):
+    elif types & _PROTEIN_IUPAC:
         if report_iupac:
             valid.append("protein-iupac")
         else:
@@ -113,3 +209,313 @@ def infer_all_sequence_types(seq: str, report_iupac: bool = True) -> Optional[Li
         return valid
     else:
         return None
+
+
+class SequenceTypeReport(NamedTuple):
+    """Result of :py:func:`~fqfa.util.infer.infer_file_sequence_type`.
+
+    Attributes
+    ----------
+    seq_type : Optional[str]
+        The inferred sequence type of the file, as described for
+        :py:func:`~fqfa.util.infer.infer_sequence_type`, or None if no sampled record
+        matched any sequence type.
+    confidence : float
+        Fraction of the sampled records that match the inferred sequence type.
+    records : int
+        Number of records sampled.
+    conflicts : List[str]
+        Headers of the sampled records that don't match the inferred sequence type.
+    complete : bool
+        True if every record in the file was sampled.
+
+    """
+
+    seq_type: Optional[str]
+    confidence: float
+    records: int
+    conflicts: List[str]
+    complete: bool
+
+
+class _TypeSample:
+    """Accumulator for the sequence types of sampled records.
+
+    Parameters
+    ----------
+    stop_after : int
+        Number of consecutive records that must match the current sequence type without
+        changing it before sampling stops early.
+
+    """
+
+    def __init__(self, stop_after: int) -> None:
+        self.stop_after = stop_after
+        self.records: List[Tuple[bytes, int]] = list()
+        self.counts = [0] * len(_TYPE_PRIORITY)
+        self.flag: Optional[int] = None
+        self.streak = 0
+
+    def best(self) -> Optional[int]:
+        """Find the flag of the sequence type that best matches the sampled records.
+
+        Returns
+        -------
+        Optional[int]
+            The flag of the first type in order of preference that matches every
+            record, or else of the type that matches the most records, or None if no
+            record matches any type.
+
+        """
+        total = len(self.records)
+        if total == 0:
+            return None
+        for (flag, _), count in zip(_TYPE_PRIORITY, self.counts):
+            if count == total:
+                return flag
+        most = max(self.counts)
+        if most == 0:
+            return None
+        return _TYPE_PRIORITY[self.counts.index(most)][0]
+
+    def add(self, header: bytes, seq: bytes) -> bool:
+        """Add a record to the sample.
+
+        Parameters
+        ----------
+        header : bytes
+            The header of the record.
+        seq : bytes
+            The sequence of the record.
+
+        Returns
+        -------
+        bool
+            True if the sequence type has been unchanged for enough consecutive records
+            to stop sampling, else False.
+
+        """
+        types = _sequence_types(seq)
+        self.records.append((header, types))
+        for i, (type_flag, _) in enumerate(_TYPE_PRIORITY):
+            if types & type_flag:
+                self.counts[i] += 1
+
+        flag = self.best()
+        if flag is not None and flag == self.flag and types & flag:
+            self.streak += 1
+        else:
+            self.streak = 0
+        self.flag = flag
+        return self.streak >= self.stop_after
+
+    def report(self, report_iupac: bool, complete: bool) -> SequenceTypeReport:
+        """Create the report for the sampled records.
+
+        Parameters
+        ----------
+        report_iupac : bool
+            If True, report sequence types with extended characters as "<type>-iupac";
+            else report only the sequence type.
+        complete : bool
+            True if every record in the file was sampled.
+
+        Returns
+        -------
+        SequenceTypeReport
+            The report.
+
+        """
+        flag = self.best()
+        if flag is None:
+            conflicts = [header.decode("utf-8", errors="replace") for header, _ in self.records]
+            return SequenceTypeReport(None, 0.0, len(self.records), conflicts, complete)
+
+        seq_type = dict(_TYPE_PRIORITY)[flag]
+        if not report_iupac:
+            seq_type = seq_type.replace("-iupac", "")
+        conflicts = [header.decode("utf-8", errors="replace") for header, types in self.records if not types & flag]
+        confidence = 1.0 - len(conflicts) / len(self.records)
+        return SequenceTypeReport(seq_type, confidence, len(self.records), conflicts, complete)
+
+
+def _record_at(handle: IO[bytes], offset: int) -> Optional[Tuple[int, bytes, bytes]]:
+    """Read the first FASTA record that starts after the given position.
+
+    Parameters
+    ----------
+    handle : IO[bytes]
+        Open seekable binary file handle.
+    offset : int
+        Position in the file. The line containing this position is skipped.
+
+    Returns
+    -------
+    Optional[Tuple[int, bytes, bytes]]
+        Tuple containing the position of the record, its header, and its sequence, or
+        None if no record starts after the position.
+
+    """
+    handle.seek(offset)
+    handle.readline()
+    while True:
+        start = handle.tell()
+        line = handle.readline()
+        if len(line) == 0:
+            return None
+        if line.startswith(b">"):
+            # the parser only iterates over the lines of its handle
+            lines = cast(IO[bytes], chain((line,), handle))
+            header, seq = next(parse_fasta_records(lines))
+            return start, header, seq
+
+
+def _sample_head(handle: IO[bytes], sample: _TypeSample, head: int) -> bool:
+    """Sample the records at the start of a FASTA file.
+
+    Parameters
+    ----------
+    handle : IO[bytes]
+        Open binary file handle positioned at the start of the file.
+    sample : _TypeSample
+        The sample to add the records to.
+    head : int
+        Maximum number of records to read.
+
+    Returns
+    -------
+    bool
+        True if every record in the file was sampled, else False.
+
+    """
+    records = parse_fasta_records(handle)
+    for header, seq in records:
+        if sample.add(header, seq) or len(sample.records) == head:
+            break
+    else:
+        return True
+
+    # the parser has already read the line after the last record it returned, so the
+    # handle is only at the end of the file if at most one header-only record remains
+    peek = getattr(handle, "peek", None)
+    if peek is not None and len(peek(1)) > 0:
+        return False
+    return next(records, None) is None
+
+
+def _sample_random(handle: IO[bytes], sample: _TypeSample, size: int, samples: int, seed: Optional[int]) -> None:
+    """Sample the records starting at random positions in the rest of a FASTA file.
+
+    Parameters
+    ----------
+    handle : IO[bytes]
+        Open seekable binary file handle positioned after the records already sampled.
+    sample : _TypeSample
+        The sample to add the records to.
+    size : int
+        Size of the file in bytes.
+    samples : int
+        Maximum number of random positions to try.
+    seed : Optional[int]
+        Seed for the random positions, or None to use a different sample each time.
+
+    """
+    # the record after the last one read from the start is skipped
+    low = handle.tell()
+    if low >= size:
+        return
+    rng = random.Random(seed)
+    seen = set()
+    sample.streak = 0
+    for _ in range(samples):
+        record = _record_at(handle, rng.randrange(low, size))
+        if record is None or record[0] in seen:
+            continue
+        seen.add(record[0])
+        if sample.add(record[1], record[2]):
+            break
+
+
+def infer_file_sequence_type(
+    path: Union[str, "os.PathLike[str]"],
+    report_iupac: bool = True,
+    head: int = 100,
+    samples: int = 100,
+    stop_after: int = 20,
+    seed: Optional[int] = None,
+) -> SequenceTypeReport:
+    """Infer the sequence type of a FASTA file by sampling its records.
+
+    Records are read from the start of the file using
+    :py:func:`~fqfa.fasta.fasta.parse_fasta_records` until ``head`` records have
+    been read.
+    If the file is not compressed, records starting at random positions in the rest of
+    the file are then sampled until ``samples`` positions have been tried.
+    Compressed files can't be read at random positions without decompressing
+    everything before them, so only the records at the start are sampled.
+
+    Each phase stops early once ``stop_after`` consecutive records have matched the
+    sequence type without changing it, so only a small part of a large file is read.
+    Use a ``stop_after`` greater than ``head + samples`` to always sample the
+    maximum number of records.
+
+    The file's sequence type is the first type that matches every sampled record, in
+    the same order of preference as :py:func:`~fqfa.util.infer.infer_sequence_type`.
+    For example, a DNA file with a B in a single record is "dna-iupac", and a protein
+    file with some records that only contain A, C, G, and T is "protein".
+    As for individual sequences, a DNA file containing N bases is "protein", because N
+    is also the code for asparagine.
+    If no type matches every sampled record, the type matching the most records is
+    reported, and the records that don't match it are listed as conflicts.
+
+    Parameters
+    ----------
+    path : Union[str, os.PathLike[str]]
+        Path to the FASTA file, which may be compressed.
+    report_iupac : bool
+        If True, report sequence types with extended characters as "<type>-iupac";
+        else report only the sequence type.
+    head : int
+        Maximum number of records to read from the start of the file. Default 100.
+    samples : int
+        Maximum number of random positions to sample after the first records.
+        Default 100.
+    stop_after : int
+        Number of consecutive records matching the sequence type needed to stop each
+        phase early. Default 20.
+    seed : Optional[int]
+        Seed for the random positions, or None to use a different sample each time.
+
+    Returns
+    -------
+    SequenceTypeReport
+        The inferred sequence type and details of the sampled records.
+
+    Raises
+    ------
+    ValueError
+        If head or stop_after is less than 1, or samples is negative.
+    FileNotFoundError
+        If path does not correspond to a file.
+
+    """
+    if head < 1:
+        raise ValueError("head must be at least 1")
+    if samples < 0:
+        raise ValueError("samples must be non-negative")
+    if stop_after < 1:
+        raise ValueError("stop_after must be at least 1")
+    if not os.path.isfile(path):
+        raise FileNotFoundError("could not find file to open")
+
+    with open(path, mode="rb") as f:
+        compression = _detect_compression(f)
+
+    sample = _TypeSample(stop_after)
+    handle: IO[bytes]
+    with open(path, mode="rb") if compression is None else open_compressed(path, mode="rb") as handle:
+        complete = _sample_head(handle, sample, head)
+        if not complete and compression is None and samples > 0:
+            _sample_random(handle, sample, os.path.getsize(path), samples, seed)
+
+    return sample.report(report_iupac, complete)
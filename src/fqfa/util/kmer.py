@@ -0,0 +1,407 @@
+"""Functions and classes for extracting and counting k-mers using 2-bit integer encoding.
+
+"""
+
+from typing import AnyStr, Dict, Generator, List, Tuple, Optional, Any
+from fqfa.constants.iupac.dna import DNA_BASES, DNA_COMPLEMENTS
+
+try:
+    import numpy as _np
+except ImportError:  # pragma: no cover
+    _np = None  # type: ignore[assignment]
+
+__all__ = ["encode_kmer", "decode_kmer", "kmer_codes", "KmerCounter"]
+
+_BREAK_CODE = 4
+"""int: code for characters that are not DNA bases, which break k-mers.
+
+"""
+
+_CODE_TABLE = bytes(DNA_BASES.index(chr(i)) if chr(i) in DNA_BASES else _BREAK_CODE for i in range(256))
+"""bytes: translation table from ASCII characters to 2-bit base codes, with all
+non-base characters translated to the break code.
+
+"""
+
+_COMPLEMENT_CODES = [DNA_BASES.index(DNA_COMPLEMENTS[b]) for b in DNA_BASES]
+"""List[int]: code of the complement of each base code.
+
+"""
+
+_MAX_NUMPY_K = 32
+"""int: largest k-mer size that fits in an unsigned 64-bit integer.
+
+"""
+
+_NUMPY_BATCH_SIZE = 1 << 20
+"""int: number of buffered bases that triggers k-mer extraction in the NumPy counter.
+
+"""
+
+_NUMPY_COMPACT_SIZE = 1 << 23
+"""int: number of uncounted k-mers that triggers sorting and counting in the NumPy
+counter.
+
+"""
+
+
+def _to_codes(seq: AnyStr) -> bytes:
+    """Translate a sequence into a byte string of base codes.
+
+    Parameters
+    ----------
+    seq : AnyStr
+        String or bytes-like object containing DNA bases.
+
+    Returns
+    -------
+    bytes
+        The code of each base, with non-base characters translated to the break code.
+
+    """
+    if isinstance(seq, str):
+        data = seq.encode("ascii", errors="replace")
+    else:
+        data = bytes(seq)
+    return data.translate(_CODE_TABLE)
+
+
+def encode_kmer(kmer: AnyStr) -> int:
+    """Encode a k-mer as an integer using 2 bits per base.
+
+    Bases are encoded in the order of :py:data:`~fqfa.constants.iupac.dna.DNA_BASES`
+    (A=0, C=1, G=2, T=3), with the first base in the most significant bits.
+    Together with the k-mer length, the integer uniquely identifies the k-mer, and
+    sorting the integers sorts the k-mers lexicographically.
+
+    Parameters
+    ----------
+    kmer : AnyStr
+        String or bytes-like object containing DNA bases.
+
+    Returns
+    -------
+    int
+        The encoded k-mer.
+
+    Raises
+    ------
+    ValueError
+        If the k-mer contains characters other than A, C, G, or T.
+
+    """
+    code = 0
+    for c in _to_codes(kmer):
+        if c == _BREAK_CODE:
+            raise ValueError("unexpected characters in k-mer")
+        code = (code << 2) | c
+    return code
+
+
+def decode_kmer(code: int, k: int) -> str:
+    """Decode an integer created by :py:func:`~fqfa.util.kmer.encode_kmer`.
+
+    Parameters
+    ----------
+    code : int
+        The encoded k-mer.
+    k : int
+        The length of the k-mer.
+
+    Returns
+    -------
+    str
+        The k-mer.
+
+    """
+    return "".join([DNA_BASES[(code >> (2 * (k - 1 - i))) & 3] for i in range(k)])
+
+
+def kmer_codes(seq: AnyStr, k: int, canonical: bool = False) -> Generator[int, None, None]:
+    """Generator function that returns the encoded k-mers in a sequence.
+
+    The k-mers are encoded as described for :py:func:`~fqfa.util.kmer.encode_kmer`
+    using a rolling encoding, so each base is processed only once.
+    Characters other than A, C, G, and T (such as N, ambiguity characters, and lower
+    case bases) break the sequence, so no k-mer containing them is returned.
+
+    If ``canonical`` is True, each k-mer is returned as the smaller of its own encoding
+    and the encoding of its reverse complement (as produced by
+    :py:func:`~fqfa.util.nucleotide.reverse_complement`), so a k-mer and its reverse
+    complement are counted together.
+
+    Parameters
+    ----------
+    seq : AnyStr
+        String or bytes-like object containing DNA bases.
+    k : int
+        The length of the k-mers.
+    canonical : bool
+        If True, return canonical k-mers. Default False.
+
+    Yields
+    -------
+    int
+        The encoded k-mer at each valid position, in sequence order.
+
+    Raises
+    ------
+    ValueError
+        If k is less than 1.
+
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+
+    mask = (1 << (2 * k)) - 1
+    shift = 2 * (k - 1)
+    fwd = 0
+    rev = 0
+    length = 0
+    for c in _to_codes(seq):
+        if c == _BREAK_CODE:
+            length = 0
+            continue
+        fwd = ((fwd << 2) | c) & mask
+        length += 1
+        if canonical:
+            rev = (rev >> 2) | (_COMPLEMENT_CODES[c] << shift)
+            if length >= k:
+                yield fwd if fwd < rev else rev
+        elif length >= k:
+            yield fwd
+
+
+def _numpy_kmer_codes(codes: bytes, k: int, canonical: bool) -> Any:
+    """Find the encoded k-mers in a byte string of base codes using NumPy.
+
+    Parameters
+    ----------
+    codes : bytes
+        Base codes produced by :py:func:`_to_codes`.
+    k : int
+        The length of the k-mers.
+    canonical : bool
+        If True, return canonical k-mers.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of unsigned 64-bit encoded k-mers, in sequence order.
+
+    """
+    array = _np.frombuffer(codes, dtype=_np.uint8)
+    n = len(array) - k + 1
+    if n < 1:
+        return _np.zeros(0, dtype=_np.uint64)
+
+    invalid = array == _BREAK_CODE
+    breaks = _np.concatenate(([0], _np.cumsum(invalid)))
+    valid = breaks[k:] == breaks[:-k]
+
+    bases = _np.where(invalid, 0, array).astype(_np.uint64)
+    fwd = _np.zeros(n, dtype=_np.uint64)
+    for j in range(k):
+        fwd = (fwd << _np.uint64(2)) | bases[j : j + n]
+    if canonical:
+        complements = _np.uint64(3) - bases
+        rev = _np.zeros(n, dtype=_np.uint64)
+        for j in range(k):
+            rev |= complements[j : j + n] << _np.uint64(2 * j)
+        fwd = _np.minimum(fwd, rev)
+    return fwd[valid]
+
+
+def _run_lengths(values: Any, counts: Any) -> Tuple[Any, Any]:
+    """Combine the counts of equal values in a sorted array.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Sorted, non-empty array of values.
+    counts : numpy.ndarray
+        Count of each value.
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        Array of unique values and array of their total counts.
+
+    """
+    starts = _np.flatnonzero(_np.concatenate(([True], values[1:] != values[:-1])))
+    return values[starts], _np.add.reduceat(counts, starts)
+
+
+class KmerCounter:
+    """Counter for the k-mers in many sequences.
+
+    k-mers are extracted as described for :py:func:`~fqfa.util.kmer.kmer_codes` and
+    counted by their integer encoding.
+
+    If NumPy is available, it is used by default.
+    Sequences are buffered and their k-mers are extracted in large batches using
+    vectorized operations, then counted by sorting and merging runs of equal values.
+    Memory use depends on the number of distinct k-mers rather than the number of
+    sequences.
+    Otherwise, k-mers are counted using a dictionary.
+
+    Parameters
+    ----------
+    k : int
+        The length of the k-mers.
+    canonical : bool
+        If True, count canonical k-mers. Default False.
+    use_numpy : Optional[bool]
+        If True, count using NumPy; if False, count using a dictionary. If None (the
+        default), NumPy is used if it is installed.
+
+    Raises
+    ------
+    ValueError
+        If k is less than 1.
+    ValueError
+        If k is greater than 32 and NumPy is used.
+    NotImplementedError
+        If NumPy is requested but not installed.
+
+    """
+
+    def __init__(self, k: int, canonical: bool = False, use_numpy: Optional[bool] = None) -> None:
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if use_numpy is None:
+            use_numpy = _np is not None and k <= _MAX_NUMPY_K
+        if use_numpy:
+            if _np is None:
+                raise NotImplementedError("NumPy support requires the numpy package")
+            if k > _MAX_NUMPY_K:
+                raise ValueError(f"k must be at most {_MAX_NUMPY_K} when using NumPy")
+
+        self.k = k
+        self.canonical = canonical
+        self._use_numpy = use_numpy
+        self._counts: Dict[int, int] = dict()
+        self._pending: List[bytes] = list()
+        self._pending_size = 0
+        self._uncounted: List[Any] = list()
+        self._uncounted_size = 0
+        if use_numpy:
+            self._values = _np.zeros(0, dtype=_np.uint64)
+            self._value_counts = _np.zeros(0, dtype=_np.int64)
+
+    def update(self, seq: AnyStr) -> None:
+        """Count the k-mers in a sequence.
+
+        Parameters
+        ----------
+        seq : AnyStr
+            String or bytes-like object containing DNA bases.
+
+        Returns
+        -------
+        None
+
+        """
+        if not self._use_numpy:
+            counts = self._counts
+            for code in kmer_codes(seq, self.k, self.canonical):
+                counts[code] = counts.get(code, 0) + 1
+            return
+
+        codes = _to_codes(seq)
+        self._pending.append(codes)
+        self._pending_size += len(codes)
+        if self._pending_size >= _NUMPY_BATCH_SIZE:
+            self._extract()
+
+    def _extract(self) -> None:
+        """Extract the k-mers from the buffered sequences."""
+        if len(self._pending) == 0:
+            return
+        # the separating break code prevents k-mers spanning two sequences
+        kmers = _numpy_kmer_codes(bytes([_BREAK_CODE]).join(self._pending), self.k, self.canonical)
+        self._pending.clear()
+        self._pending_size = 0
+        self._uncounted.append(kmers)
+        self._uncounted_size += len(kmers)
+        if self._uncounted_size >= _NUMPY_COMPACT_SIZE:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Merge the uncounted k-mers into the sorted arrays of values and counts."""
+        if len(self._uncounted) == 0:
+            return
+        values = _np.sort(_np.concatenate(self._uncounted))
+        self._uncounted.clear()
+        self._uncounted_size = 0
+        if len(values) == 0:
+            return
+        values, counts = _run_lengths(values, _np.ones(len(values), dtype=_np.int64))
+
+        if len(self._values) > 0:
+            values = _np.concatenate([self._values, values])
+            counts = _np.concatenate([self._value_counts, counts])
+            order = _np.argsort(values)
+            values, counts = _run_lengths(values[order], counts[order])
+        self._values = values
+        self._value_counts = counts
+
+    def counts(self) -> Dict[int, int]:
+        """Return the number of times each k-mer was seen.
+
+        Returns
+        -------
+        Dict[int, int]
+            Dictionary mapping encoded k-mers to counts. Use
+            :py:func:`~fqfa.util.kmer.decode_kmer` to convert the keys to strings.
+
+        """
+        if not self._use_numpy:
+            return dict(self._counts)
+        self._extract()
+        self._compact()
+        return dict(zip(self._values.tolist(), self._value_counts.tolist()))
+
+    def arrays(self) -> Tuple[Any, Any]:
+        """Return the k-mers and their counts as NumPy arrays.
+
+        For large numbers of distinct k-mers this is much faster than
+        :py:meth:`~fqfa.util.kmer.KmerCounter.counts`, because no Python objects are
+        created for the individual k-mers.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray]
+            Sorted array of unsigned 64-bit encoded k-mers and array of their counts.
+
+        Raises
+        ------
+        NotImplementedError
+            If the counter does not use NumPy.
+
+        """
+        if not self._use_numpy:
+            raise NotImplementedError("k-mer arrays require a counter that uses NumPy")
+        self._extract()
+        self._compact()
+        return self._values.copy(), self._value_counts.copy()
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Return the most frequent k-mers and their counts.
+
+        Parameters
+        ----------
+        n : Optional[int]
+            Number of k-mers to return, or None to return all k-mers.
+
+        Returns
+        -------
+        List[Tuple[int, int]]
+            List of encoded k-mer and count tuples, from most to least common. k-mers
+            with equal counts are ordered by their encoding.
+
+        """
+        result = sorted(self.counts().items(), key=lambda x: (-x[1], x[0]))
+        if n is not None:
+            result = result[:n]
+        return result
@@ -2,80 +2,391 @@
 
 """
 
+from typing import AnyStr, Any, Union, Sequence, List, Mapping, overload
 from fqfa.constants.iupac.dna import DNA_COMPLEMENTS
 
-__all__ = ["reverse_complement", "convert_rna_to_dna", "convert_dna_to_rna"]
+__all__ = [
+    "reverse_complement",
+    "convert_rna_to_dna",
+    "convert_dna_to_rna",
+    "reverse_complement_inplace",
+    "convert_rna_to_dna_inplace",
+    "convert_dna_to_rna_inplace",
+    "reverse_complement_batch",
+    "convert_rna_to_dna_batch",
+    "convert_dna_to_rna_batch",
+]
 
 _DNA_COMPLEMENTS_TRANS = str.maketrans(DNA_COMPLEMENTS)
-"""Mapping[int, str]: translation table for complementing DNA bases, including IUPAC
+"""Dict[int, str]: translation table for complementing DNA bases, including IUPAC
+ambiguity characters.
+
+"""
+
+_DNA_COMPLEMENTS_BYTES_TRANS = bytes.maketrans(
+    "".join(DNA_COMPLEMENTS.keys()).encode("ascii"), "".join(DNA_COMPLEMENTS.values()).encode("ascii")
+)
+"""bytes: translation table for complementing DNA bases in byte strings, including IUPAC
 ambiguity characters.
 
 """
 
 _RNA_DNA_TRANS = str.maketrans("U", "T")
-"""Mapping[int, str]: translation table for converting U bases to T bases in RNA
+"""Dict[int, int]: translation table for converting U bases to T bases in RNA
 sequences.
 
 """
 
+_RNA_DNA_BYTES_TRANS = bytes.maketrans(b"U", b"T")
+"""bytes: translation table for converting U bases to T bases in RNA byte strings.
+
+"""
+
 _DNA_RNA_TRANS = str.maketrans("T", "U")
-"""Mapping[int, str]: translation table for converting T bases to U bases in DNA
+"""Dict[int, int]: translation table for converting T bases to U bases in DNA
 sequences.
 
 """
 
+_DNA_RNA_BYTES_TRANS = bytes.maketrans(b"T", b"U")
+"""bytes: translation table for converting T bases to U bases in DNA byte strings.
+
+"""
+
+
+def _translate(seq: Any, table: Mapping[int, Union[int, str]], bytes_table: bytes, reverse: bool) -> Any:
+    """Translate a string or bytes-like object, optionally reversing it first.
+
+    Parameters
+    ----------
+    seq : Any
+        String, bytes, bytearray, or memoryview.
+    table : Mapping[int, Union[int, str]]
+        Translation table used for strings.
+    bytes_table : bytes
+        Translation table used for bytes-like objects.
+    reverse : bool
+        If True, also reverse the sequence.
+
+    Returns
+    -------
+    Any
+        The translated string, bytes, or bytearray. Memoryviews are returned as bytes.
+
+    """
+    if reverse:
+        seq = seq[::-1]
+    if isinstance(seq, str):
+        return seq.translate(table)
+    if isinstance(seq, memoryview):
+        seq = seq.tobytes()
+    return seq.translate(bytes_table)
+
+
+def _translate_inplace(seq: Union[bytearray, memoryview], bytes_table: bytes, reverse: bool) -> None:
+    """Translate a bytearray or writable memoryview in place, optionally reversing it.
+
+    Parameters
+    ----------
+    seq : Union[bytearray, memoryview]
+        Sequence to modify.
+    bytes_table : bytes
+        Translation table.
+    reverse : bool
+        If True, also reverse the sequence.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    TypeError
+        If the sequence is not a bytearray or a writable memoryview.
+
+    """
+    data: Union[bytes, bytearray]
+    if isinstance(seq, memoryview):
+        if seq.readonly:
+            raise TypeError("cannot modify read-only memory")
+        data = seq.tobytes().translate(bytes_table)
+    elif isinstance(seq, bytearray):
+        data = seq.translate(bytes_table)
+    else:
+        raise TypeError("in-place operations require a bytearray or memoryview")
+
+    if reverse:
+        seq[::-1] = data
+    else:
+        seq[:] = data
+
 
-def reverse_complement(seq: str) -> str:
+def _translate_batch(
+    seqs: Sequence[Any], table: Mapping[int, Union[int, str]], bytes_table: bytes, reverse: bool
+) -> List[Any]:
+    """Translate a batch of sequences, optionally reversing each one.
+
+    The sequences are joined into a single buffer with newline separators so that the
+    translation (and reversal) is performed once for the whole batch.
+    If any sequence contains a newline, the sequences are processed individually
+    instead.
+
+    Parameters
+    ----------
+    seqs : Sequence[Any]
+        Strings or bytes-like objects. All must be strings or all bytes-like.
+    table : Mapping[int, str]
+        Translation table used for strings.
+    bytes_table : bytes
+        Translation table used for bytes-like objects.
+    reverse : bool
+        If True, also reverse each sequence.
+
+    Returns
+    -------
+    List[Any]
+        The translated strings or bytes, in input order.
+
+    """
+    if len(seqs) == 0:
+        return list()
+
+    result: List[Any]
+    if isinstance(seqs[0], str):
+        joined = "\n".join(seqs)
+        if reverse:
+            joined = joined[::-1]
+        result = joined.translate(table).split("\n")
+    else:
+        joined_bytes = b"\n".join(seqs)
+        if reverse:
+            joined_bytes = joined_bytes[::-1]
+        result = joined_bytes.translate(bytes_table).split(b"\n")
+
+    if len(result) != len(seqs):  # a sequence contained the separator
+        return [_translate(seq, table, bytes_table, reverse) for seq in seqs]
+
+    if reverse:
+        result.reverse()
+    return result
+
+
+@overload
+def reverse_complement(seq: str) -> str: ...
+
+
+@overload
+def reverse_complement(seq: bytearray) -> bytearray: ...
+
+
+@overload
+def reverse_complement(seq: Union[bytes, memoryview]) -> bytes: ...
+
+
+def reverse_complement(seq: Union[str, bytes, bytearray, memoryview]) -> Union[str, bytes, bytearray]:
     """Reverse-complement a DNA sequence string and return it.
 
     If a character not in fqfa.iupac.dna.DNA_CHARACTERS is encountered, it is retained.
+    Bytes-like objects are also accepted, in which case the result is bytes (or a
+    bytearray if the input is a bytearray).
 
     Parameters
     ----------
-    seq : str
-        String containing DNA bases.
+    seq : Union[str, bytes, bytearray, memoryview]
+        String or bytes-like object containing DNA bases.
 
     Returns
     -------
-    str
+    Union[str, bytes, bytearray]
         The reverse complement DNA sequence.
 
     """
-    rev_seq = seq[::-1].translate(_DNA_COMPLEMENTS_TRANS)
-    return rev_seq
+    return _translate(seq, _DNA_COMPLEMENTS_TRANS, _DNA_COMPLEMENTS_BYTES_TRANS, reverse=True)
 
 
-def convert_rna_to_dna(seq: str) -> str:
+def convert_rna_to_dna(seq: AnyStr) -> AnyStr:
     """Convert an RNA sequence into a DNA sequence by changing "U" to "T".
 
+    Bytes-like objects are also accepted, as described for
+    :py:func:`~fqfa.util.nucleotide.reverse_complement`.
+
     Parameters
     ----------
-    seq : str
-        String containing RNA bases.
+    seq : AnyStr
+        String or bytes-like object containing RNA bases.
 
     Returns
     -------
-    str
+    AnyStr
         The equivalent DNA sequence.
 
     """
-    dna_seq = seq.translate(_RNA_DNA_TRANS)
-    return dna_seq
+    return _translate(seq, _RNA_DNA_TRANS, _RNA_DNA_BYTES_TRANS, reverse=False)
 
 
-def convert_dna_to_rna(seq: str) -> str:
+def convert_dna_to_rna(seq: AnyStr) -> AnyStr:
     """Convert a DNA sequence into a RNA sequence by changing "T" to "U".
 
+    Bytes-like objects are also accepted, as described for
+    :py:func:`~fqfa.util.nucleotide.reverse_complement`.
+
     Parameters
     ----------
-    seq : str
-        String containing DNA bases.
+    seq : AnyStr
+        String or bytes-like object containing DNA bases.
 
     Returns
     -------
-    str
+    AnyStr
         The equivalent RNA sequence.
 
     """
-    rna_seq = seq.translate(_DNA_RNA_TRANS)
-    return rna_seq
+    return _translate(seq, _DNA_RNA_TRANS, _DNA_RNA_BYTES_TRANS, reverse=False)
+
+
+def reverse_complement_inplace(seq: Union[bytearray, memoryview]) -> None:
+    """Reverse-complement a DNA sequence stored in a bytearray or writable memoryview
+    in place.
+
+    A memoryview can be used to reverse-complement part of a larger buffer.
+
+    Parameters
+    ----------
+    seq : Union[bytearray, memoryview]
+        Sequence to modify.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    TypeError
+        If the sequence is not a bytearray or a writable memoryview.
+
+    """
+    _translate_inplace(seq, _DNA_COMPLEMENTS_BYTES_TRANS, reverse=True)
+
+
+def convert_rna_to_dna_inplace(seq: Union[bytearray, memoryview]) -> None:
+    """Convert an RNA sequence stored in a bytearray or writable memoryview into a DNA
+    sequence in place.
+
+    Parameters
+    ----------
+    seq : Union[bytearray, memoryview]
+        Sequence to modify.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    TypeError
+        If the sequence is not a bytearray or a writable memoryview.
+
+    """
+    _translate_inplace(seq, _RNA_DNA_BYTES_TRANS, reverse=False)
+
+
+def convert_dna_to_rna_inplace(seq: Union[bytearray, memoryview]) -> None:
+    """Convert a DNA sequence stored in a bytearray or writable memoryview into an RNA
+    sequence in place.
+
+    Parameters
+    ----------
+    seq : Union[bytearray, memoryview]
+        Sequence to modify.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    TypeError
+        If the sequence is not a bytearray or a writable memoryview.
+
+    """
+    _translate_inplace(seq, _DNA_RNA_BYTES_TRANS, reverse=False)
+
+
+@overload
+def reverse_complement_batch(seqs: Sequence[str]) -> List[str]: ...
+
+
+@overload
+def reverse_complement_batch(seqs: Sequence[Union[bytes, bytearray, memoryview]]) -> List[bytes]: ...
+
+
+@overload
+def reverse_complement_batch(seqs: Sequence[Union[str, bytes]]) -> List[Union[str, bytes]]: ...
+
+
+def reverse_complement_batch(
+    seqs: Sequence[Union[str, bytes, bytearray, memoryview]],
+) -> Union[List[str], List[bytes], List[Union[str, bytes]]]:
+    """Reverse-complement many DNA sequences at once.
+
+    This gives the same result as calling
+    :py:func:`~fqfa.util.nucleotide.reverse_complement` on each sequence, but the batch
+    is joined into a single buffer that is reversed and complemented with one operation
+    each, which is faster for large numbers of short sequences such as reads.
+
+    Parameters
+    ----------
+    seqs : Sequence[Union[str, bytes, bytearray, memoryview]]
+        Strings or bytes-like objects containing DNA bases. All must be strings or all
+        bytes-like.
+
+    Returns
+    -------
+    Union[List[str], List[bytes]]
+        The reverse complement DNA sequences, in input order. Bytes-like input returns
+        bytes.
+
+    """
+    return _translate_batch(seqs, _DNA_COMPLEMENTS_TRANS, _DNA_COMPLEMENTS_BYTES_TRANS, reverse=True)
+
+
+def convert_rna_to_dna_batch(seqs: Sequence[AnyStr]) -> List[AnyStr]:
+    """Convert many RNA sequences into DNA sequences at once.
+
+    The batch is processed as described for
+    :py:func:`~fqfa.util.nucleotide.reverse_complement_batch`.
+
+    Parameters
+    ----------
+    seqs : Sequence[AnyStr]
+        Strings or bytes-like objects containing RNA bases. All must be strings or all
+        bytes-like.
+
+    Returns
+    -------
+    List[AnyStr]
+        The equivalent DNA sequences, in input order.
+
+    """
+    return _translate_batch(seqs, _RNA_DNA_TRANS, _RNA_DNA_BYTES_TRANS, reverse=False)
+
+
+def convert_dna_to_rna_batch(seqs: Sequence[AnyStr]) -> List[AnyStr]:
+    """Convert many DNA sequences into RNA sequences at once.
+
+    The batch is processed as described for
+    :py:func:`~fqfa.util.nucleotide.reverse_complement_batch`.
+
+    Parameters
+    ----------
+    seqs : Sequence[AnyStr]
+        Strings or bytes-like objects containing DNA bases. All must be strings or all
+        bytes-like.
+
+    Returns
+    -------
+    List[AnyStr]
+        The equivalent RNA sequences, in input order.
+
+    """
+    return _translate_batch(seqs, _DNA_RNA_TRANS, _DNA_RNA_BYTES_TRANS, reverse=False)
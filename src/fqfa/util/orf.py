@@ -0,0 +1,264 @@
+"""Functions for finding open reading frames in DNA sequences.
+
+"""
+
+import re
+from typing import Dict, Generator, Iterable, List, NamedTuple, Optional, Pattern, Tuple, Union
+from fqfa.util.nucleotide import reverse_complement
+from fqfa.util.translate import TranslationTable, _compile_table
+
+__all__ = ["Orf", "find_orfs", "find_orfs_in_records"]
+
+
+class Orf(NamedTuple):
+    """Open reading frame found by :py:func:`~fqfa.util.orf.find_orfs`.
+
+    Coordinates are zero-based, half-open positions on the input sequence, so
+    ``seq[start:end]`` contains the open reading frame for the forward strand and its
+    reverse complement for the reverse strand.
+
+    Attributes
+    ----------
+    start : int
+        Position of the first base. For the reverse strand, this is the last base of
+        the stop codon (or of the last full codon if there is no stop codon).
+    end : int
+        Position after the last base. For the reverse strand, this is the position
+        after the first base of the start codon.
+    strand : str
+        "+" for the forward strand or "-" for the reverse strand.
+    frame : int
+        Frame on the strand, as used by :py:func:`~fqfa.util.translate.translate_dna`.
+    protein : str
+        Amino acid sequence from the start codon up to but not including the stop
+        codon. The start codon is always translated as 'M', including alternative start
+        codons such as TTG.
+    has_stop : bool
+        True if the open reading frame ends with a stop codon, False if it runs off the
+        end of the sequence.
+
+    """
+
+    start: int
+    end: int
+    strand: str
+    frame: int
+    protein: str
+    has_stop: bool
+
+
+def _start_pattern(table: TranslationTable) -> Optional[Pattern[str]]:
+    """Create a regular expression that matches the amino acids encoded by start codons.
+
+    Only positions matching the expression need to be checked for a start codon.
+
+    Parameters
+    ----------
+    table : TranslationTable
+        The translation table.
+
+    Returns
+    -------
+    Optional[Pattern[str]]
+        The compiled regular expression or None if the table has no start codons.
+
+    """
+    aas = sorted({table[codon] for codon in table.starts if codon in table})
+    if len(aas) == 0:
+        return None
+    return re.compile("[" + "".join(re.escape(aa) for aa in aas) + "]")
+
+
+def _translate_frames(seq: str, rev_seq: str, table: TranslationTable) -> List[str]:
+    """Translate a sequence in all six frames, translating unrecognized codons as 'X'.
+
+    Parameters
+    ----------
+    seq : str
+        String containing DNA bases to translate.
+    rev_seq : str
+        The reverse complement of the sequence.
+    table : TranslationTable
+        The translation table.
+
+    Returns
+    -------
+    List[str]
+        The amino acid sequences, as described for
+        :py:func:`~fqfa.util.translate.translate_six_frames`.
+
+    """
+    try:
+        return table.translate_six_frames(seq)
+    except KeyError:  # sequence contains N or other characters
+        get = table.get
+        return [
+            "".join([get(x[i : i + 3], "X") for i in range(frame, len(x) - 2, 3)])
+            for x in (seq, rev_seq)
+            for frame in range(3)
+        ]
+
+
+def _find_orfs(
+    seq: str,
+    table: TranslationTable,
+    pattern: Optional[Pattern[str]],
+    min_length: int,
+    require_stop: bool,
+    both_strands: bool,
+) -> List[Orf]:
+    """Find the open reading frames in a sequence.
+
+    See :py:func:`~fqfa.util.orf.find_orfs` for details.
+
+    Parameters
+    ----------
+    seq : str
+        String containing DNA bases.
+    table : TranslationTable
+        The translation table.
+    pattern : Optional[Pattern[str]]
+        The result of :py:func:`_start_pattern` for the table.
+    min_length : int
+        Minimum length in bases.
+    require_stop : bool
+        If True, only report open reading frames that end with a stop codon.
+    both_strands : bool
+        If True, also search the reverse strand.
+
+    Returns
+    -------
+    List[Orf]
+        The open reading frames sorted by position.
+
+    """
+    result: List[Orf] = list()
+    if pattern is None:
+        return result
+
+    seq = seq.upper()
+    rev_seq = reverse_complement(seq)
+    frames = _translate_frames(seq, rev_seq, table)
+    length = len(seq)
+    starts = table.starts
+
+    for i, protein in enumerate(frames if both_strands else frames[:3]):
+        strand_seq, strand, frame = (seq, "+", i) if i < 3 else (rev_seq, "-", i - 3)
+        segment_start = 0
+        while segment_start < len(protein):
+            stop = protein.find("*", segment_start)
+            has_stop = stop >= 0
+            segment_end = stop if has_stop else len(protein)
+            if has_stop or not require_stop:
+                # the first start codon in the segment gives the longest open reading frame
+                for match in pattern.finditer(protein, segment_start, segment_end):
+                    pos = frame + 3 * match.start()
+                    if strand_seq[pos : pos + 3] in starts:
+                        end = frame + 3 * (segment_end + has_stop)
+                        if end - pos >= min_length:
+                            if strand == "-":
+                                pos, end = length - end, length - pos
+                            # start codons are translated as methionine when they initiate translation
+                            protein_seq = "M" + protein[match.start() + 1 : segment_end]
+                            result.append(Orf(pos, end, strand, frame, protein_seq, has_stop))
+                        break
+            segment_start = segment_end + 1
+
+    result.sort()
+    return result
+
+
+def find_orfs(
+    seq: str,
+    table: Optional[Union[Dict[str, str], TranslationTable]] = None,
+    min_length: int = 75,
+    require_stop: bool = True,
+    both_strands: bool = True,
+) -> List[Orf]:
+    """Find the open reading frames in a DNA sequence.
+
+    The sequence is translated in all six frames using
+    :py:func:`~fqfa.util.translate.translate_six_frames`.
+    In each frame, an open reading frame starts at the first start codon after the
+    previous stop codon and ends with the next stop codon, so open reading frames
+    nested inside longer ones in the same frame are not reported.
+
+    Start codons are taken from the translation table, so tables created by
+    :py:func:`~fqfa.util.translate.ncbi_genetic_code_to_table` use the alternative
+    start codons from the NCBI `Starts` row.
+    The default table and dictionaries use ATG as the only start codon.
+
+    The sequence is converted to upper case, and codons that are not in the table (such
+    as codons containing N) are translated as 'X' and are neither start nor stop codons.
+
+    Parameters
+    ----------
+    seq : str
+        String containing DNA bases.
+    table : Optional(Union[Dict[str, str], TranslationTable])
+        Map from codon strings to single-letter amino acid codes or `None` to use the
+        default translation table.
+    min_length : int
+        Minimum length of an open reading frame in bases, including the stop codon.
+        Default 75.
+    require_stop : bool
+        If True (the default), only report open reading frames that end with a stop
+        codon. If False, also report open reading frames that run off the end of the
+        sequence.
+    both_strands : bool
+        If True (the default), search both strands. If False, only search the forward
+        strand.
+
+    Returns
+    -------
+    List[Orf]
+        The open reading frames sorted by position.
+
+    """
+    table = _compile_table(table, False)
+    return _find_orfs(seq, table, _start_pattern(table), min_length, require_stop, both_strands)
+
+
+def find_orfs_in_records(
+    records: Iterable[Tuple[str, str]],
+    table: Optional[Union[Dict[str, str], TranslationTable]] = None,
+    min_length: int = 75,
+    require_stop: bool = True,
+    both_strands: bool = True,
+) -> Generator[Tuple[str, Orf], None, None]:
+    """Generator function that returns the open reading frames in each of many records.
+
+    This is intended for processing the output of
+    :py:func:`~fqfa.fasta.fasta.parse_fasta_records` for transcript or assembly files.
+    Records are processed one at a time as they are read, so large files are never
+    held in memory, and the translation table is only prepared once.
+
+    Parameters
+    ----------
+    records : Iterable[Tuple[str, str]]
+        Tuples of header and sequence.
+    table : Optional(Union[Dict[str, str], TranslationTable])
+        Map from codon strings to single-letter amino acid codes or `None` to use the
+        default translation table.
+    min_length : int
+        Minimum length of an open reading frame in bases, including the stop codon.
+        Default 75.
+    require_stop : bool
+        If True (the default), only report open reading frames that end with a stop
+        codon.
+    both_strands : bool
+        If True (the default), search both strands.
+
+    Yields
+    -------
+    Tuple[str, Orf]
+        The header of the record and an open reading frame, as described for
+        :py:func:`~fqfa.util.orf.find_orfs`.
+
+    """
+    table = _compile_table(table, False)
+    pattern = _start_pattern(table)
+
+    for header, seq in records:
+        for orf in _find_orfs(seq, table, pattern, min_length, require_stop, both_strands):
+            yield header, orf
@@ -0,0 +1,181 @@
+"""Functions for processing records in parallel using a pool of processes.
+
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future
+from functools import partial
+from itertools import islice
+from typing import Callable, Iterable, Generator, List, Tuple, Optional, TextIO, TypeVar, Deque, Any
+from fqfa.fasta.fasta import parse_fasta_records
+
+__all__ = ["parallel_map", "parallel_map_fasta_records"]
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _apply_batch(func: Callable[[T], R], batch: List[T]) -> List[R]:
+    """Apply a function to every item in a batch. Runs in the worker processes.
+
+    Parameters
+    ----------
+    func : Callable[[T], R]
+        Function to apply.
+    batch : List[T]
+        Items to process.
+
+    Returns
+    -------
+    List[R]
+        Results in the same order as the batch.
+
+    """
+    return [func(x) for x in batch]
+
+
+def _apply_to_sequence(func: Callable[[str], R], record: Tuple[str, str]) -> Tuple[str, R]:
+    """Apply a function to the sequence of a FASTA record, keeping the header.
+
+    Parameters
+    ----------
+    func : Callable[[str], R]
+        Function to apply to the sequence.
+    record : Tuple[str, str]
+        Header and sequence tuple.
+
+    Returns
+    -------
+    Tuple[str, R]
+        Header and result tuple.
+
+    """
+    header, seq = record
+    return header, func(seq)
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    processes: Optional[int] = None,
+    batch_size: int = 1000,
+    max_pending: Optional[int] = None,
+) -> Generator[R, None, None]:
+    """Generator function that applies a function to each item using a pool of
+    processes and returns the results in input order.
+
+    Items are sent to the worker processes in batches to reduce communication overhead.
+    At most ``max_pending`` batches are submitted at once, so the input is consumed
+    lazily and memory use does not depend on the number of items.
+
+    The function and items must be picklable, so the function has to be defined at the
+    top level of a module (lambdas and nested functions cannot be used).
+    Exceptions raised by the function are raised when the corresponding result is
+    reached.
+
+    Parameters
+    ----------
+    func : Callable[[T], R]
+        Function to apply to each item.
+    items : Iterable[T]
+        Items to process.
+    processes : Optional[int]
+        Number of worker processes, or None to use the number of CPUs.
+    batch_size : int
+        Number of items sent to a worker at once. Default 1000.
+    max_pending : Optional[int]
+        Maximum number of batches submitted but not yet returned, or None to use twice
+        the number of processes.
+
+    Yields
+    -------
+    R
+        Result of the function for each item, in input order.
+
+    Raises
+    ------
+    ValueError
+        If the number of processes, batch size, or maximum pending batches is less
+        than 1.
+
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * processes
+    if processes < 1:
+        raise ValueError("number of processes must be at least 1")
+    if batch_size < 1:
+        raise ValueError("batch size must be at least 1")
+    if max_pending < 1:
+        raise ValueError("maximum pending batches must be at least 1")
+
+    iterator = iter(items)
+    pending: Deque["Future[List[R]]"] = deque()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        try:
+            batch = list(islice(iterator, batch_size))
+            while len(batch) > 0:
+                pending.append(executor.submit(_apply_batch, func, batch))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+                batch = list(islice(iterator, batch_size))
+
+            while len(pending) > 0:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def parallel_map_fasta_records(
+    handle: TextIO,
+    func: Callable[[str], Any],
+    processes: Optional[int] = None,
+    batch_size: int = 1000,
+    max_pending: Optional[int] = None,
+) -> Generator[Tuple[str, Any], None, None]:
+    """Generator function that applies a function to the sequence of each FASTA record
+    using a pool of processes.
+
+    Records are read using :py:func:`~fqfa.fasta.fasta.parse_fasta_records` and
+    processed as described for :py:func:`~fqfa.util.parallel.parallel_map`.
+    Suitable functions include :py:func:`~fqfa.util.translate.translate_dna` and
+    :py:func:`~fqfa.util.infer.infer_sequence_type`, or
+    :py:func:`functools.partial` objects wrapping them.
+
+    Parameters
+    ----------
+    handle : TextIO
+        Open text file handle to parse.
+    func : Callable[[str], Any]
+        Function to apply to each sequence.
+    processes : Optional[int]
+        Number of worker processes, or None to use the number of CPUs.
+    batch_size : int
+        Number of records sent to a worker at once. Default 1000.
+    max_pending : Optional[int]
+        Maximum number of batches submitted but not yet returned, or None to use twice
+        the number of processes.
+
+    Yields
+    -------
+    Tuple[str, Any]
+        Tuple containing the header line (with leading '>' removed) and the result of
+        the function for the record's sequence, in input order.
+
+    Raises
+    ------
+    ValueError
+        If the number of processes, batch size, or maximum pending batches is less
+        than 1.
+
+    """
+    yield from parallel_map(
+        partial(_apply_to_sequence, func),
+        parse_fasta_records(handle),
+        processes=processes,
+        batch_size=batch_size,
+        max_pending=max_pending,
+    )
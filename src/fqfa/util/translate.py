@@ -2,27 +2,497 @@
 
 """
 
-from typing import Dict, Tuple, Optional
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Dict, Tuple, Optional, Iterator, Union, Any, FrozenSet, Iterable, List
+from fqfa.constants.iupac.dna import DNA_BASES, DNA_AMBIGUITY_BASES
 from fqfa.constants.translation.table import CODON_TABLE
+from fqfa.constants.translation.ncbi import NCBI_BASE1, NCBI_BASE2, NCBI_BASE3, NCBI_GENETIC_CODES
+from fqfa.util.nucleotide import reverse_complement
 from fqfa.validator.validator import dna_bases_validator, amino_acids_validator
 
-__all__ = ["translate_dna", "ncbi_genetic_code_to_dict"]
+__all__ = [
+    "translate_dna",
+    "translate_six_frames",
+    "ncbi_genetic_code_to_dict",
+    "ncbi_genetic_code_to_table",
+    "ncbi_translation_table",
+    "TranslationTable",
+    "TranslationCache",
+]
 
+_CODON_BASES = "TCAG"
+"""str: bases in the order used to calculate codon indices, which matches the order of
+the codons in NCBI translation tables.
+
+"""
+
+_CODON_BASE_TABLE = bytes(_CODON_BASES.index(chr(i)) if chr(i) in _CODON_BASES else 255 for i in range(256))
+"""bytes: translation table from ASCII characters to base indices, with all other
+characters translated to 255.
+
+"""
+
+_DEFAULT_STARTS = frozenset(["ATG"])
+"""FrozenSet[str]: start codons used for tables that do not specify any.
+
+"""
+
+_NUMPY_MIN_LENGTH = 192
+"""int: shortest sequence translated using NumPy, below which the overhead of creating
+the arrays outweighs the faster lookup.
+
+"""
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """Import NumPy the first time a translation table is compiled.
+
+    Importing NumPy takes longer than importing the rest of fqfa, so it is not imported
+    until it is needed.
+
+    Returns
+    -------
+    Any
+        The numpy module, or None if it is not installed.
+
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
+def _expand_ambiguous_codons(codons: Mapping) -> Dict[str, str]:  # type: ignore[type-arg]
+    """Translate every codon containing IUPAC ambiguity characters.
+
+    Each ambiguous codon is expanded into all of the codons it represents.
+    If all of them are in the table and translate to the same amino acid, the
+    ambiguous codon translates to that amino acid, otherwise it translates to 'X'.
+
+    Parameters
+    ----------
+    codons : Mapping[str, str]
+        Map from codon strings to single-letter amino acid codes.
+
+    Returns
+    -------
+    Dict[str, str]
+        Map from each of the 3311 codons containing at least one ambiguity character to
+        its single-letter amino acid code.
+
+    """
+    expansions = {b: b for b in DNA_BASES}
+    expansions.update(DNA_AMBIGUITY_BASES)
+
+    result = dict()
+    for first, x in expansions.items():
+        for second, y in expansions.items():
+            for third, z in expansions.items():
+                codon = first + second + third
+                if codon in codons or len(x) == len(y) == len(z) == 1:
+                    continue
+                aas = {codons.get(a + b + c) for a in x for b in y for c in z}
+                aa = aas.pop() if len(aas) == 1 else None
+                result[codon] = "X" if aa is None else aa
+    return result
+
+
+def _split_remainder(seq: str, frame: int) -> Tuple[int, Optional[str]]:
+    """Find the end of the last full codon and the trailing partial codon.
+
+    Parameters
+    ----------
+    seq : str
+        String containing DNA bases to translate.
+    frame : int
+        Integer with value in (0, 1, 2) defining the position in the sequence to start
+        at.
+
+    Returns
+    -------
+    Tuple[int, Optional[str]]
+        Position after the last full codon and the trailing partial codon (or `None`
+        if there was no remainder).
+
+    """
+    remainder_length = (len(seq) - frame) % 3
+    if remainder_length == 0:
+        return len(seq), None
+    return len(seq) - remainder_length, seq[-remainder_length:]
+
+
+def _translate_codons(seq: str, table: Mapping, start: int, end: int) -> str:  # type: ignore[type-arg]
+    """Translate the codons in part of a sequence one at a time.
+
+    Parameters
+    ----------
+    seq : str
+        String containing DNA bases to translate.
+    table : Mapping[str, str]
+        Map from codon strings to single-letter amino acid codes.
+    start : int
+        Position of the first codon.
+    end : int
+        Position after the last codon.
+
+    Returns
+    -------
+    str
+        The single-letter amino acid codes.
+
+    Raises
+    ------
+    KeyError
+        If a codon was not present in the translation table.
+
+    """
+    try:
+        return "".join([table[seq[i : i + 3]] for i in range(start, end, 3)])
+    except KeyError:
+        pass
+
+    # find the first bad codon to report its position
+    for i in range(start, end, 3):
+        if seq[i : i + 3] not in table:
+            raise KeyError(f"unrecognized codon '{seq[i : i + 3]}' at nt position {i + 1}")
+    raise KeyError("unrecognized codon")  # pragma: no cover
+
+
+class TranslationTable(Mapping):  # type: ignore[type-arg]
+    """Immutable translation table compiled for fast translation of whole sequences.
+
+    The table is built once from a dictionary such as
+    :py:data:`~fqfa.constants.translation.table.CODON_TABLE` or the output of
+    :py:func:`~fqfa.util.translate.ncbi_genetic_code_to_dict` and can be used anywhere
+    a dictionary mapping codons to amino acids is accepted, including as the ``table``
+    argument of :py:func:`~fqfa.util.translate.translate_dna`.
+
+    All pairs of codons made of A, C, G, and T are precomputed, so sequences are
+    translated two codons (six bases) per lookup.
+    If NumPy is available and the table defines all 64 codons as single characters,
+    longer sequences are instead translated by converting each codon to an index and
+    looking up all of them at once.
+
+    If ``ambiguous`` is True, codons containing the IUPAC ambiguity characters in
+    :py:data:`~fqfa.constants.iupac.dna.DNA_AMBIGUITY` are also translated.
+    Each ambiguous codon translates to the amino acid encoded by all of the codons it
+    represents, or 'X' if they differ (for example, "GCN" translates to "A" and "TAY"
+    translates to "Y", but "NNN" translates to "X").
+    All 3375 possible codons are translated when the table is created, so ambiguous
+    codons are translated using the same lookup as other codons.
+
+    The table also records the start codons used to find open reading frames.
+    Tables created by :py:func:`~fqfa.util.translate.ncbi_genetic_code_to_table` use the
+    start codons from the `Starts` row of the NCBI table.
+
+    Parameters
+    ----------
+    table : Optional[Mapping[str, str]]
+        Map from codon strings to single-letter amino acid codes or `None` to use the
+        default translation table.
+    use_numpy : Optional[bool]
+        If True, use NumPy for longer sequences; if False, never use NumPy. If None (the
+        default), NumPy is used if it is installed and the table is suitable.
+    starts : Optional[Iterable[str]]
+        Start codons or `None` to use ATG as the only start codon.
+    ambiguous : bool
+        If True, also translate codons containing IUPAC ambiguity characters. Default
+        False.
+
+    Raises
+    ------
+    NotImplementedError
+        If NumPy is requested but not installed.
+    ValueError
+        If NumPy is requested but the table does not define all 64 codons as single
+        characters.
+
+    """
+
+    def __init__(
+        self,
+        table: Optional[Mapping] = None,  # type: ignore[type-arg]
+        use_numpy: Optional[bool] = None,
+        starts: Optional[Iterable[str]] = None,
+        ambiguous: bool = False,
+    ) -> None:
+        if table is None:
+            table = CODON_TABLE
+        self._codons: Dict[str, str] = dict(table)
+        self._starts: FrozenSet[str] = _DEFAULT_STARTS if starts is None else frozenset(starts)
+        self._ambiguous = ambiguous
+        if ambiguous:
+            self._codons.update(_expand_ambiguous_codons(table))
+
+        dna_codons = {k: v for k, v in self._codons.items() if len(k) == 3 and dna_bases_validator(k)}
+        self._pairs = {a + b: x + y for a, x in dna_codons.items() for b, y in dna_codons.items()}
+
+        lookup = [self._codons.get(a + b + c, "") for a in _CODON_BASES for b in _CODON_BASES for c in _CODON_BASES]
+        suitable = all(len(aa) == 1 and ord(aa) < 128 for aa in lookup)
+        if use_numpy is None:
+            use_numpy = suitable and _numpy() is not None
+        elif use_numpy:
+            if _numpy() is None:
+                raise NotImplementedError("NumPy support requires the numpy package")
+            if not suitable:
+                raise ValueError("NumPy translation requires all 64 codons as single characters")
+
+        self._lookup: Any = None
+        if use_numpy:
+            np = _numpy()
+            self._lookup = np.frombuffer("".join(lookup).encode("ascii"), dtype=np.uint8)
+
+    @property
+    def starts(self) -> FrozenSet[str]:
+        """FrozenSet[str]: the start codons."""
+        return self._starts
+
+    @property
+    def ambiguous(self) -> bool:
+        """bool: True if codons containing IUPAC ambiguity characters are translated."""
+        return self._ambiguous
+
+    def __getitem__(self, codon: str) -> str:
+        return self._codons[codon]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codons)
+
+    def __len__(self) -> int:
+        return len(self._codons)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._codons)} codons, starts={sorted(self._starts)!r})"
+
+    def _codon_indices(self, seq: str, start: int, end: int) -> Any:
+        """Convert part of a sequence into an array of base indices for NumPy.
+
+        Parameters
+        ----------
+        seq : str
+            String containing DNA bases.
+        start : int
+            Position of the first base.
+        end : int
+            Position after the last base.
+
+        Returns
+        -------
+        Optional[numpy.ndarray]
+            Array containing the index of each base in "TCAG", or None if the sequence
+            contains characters other than A, C, G, and T.
+
+        """
+        np = _numpy()
+        codes = np.frombuffer(seq[start:end].encode("ascii", errors="replace").translate(_CODON_BASE_TABLE), np.uint8)
+        if len(codes) == 0 or codes.max() > 3:
+            return None
+        return codes
+
+    def _translate_numpy(self, seq: str, start: int, end: int) -> Optional[str]:
+        """Translate part of a sequence using NumPy.
+
+        Parameters
+        ----------
+        seq : str
+            String containing DNA bases to translate.
+        start : int
+            Position of the first codon.
+        end : int
+            Position after the last codon.
+
+        Returns
+        -------
+        Optional[str]
+            The single-letter amino acid codes, or None if the sequence contains
+            characters other than A, C, G, and T.
+
+        """
+        codes = self._codon_indices(seq, start, end)
+        if codes is None:
+            return None
+        index = (codes[0::3] << 4) | (codes[1::3] << 2) | codes[2::3]
+        return self._lookup[index].tobytes().decode("ascii")  # type: ignore[no-any-return]
+
+    def translate(self, seq: str, frame: int = 0) -> Tuple[str, Optional[str]]:
+        """Translate a DNA sequence into the corresponding amino acid sequence.
+
+        The result is the same as for :py:func:`~fqfa.util.translate.translate_dna`.
+
+        Parameters
+        ----------
+        seq : str
+            String containing DNA bases to translate.
+        frame : int
+            Integer with value in (0, 1, 2) defining the position in the sequence to
+            start at.
+
+        Returns
+        -------
+        Tuple[str, Optional[str]]
+            Returns a Tuple where the first string consists of the single-letter amino
+            acid codes and the second string contains any remaining bases in a trailing
+            partial codon (or `None` if there was no remainder).
+
+        Raises
+        ------
+        KeyError
+            If a full-length codon was not present in the translation table.
+
+        """
+        end, remainder = _split_remainder(seq, frame)
+
+        if self._lookup is not None and end - frame >= _NUMPY_MIN_LENGTH:
+            aa_seq = self._translate_numpy(seq, frame, end)
+            if aa_seq is not None:
+                return aa_seq, remainder
+
+        pair_end = end - (end - frame) % 6
+        pairs = self._pairs
+        try:
+            aa_seq = "".join([pairs[seq[i : i + 6]] for i in range(frame, pair_end, 6)])
+            if pair_end < end:
+                aa_seq += self._codons[seq[pair_end:end]]
+        except KeyError:  # not a valid DNA codon, so look up each codon individually
+            aa_seq = _translate_codons(seq, self._codons, frame, end)
+        return aa_seq, remainder
+
+    def translate_six_frames(self, seq: str) -> List[str]:
+        """Translate a DNA sequence in all six reading frames.
+
+        The result is the same as for
+        :py:func:`~fqfa.util.translate.translate_six_frames`.
+
+        Parameters
+        ----------
+        seq : str
+            String containing DNA bases to translate.
+
+        Returns
+        -------
+        List[str]
+            The amino acid sequences of frames 0, 1, and 2 of the sequence followed by
+            frames 0, 1, and 2 of its reverse complement.
+
+        Raises
+        ------
+        KeyError
+            If a full-length codon was not present in the translation table.
+
+        """
+        if self._lookup is not None and len(seq) >= _NUMPY_MIN_LENGTH:
+            codes = self._codon_indices(seq, 0, len(seq))
+            if codes is not None:
+                # index of the codon starting at every position and of its reverse complement
+                # (complementing swaps T/A and C/G, which is XOR 2 in "TCAG" order)
+                first, second, third = codes[:-2], codes[1:-1], codes[2:]
+                fwd = (first << 4) | (second << 2) | third
+                rev = ((third ^ 2) << 4) | ((second ^ 2) << 2) | (first ^ 2)
+                last = len(seq) - 3
+                frames = [fwd[f::3] for f in range(3)]
+                frames.extend(rev[last - f :: -3] if last >= f else rev[:0] for f in range(3))
+                return [self._lookup[x].tobytes().decode("ascii") for x in frames]
+
+        rev_seq = reverse_complement(seq)
+        return [self.translate(x, frame)[0] for x in (seq, rev_seq) for frame in range(3)]
+
+
+@lru_cache(maxsize=None)
+def _default_table() -> TranslationTable:
+    """Get the compiled standard translation table used by default.
+
+    The table is created the first time it is needed.
+
+    Returns
+    -------
+    TranslationTable
+        Compiled copy of the standard translation table.
 
-def translate_dna(seq: str, table: Optional[Dict[str, str]] = None, frame: int = 0) -> Tuple[str, Optional[str]]:
+    """
+    return TranslationTable(CODON_TABLE)
+
+
+@lru_cache(maxsize=None)
+def _default_ambiguous_table() -> TranslationTable:
+    """Get the compiled standard translation table including ambiguous codons.
+
+    The table is created the first time it is needed.
+
+    Returns
+    -------
+    TranslationTable
+        Compiled copy of the standard translation table with ``ambiguous`` set.
+
+    """
+    return TranslationTable(CODON_TABLE, ambiguous=True)
+
+
+def _compile_table(table: Optional[Union[Dict[str, str], TranslationTable]], ambiguous: bool) -> TranslationTable:
+    """Get a compiled translation table for the table argument of a function.
+
+    Parameters
+    ----------
+    table : Optional(Union[Dict[str, str], TranslationTable])
+        Map from codon strings to single-letter amino acid codes or `None` to use the
+        default translation table.
+    ambiguous : bool
+        If True, the table must translate codons containing IUPAC ambiguity characters.
+
+    Returns
+    -------
+    TranslationTable
+        The table if it is already compiled, otherwise a newly compiled table.
+
+    Raises
+    ------
+    ValueError
+        If ``ambiguous`` is True and the table is a
+        :py:class:`~fqfa.util.translate.TranslationTable` created without ambiguous
+        codons.
+
+    """
+    if table is None:
+        return _default_ambiguous_table() if ambiguous else _default_table()
+    if not isinstance(table, TranslationTable):
+        return TranslationTable(table, ambiguous=ambiguous)
+    if ambiguous and not table.ambiguous:
+        raise ValueError("translation table does not include ambiguous codons")
+    return table
+
+
+def translate_dna(
+    seq: str,
+    table: Optional[Union[Dict[str, str], TranslationTable]] = None,
+    frame: int = 0,
+    ambiguous: bool = False,
+) -> Tuple[str, Optional[str]]:
     """
     Translate a DNA sequence into the corresponding amino acid sequence.
 
+    For translating many sequences with a table other than the default, create a
+    :py:class:`~fqfa.util.translate.TranslationTable` once and pass it as the table.
+    Dictionaries are translated one codon at a time.
+
+    If ``ambiguous`` is True, codons containing IUPAC ambiguity characters are
+    translated as described for :py:class:`~fqfa.util.translate.TranslationTable`.
+    Dictionaries are compiled for each call in this mode, so a compiled table should be
+    used for translating many sequences with a table other than the default.
+
     Parameters
     ----------
     seq : str
         String containing DNA bases to translate.
-    table : Optional(Dict[str, str])
+    table : Optional(Union[Dict[str, str], TranslationTable])
         Map from codon strings to single-letter amino acid codes or `None` to use the
         default translation table.
     frame : int
         Integer with value in (0, 1, 2) defining the position in the sequence to start
         at.
+    ambiguous : bool
+        If True, translate codons containing IUPAC ambiguity characters. Default False.
 
     Returns
     -------
@@ -36,55 +506,222 @@ def translate_dna(seq: str, table: Optional[Dict[str, str]] = None, frame: int =
     ------
     KeyError
         If a full-length codon was not present in the translation table.
+    ValueError
+        If ``ambiguous`` is True and the table is a
+        :py:class:`~fqfa.util.translate.TranslationTable` created without ambiguous
+        codons.
 
     """
-    if table is None:
-        table = CODON_TABLE
+    if table is None or ambiguous:
+        table = _compile_table(table, ambiguous)
+    if isinstance(table, TranslationTable):
+        return table.translate(seq, frame)
 
-    remainder_length = (len(seq) - frame) % 3
-    if remainder_length == 0:
-        remainder = None
-    else:
-        remainder = seq[-remainder_length:]
+    end, remainder = _split_remainder(seq, frame)
+    return _translate_codons(seq, table, frame, end), remainder
 
-    aa_seq = list()
-    for i in range(frame, len(seq) - remainder_length, 3):
-        codon = seq[i : i + 3]
-        try:
-            aa_seq.append(table[codon])
-        except KeyError:
-            raise KeyError(f"unrecognized codon '{codon}' at nt position {i + 1}")
 
-    return "".join(aa_seq), remainder
+class TranslationCache:
+    """Translator that remembers the translations of recently seen sequences.
 
+    This is intended for data such as variant libraries from deep mutational scanning
+    experiments, where the same coding sequences occur many times.
+    Translations are stored in a least recently used cache keyed on the sequence and
+    frame, so each distinct sequence is translated only once while it remains in the
+    cache.
+    Use :py:meth:`~fqfa.util.translate.TranslationCache.cache_info` to check the number
+    of cache hits and misses when choosing the cache size.
 
-def ncbi_genetic_code_to_dict(  # noqa: max-complexity: 11
-    ncbi_string: str,
-) -> Dict[str, str]:
-    """Parse a translation table from NCBI into a dictionary.
+    Parameters
+    ----------
+    table : Optional(Union[Dict[str, str], TranslationTable])
+        Map from codon strings to single-letter amino acid codes or `None` to use the
+        default translation table. Dictionaries are compiled once when the object is
+        created.
+    maxsize : Optional[int]
+        Maximum number of translations to store or `None` for no limit. Default 65536.
+    ambiguous : bool
+        If True, translate codons containing IUPAC ambiguity characters, as described
+        for :py:func:`~fqfa.util.translate.translate_dna`. Default False.
 
-    The five-line table input is parsed into a dictionary representation suitable for
-    :py:func:`~fqfa.util.util.translate_dna`.
-    As an example, the standard genetic code (transl_table=1) is defined in
-    :py:data:`~fqfa.constants.translation.table.CODON_TABLE`.
+    Raises
+    ------
+    ValueError
+        If ``ambiguous`` is True and the table is a
+        :py:class:`~fqfa.util.translate.TranslationTable` created without ambiguous
+        codons.
 
-    NCBI translation tables can be found
-    `here <https://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi?chapter=cgencodes>`_
-    .
+    """
 
-    The standard genetic code is encoded by::
+    def __init__(
+        self,
+        table: Optional[Union[Dict[str, str], TranslationTable]] = None,
+        maxsize: Optional[int] = 1 << 16,
+        ambiguous: bool = False,
+    ) -> None:
+        self.table = _compile_table(table, ambiguous)
+        self._translate = lru_cache(maxsize=maxsize)(self.table.translate)
 
-        AAs  = FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG
-      Starts = ---M------**--*----M---------------M----------------------------
-      Base1  = TTTTTTTTTTTTTTTTCCCCCCCCCCCCCCCCAAAAAAAAAAAAAAAAGGGGGGGGGGGGGGGG
-      Base2  = TTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGG
-      Base3  = TCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAG
+    def translate(self, seq: str, frame: int = 0) -> Tuple[str, Optional[str]]:
+        """Translate a DNA sequence into the corresponding amino acid sequence.
 
+        The result is the same as for :py:func:`~fqfa.util.translate.translate_dna`.
 
-    Information from the `Starts` line is not retained in the dictionary representation.
+        Parameters
+        ----------
+        seq : str
+            String containing DNA bases to translate.
+        frame : int
+            Integer with value in (0, 1, 2) defining the position in the sequence to
+            start at.
 
-    Blank lines or whitespace-only lines are automatically skipped, as are lines
-    beginning with `#`.
+        Returns
+        -------
+        Tuple[str, Optional[str]]
+            Tuple of the single-letter amino acid codes and any remaining bases in a
+            trailing partial codon (or `None` if there was no remainder).
+
+        Raises
+        ------
+        KeyError
+            If a full-length codon was not present in the translation table.
+
+        """
+        return self._translate(seq, frame)  # type: ignore[no-any-return]
+
+    def translate_batch(self, seqs: Iterable[str], frame: int = 0) -> List[Tuple[str, Optional[str]]]:
+        """Translate many DNA sequences.
+
+        Parameters
+        ----------
+        seqs : Iterable[str]
+            Strings containing DNA bases to translate.
+        frame : int
+            Integer with value in (0, 1, 2) defining the position in each sequence to
+            start at.
+
+        Returns
+        -------
+        List[Tuple[str, Optional[str]]]
+            The result of :py:meth:`~fqfa.util.translate.TranslationCache.translate` for
+            each sequence, in input order.
+
+        Raises
+        ------
+        KeyError
+            If a full-length codon was not present in the translation table.
+
+        """
+        translate = self._translate
+        return [translate(seq, frame) for seq in seqs]
+
+    def translate_counts(self, counts: Iterable[Tuple[str, int]], frame: int = 0) -> Dict[str, int]:
+        """Translate counted DNA sequences and total the counts of each amino acid
+        sequence.
+
+        Counts for repeated DNA sequences are combined before translation, so each
+        distinct sequence is looked up once.
+        Any trailing partial codon is ignored, so DNA sequences that differ only in the
+        remainder are counted together.
+
+        Parameters
+        ----------
+        counts : Iterable[Tuple[str, int]]
+            Pairs of DNA sequence and count, such as the items of a dictionary or
+            :py:class:`collections.Counter`.
+        frame : int
+            Integer with value in (0, 1, 2) defining the position in each sequence to
+            start at.
+
+        Returns
+        -------
+        Dict[str, int]
+            Map from amino acid sequences to total counts.
+
+        Raises
+        ------
+        KeyError
+            If a full-length codon was not present in the translation table.
+
+        """
+        dna_counts: Dict[str, int] = dict()
+        for seq, count in counts:
+            dna_counts[seq] = dna_counts.get(seq, 0) + count
+
+        translate = self._translate
+        result: Dict[str, int] = dict()
+        for seq, count in dna_counts.items():
+            aa_seq = translate(seq, frame)[0]
+            result[aa_seq] = result.get(aa_seq, 0) + count
+        return result
+
+    def cache_info(self) -> Any:
+        """Return statistics about the cache.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple with the fields ``hits``, ``misses``, ``maxsize``, and
+            ``currsize``, as returned by functions wrapped with
+            :py:func:`functools.lru_cache`.
+
+        """
+        return self._translate.cache_info()
+
+    def cache_clear(self) -> None:
+        """Remove all translations from the cache and reset the statistics.
+
+        Returns
+        -------
+        None
+
+        """
+        self._translate.cache_clear()
+
+
+def translate_six_frames(seq: str, table: Optional[Union[Dict[str, str], TranslationTable]] = None) -> List[str]:
+    """Translate a DNA sequence in all six reading frames.
+
+    Each result is the same as the amino acid sequence returned by
+    :py:func:`~fqfa.util.translate.translate_dna` for that frame of the sequence or of
+    its reverse complement, without the trailing partial codon.
+    If NumPy is used by the translation table, the codon at every position of the
+    sequence and its reverse complement are looked up in a single pass, and each frame
+    is selected from the result.
+    Otherwise, the sequence is reverse-complemented once and each frame is translated
+    using the compiled table.
+
+    Parameters
+    ----------
+    seq : str
+        String containing DNA bases to translate.
+    table : Optional(Union[Dict[str, str], TranslationTable])
+        Map from codon strings to single-letter amino acid codes or `None` to use the
+        default translation table. Dictionaries are compiled into a
+        :py:class:`~fqfa.util.translate.TranslationTable` for each call.
+
+    Returns
+    -------
+    List[str]
+        The amino acid sequences of frames 0, 1, and 2 of the sequence followed by
+        frames 0, 1, and 2 of its reverse complement.
+
+    Raises
+    ------
+    KeyError
+        If a full-length codon was not present in the translation table.
+
+    """
+    return _compile_table(table, False).translate_six_frames(seq)
+
+
+def _parse_ncbi_genetic_code(  # noqa: max-complexity: 12
+    ncbi_string: str,
+) -> Tuple[Dict[str, str], FrozenSet[str]]:
+    """Parse a translation table from NCBI into a dictionary and a set of start codons.
+
+    See :py:func:`~fqfa.util.translate.ncbi_genetic_code_to_dict` for the input format.
+    Start codons are the codons marked with `M` in the `Starts` row.
 
     Parameters
     ----------
@@ -93,8 +730,9 @@ def ncbi_genetic_code_to_dict(  # noqa: max-complexity: 11
 
     Returns
     -------
-    Dict[str, str]
-        Dictionary mapping codons to single-letter amino acid codes.
+    Tuple[Dict[str, str], FrozenSet[str]]
+        Dictionary mapping codons to single-letter amino acid codes and the set of start
+        codons.
 
     Raises
     ------
@@ -144,13 +782,167 @@ def ncbi_genetic_code_to_dict(  # noqa: max-complexity: 11
         raise ValueError("transl_table row contains non-amino acid characters")
 
     codon_dict: Dict[str, str] = dict()
-    for aa, codon in zip(
+    starts = set()
+    for aa, start, codon in zip(
         transl_table["AAs"],
+        transl_table["Starts"],
         ("".join(nts) for nts in zip(transl_table["Base1"], transl_table["Base2"], transl_table["Base3"])),
     ):
         if codon not in codon_dict:
             codon_dict[codon] = aa
         else:
             raise ValueError("all transl_table codons must be unique")
+        if start == "M":
+            starts.add(codon)
+
+    return codon_dict, frozenset(starts)
+
+
+def ncbi_genetic_code_to_dict(
+    ncbi_string: str,
+) -> Dict[str, str]:
+    """Parse a translation table from NCBI into a dictionary.
+
+    The five-line table input is parsed into a dictionary representation suitable for
+    :py:func:`~fqfa.util.util.translate_dna`.
+    As an example, the standard genetic code (transl_table=1) is defined in
+    :py:data:`~fqfa.constants.translation.table.CODON_TABLE`.
+
+    NCBI translation tables can be found
+    `here <https://www.ncbi.nlm.nih.gov/Taxonomy/Utils/wprintgc.cgi?chapter=cgencodes>`_
+    .
+
+    The standard genetic code is encoded by::
+
+        AAs  = FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG
+      Starts = ---M------**--*----M---------------M----------------------------
+      Base1  = TTTTTTTTTTTTTTTTCCCCCCCCCCCCCCCCAAAAAAAAAAAAAAAAGGGGGGGGGGGGGGGG
+      Base2  = TTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGG
+      Base3  = TCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAG
+
+
+    Information from the `Starts` line is not retained in the dictionary representation.
+    Use :py:func:`~fqfa.util.translate.ncbi_genetic_code_to_table` to also obtain the
+    start codons.
+
+    Blank lines or whitespace-only lines are automatically skipped, as are lines
+    beginning with `#`.
+
+    Parameters
+    ----------
+    ncbi_string : str
+        Multi-line string containing a `transl_table` from NCBI.
+
+    Returns
+    -------
+    Dict[str, str]
+        Dictionary mapping codons to single-letter amino acid codes.
+
+    Raises
+    ------
+    ValueError
+        If any of the rows is missing.
+    ValueError
+        If the row labels do not match the expected format.
+    ValueError
+        If any row does not have the expected format (``<label> = <data>``).
+    ValueError
+        If any of the rows fails to contain the expected number of characters (64).
+    ValueError
+        If there are duplicate codons in the table.
+    ValueError
+        If any of the BaseN rows contains a character other than ACGT.
+    ValueError
+        If the AAs row contains a character other than an amino acid.
+
+    """
+    return _parse_ncbi_genetic_code(ncbi_string)[0]
+
+
+def ncbi_genetic_code_to_table(ncbi_string: str, use_numpy: Optional[bool] = None) -> TranslationTable:
+    """Parse a translation table from NCBI into a compiled translation table.
+
+    The input is the same as for :py:func:`~fqfa.util.translate.ncbi_genetic_code_to_dict`.
+    Unlike the dictionary representation, the result includes the start codons marked
+    with `M` in the `Starts` row, which are used to find open reading frames.
+
+    Parameters
+    ----------
+    ncbi_string : str
+        Multi-line string containing a `transl_table` from NCBI.
+    use_numpy : Optional[bool]
+        Passed to :py:class:`~fqfa.util.translate.TranslationTable`.
+
+    Returns
+    -------
+    TranslationTable
+        Compiled translation table including the start codons.
+
+    Raises
+    ------
+    ValueError
+        If any of the rows is missing.
+    ValueError
+        If the row labels do not match the expected format.
+    ValueError
+        If any row does not have the expected format (``<label> = <data>``).
+    ValueError
+        If any of the rows fails to contain the expected number of characters (64).
+    ValueError
+        If there are duplicate codons in the table.
+    ValueError
+        If any of the BaseN rows contains a character other than ACGT.
+    ValueError
+        If the AAs row contains a character other than an amino acid.
+
+    """
+    codon_dict, starts = _parse_ncbi_genetic_code(ncbi_string)
+    return TranslationTable(codon_dict, use_numpy=use_numpy, starts=starts)
+
+
+@lru_cache(maxsize=None)
+def ncbi_translation_table(
+    table_id: int, use_numpy: Optional[bool] = None, ambiguous: bool = False
+) -> TranslationTable:
+    """Get the compiled translation table for an NCBI genetic code.
+
+    The genetic codes are stored in
+    :py:data:`~fqfa.constants.translation.ncbi.NCBI_GENETIC_CODES`, so no table text
+    needs to be supplied or parsed.
+    Each table is compiled the first time it is requested and the same immutable
+    object is returned by later calls.
+    The result includes the start codons from the `Starts` row.
+
+    Parameters
+    ----------
+    table_id : int
+        The NCBI `transl_table` number, such as 1 for the standard code or 11 for the
+        bacterial, archaeal, and plant plastid code.
+    use_numpy : Optional[bool]
+        Passed to :py:class:`~fqfa.util.translate.TranslationTable`.
+    ambiguous : bool
+        Passed to :py:class:`~fqfa.util.translate.TranslationTable`. Default False.
+
+    Returns
+    -------
+    TranslationTable
+        Compiled translation table including the start codons.
+
+    Raises
+    ------
+    ValueError
+        If there is no NCBI genetic code with the given number.
+
+    """
+    try:
+        code = NCBI_GENETIC_CODES[table_id]
+    except KeyError:
+        raise ValueError(f"unknown NCBI genetic code {table_id}")
 
-    return codon_dict
+    codons = ["".join(nts) for nts in zip(NCBI_BASE1, NCBI_BASE2, NCBI_BASE3)]
+    return TranslationTable(
+        dict(zip(codons, code.aas)),
+        use_numpy=use_numpy,
+        starts=[codon for codon, start in zip(codons, code.starts) if start == "M"],
+        ambiguous=ambiguous,
+    )
@@ -4,14 +4,25 @@ from fqfa.validator.validator import (
     rna_bases_validator,
     amino_acids_validator,
     amino_acids_all_validator,
+    dna_bases_lookup_validator,
+    dna_characters_lookup_validator,
+    rna_bases_lookup_validator,
+    amino_acids_lookup_validator,
+    amino_acids_all_lookup_validator,
 )
-from fqfa.validator.create import create_validator
+from fqfa.validator.create import create_validator, create_lookup_validator
 
 __all__ = [
     "create_validator",
+    "create_lookup_validator",
     "dna_bases_validator",
     "dna_characters_validator",
     "rna_bases_validator",
     "amino_acids_validator",
     "amino_acids_all_validator",
+    "dna_bases_lookup_validator",
+    "dna_characters_lookup_validator",
+    "rna_bases_lookup_validator",
+    "amino_acids_lookup_validator",
+    "amino_acids_all_lookup_validator",
 ]
@@ -1,18 +1,70 @@
 import re
-from typing import Union, List, Callable, Match, Optional
+from functools import lru_cache
+from typing import Union, List, Callable, Match, Optional, Set, Any
 
-__all__ = ["create_validator"]
+__all__ = ["create_validator", "create_lookup_validator"]
+
+_VALIDATOR_CACHE_SIZE = 256
+"""int: maximum number of distinct regular expression-based validators kept by
+:py:func:`~fqfa.validator.create.create_validator`.
+
+"""
+
+
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
+def _compile_validator(charset: str, binary: bool) -> Callable[[Any], Optional[Match[Any]]]:
+    """Compile the regular expression-based validator for a normalized set of characters.
+
+    Parameters
+    ----------
+    charset : str
+        String containing each valid character once, in sorted order.
+    binary : bool
+        True if the validator should take bytes-like objects instead of strings.
+
+    Returns
+    -------
+    Callable[[Any], Optional[Match[Any]]]
+        Callable validator that uses re.fullmatch.
+
+    Raises
+    ------
+    ValueError
+        If binary is True and charset contains non-ASCII characters.
+
+    """
+    pattern_string = f"[{''.join(re.escape(c) for c in charset)}]+"
+    if not binary:
+        return re.compile(pattern_string).fullmatch
+    try:
+        return re.compile(pattern_string.encode("ascii")).fullmatch
+    except UnicodeEncodeError:
+        raise ValueError("binary validators require ASCII characters")
 
 
 def create_validator(
-    valid_characters: Union[str, List[str]], case_sensitive: bool = True
-) -> Callable[[str], Optional[Match[str]]]:
+    valid_characters: Union[str, List[str]], case_sensitive: bool = True, binary: bool = False
+) -> Callable[[Any], Optional[Match[Any]]]:
     """Function that generates a callable, regular-expression based sequence validator.
 
     When called on a given string, the validator will return a Match object if every
     character is one of the
     valid_characters, else None.
 
+    Validators are cached by the set of valid characters (after adding the other case
+    if case_sensitive is False), so calling this function repeatedly with the same
+    characters in any order returns the same validator without compiling a new regular
+    expression.
+    Up to 256 distinct validators are cached.
+
+    If ``binary`` is True, the validator takes bytes-like objects instead of strings,
+    so sequences read in binary mode can be validated without decoding them.
+
+    Every character is matched literally, including characters with a special meaning
+    in regular expression character sets (``]``, ``\\``, ``^``, and ``-``).
+    Earlier versions did not escape these characters, so they could form ranges (such
+    as "A-C" also accepting "B"), negate the set, or cause an error.
+
     Parameters
     ----------
     valid_characters : Union[str, List[str]]
@@ -21,16 +73,21 @@ def create_validator(
     case_sensitive : bool
         False if both upper- and lower-case characters in valid_characters are valid.
         Default True.
+    binary : bool
+        True if the validator should take bytes-like objects instead of strings.
+        Default False.
 
     Returns
     -------
-    Callable[[str, int, int], Optional[Match[str]]]
+    Callable[[AnyStr], Optional[Match[AnyStr]]]
         Callable validator that uses re.fullmatch.
 
     Raises
     ------
     ValueError
         If valid_characters is a list containing multiple characters per entry.
+    ValueError
+        If binary is True and valid_characters contains non-ASCII characters.
 
     """
     if isinstance(valid_characters, list):
@@ -43,5 +100,160 @@ def create_validator(
         charset = set(c.upper() for c in valid_characters)
         charset.update(c.lower() for c in valid_characters)
 
-    pattern_string = f"[{''.join(charset)}]+"
-    return re.compile(pattern_string).fullmatch
+    return _compile_validator("".join(sorted(charset)), binary)
+
+
+def _lookup_charset(valid_characters: Union[str, List[str]], case_sensitive: bool) -> Set[str]:
+    """Create the set of valid characters for a lookup table-based validator.
+
+    Parameters
+    ----------
+    valid_characters : Union[str, List[str]]
+        A string or list of single-character strings defining the set of valid
+        characters.
+    case_sensitive : bool
+        False if both upper- and lower-case characters in valid_characters are valid.
+
+    Returns
+    -------
+    Set[str]
+        The set of valid characters.
+
+    Raises
+    ------
+    ValueError
+        If valid_characters is a list containing multiple characters per entry.
+    ValueError
+        If valid_characters contains non-ASCII characters.
+
+    """
+    if isinstance(valid_characters, list):
+        if not all(len(c) == 1 for c in valid_characters):
+            raise ValueError("expected a list of single characters")
+
+    charset = set(valid_characters)
+    if not case_sensitive:
+        charset.update([c.upper() for c in valid_characters] + [c.lower() for c in valid_characters])
+    if any(ord(c) > 127 for c in charset):
+        raise ValueError("lookup validators require ASCII characters")
+    return charset
+
+
+def _bool_lookup_validator(valid: bytes) -> Callable[[Any], bool]:
+    """Create a lookup table-based validator that returns a bool.
+
+    Parameters
+    ----------
+    valid : bytes
+        The valid characters.
+
+    Returns
+    -------
+    Callable[[Any], bool]
+        Callable validator that takes a string or bytes-like object.
+
+    """
+
+    def validator(seq: Any) -> bool:
+        if isinstance(seq, str):
+            try:
+                seq = seq.encode("ascii")
+            except UnicodeEncodeError:  # non-ASCII characters are never valid
+                return False
+        elif isinstance(seq, memoryview):
+            seq = seq.tobytes()
+        return len(seq) > 0 and len(seq.translate(None, valid)) == 0
+
+    return validator
+
+
+def _position_lookup_validator(charset: Set[str], valid: bytes, invalid_table: bytes) -> Callable[[Any], Optional[int]]:
+    """Create a lookup table-based validator that returns the first invalid position.
+
+    Parameters
+    ----------
+    charset : Set[str]
+        The set of valid characters.
+    valid : bytes
+        The valid characters.
+    invalid_table : bytes
+        Translation table that maps valid characters to 0 and all others to 1.
+
+    Returns
+    -------
+    Callable[[Any], Optional[int]]
+        Callable validator that takes a string or bytes-like object.
+
+    """
+
+    def position_validator(seq: Any) -> Optional[int]:
+        if isinstance(seq, str):
+            try:
+                data = seq.encode("ascii")
+            except UnicodeEncodeError:
+                return next(i for i, c in enumerate(seq) if c not in charset)
+        elif isinstance(seq, memoryview):
+            data = seq.tobytes()
+        else:
+            data = seq
+        if len(data.translate(None, valid)) == 0:
+            return None
+        return data.translate(invalid_table).find(1)  # type: ignore[no-any-return]
+
+    return position_validator
+
+
+def create_lookup_validator(
+    valid_characters: Union[str, List[str]], case_sensitive: bool = True, report_position: bool = False
+) -> Callable[[Any], Any]:
+    """Function that generates a callable, lookup table-based sequence validator.
+
+    The validator accepts the same characters as
+    :py:func:`~fqfa.validator.create.create_validator`, but instead of using a regular
+    expression it deletes the valid characters using :py:meth:`bytes.translate` and
+    checks whether anything is left.
+    This avoids creating a Match object for every sequence.
+    In ``benchmarks/validators.py``, it is about 1.2 to 2 times as fast for valid reads
+    of 50 to 300 bases, and up to 6 times as fast for invalid reads.
+    The validator also accepts bytes-like objects, so sequences read in binary mode can
+    be validated without decoding them.
+
+    By default, the validator returns True if the sequence is not empty and every
+    character is one of the valid_characters, else False.
+    If ``report_position`` is True, the validator instead returns the index of the
+    first invalid character, or None if there are no invalid characters (including
+    for empty sequences).
+    The position is only calculated if the sequence is invalid, so this mode is as fast
+    as the default mode for valid sequences.
+
+    Parameters
+    ----------
+    valid_characters : Union[str, List[str]]
+        A string or list of single-character strings defining the set of valid
+        characters. All characters must be ASCII.
+    case_sensitive : bool
+        False if both upper- and lower-case characters in valid_characters are valid.
+        Default True.
+    report_position : bool
+        True if the validator should return the position of the first invalid
+        character. Default False.
+
+    Returns
+    -------
+    Callable[[AnyStr], Union[bool, Optional[int]]]
+        Callable validator that takes a string or bytes-like object.
+
+    Raises
+    ------
+    ValueError
+        If valid_characters is a list containing multiple characters per entry.
+    ValueError
+        If valid_characters contains non-ASCII characters.
+
+    """
+    charset = _lookup_charset(valid_characters, case_sensitive)
+    valid = "".join(sorted(charset)).encode("ascii")
+    if not report_position:
+        return _bool_lookup_validator(valid)
+    invalid_table = bytes(0 if chr(i) in charset else 1 for i in range(256))
+    return _position_lookup_validator(charset, valid, invalid_table)
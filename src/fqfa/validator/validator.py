@@ -1,4 +1,4 @@
-from fqfa.validator.create import create_validator
+from fqfa.validator.create import create_validator, create_lookup_validator
 from fqfa.constants.iupac.dna import DNA_BASES, DNA_CHARACTERS
 from fqfa.constants.iupac.rna import RNA_BASES
 from fqfa.constants.iupac.protein import AA_CODES, AA_CODES_ALL
@@ -9,6 +9,11 @@ __all__ = [
     "rna_bases_validator",
     "amino_acids_validator",
     "amino_acids_all_validator",
+    "dna_bases_lookup_validator",
+    "dna_characters_lookup_validator",
+    "rna_bases_lookup_validator",
+    "amino_acids_lookup_validator",
+    "amino_acids_all_lookup_validator",
 ]
 
 dna_bases_validator = create_validator(DNA_BASES)
@@ -54,3 +59,48 @@ codes found in
 :py:data:`~fqfa.constants.iupac.protein.AA_CODES_ALL`.
 
 """
+
+dna_bases_lookup_validator = create_lookup_validator(DNA_BASES)
+"""Callable[[AnyStr], bool]: lookup table-based validator for DNA bases.
+
+Returns True if all characters in the string or bytes-like object are found in
+:py:data:`~fqfa.constants.iupac.dna.DNA_BASES`.
+See :py:func:`~fqfa.validator.create.create_lookup_validator` for details.
+
+"""
+
+dna_characters_lookup_validator = create_lookup_validator(DNA_CHARACTERS)
+"""Callable[[AnyStr], bool]: lookup table-based validator for DNA bases and ambiguity
+characters.
+
+Returns True if all characters in the string or bytes-like object are found in
+:py:data:`~fqfa.constants.iupac.dna.DNA_CHARACTERS`.
+
+"""
+
+rna_bases_lookup_validator = create_lookup_validator(RNA_BASES)
+"""Callable[[AnyStr], bool]: lookup table-based validator for RNA bases.
+
+Returns True if all characters in the string or bytes-like object are found in
+:py:data:`~fqfa.constants.iupac.rna.RNA_BASES`.
+
+"""
+
+amino_acids_lookup_validator = create_lookup_validator(list(AA_CODES.keys()))
+"""Callable[[AnyStr], bool]: lookup table-based validator for amino acids.
+
+Returns True if all characters in the string or bytes-like object are single-letter
+amino acid codes found in
+:py:data:`~fqfa.constants.iupac.protein.AA_CODES`.
+
+"""
+
+amino_acids_all_lookup_validator = create_lookup_validator(list(AA_CODES_ALL.keys()))
+"""Callable[[AnyStr], bool]: lookup table-based validator for amino acids including
+ambiguous amino acids.
+
+Returns True if all characters in the string or bytes-like object are single-letter
+amino acid codes found in
+:py:data:`~fqfa.constants.iupac.protein.AA_CODES_ALL`.
+
+"""
@@ -1,6 +1,13 @@
 import unittest
-from io import StringIO
-from fqfa.fasta.fasta import parse_fasta_records, write_fasta_record
+import gzip
+from io import StringIO, BytesIO
+from fqfa.fasta.fasta import (
+    parse_fasta_records,
+    parse_fasta_records_chunked,
+    scan_fasta_records,
+    write_fasta_record,
+    write_fasta_records,
+)
 
 
 class TestYieldFastaRecords(unittest.TestCase):
@@ -46,6 +53,164 @@ class TestYieldFastaRecords(unittest.TestCase):
         self.assertTupleEqual(next(iterator), ("seq1", "ACGTTGCA"))
         self.assertRaises(StopIteration, next, iterator)
 
+    def test_binary(self) -> None:
+        data = BytesIO(b"ignored\n>seq1\nACGT\nTGCA\n>seq2\nTTTT\n")
+
+        iterator = parse_fasta_records(data)
+
+        self.assertTupleEqual(next(iterator), (b"seq1", b"ACGTTGCA"))
+        self.assertTupleEqual(next(iterator), (b"seq2", b"TTTT"))
+        self.assertRaises(StopIteration, next, iterator)
+
+        self.assertRaises(StopIteration, next, parse_fasta_records(BytesIO(b"")))
+
+
+class TestParseFastaRecordsChunked(unittest.TestCase):
+    def test_empty(self) -> None:
+        data = StringIO("")
+
+        iterator = parse_fasta_records_chunked(data)
+
+        # should return an empty generator
+        self.assertRaises(StopIteration, next, iterator)
+
+    def test_noheader(self) -> None:
+        data = StringIO("ACGT\n")
+
+        iterator = parse_fasta_records_chunked(data)
+
+        # should return an empty generator
+        self.assertRaises(StopIteration, next, iterator)
+
+    def test_chunks(self) -> None:
+        data = StringIO(">seq1\nACGTA\nCGTAC\nGT\n")
+
+        iterator = parse_fasta_records_chunked(data, chunk_size=4)
+
+        header, chunks = next(iterator)
+        self.assertEqual(header, "seq1")
+        self.assertListEqual(list(chunks), ["ACGT", "ACGT", "ACGT"])
+        self.assertRaises(StopIteration, next, iterator)
+
+    def test_partial_last_chunk(self) -> None:
+        data = StringIO(">seq1\nACGTAC\n>seq2\nAA\n")
+
+        iterator = parse_fasta_records_chunked(data, chunk_size=4)
+
+        header, chunks = next(iterator)
+        self.assertEqual(header, "seq1")
+        self.assertListEqual(list(chunks), ["ACGT", "AC"])
+        header, chunks = next(iterator)
+        self.assertEqual(header, "seq2")
+        self.assertListEqual(list(chunks), ["AA"])
+        self.assertRaises(StopIteration, next, iterator)
+
+    def test_overlap(self) -> None:
+        data = StringIO(">seq1\nACGTAC\nGTTT\n")
+
+        iterator = parse_fasta_records_chunked(data, chunk_size=4, overlap=2)
+
+        _, chunks = next(iterator)
+        self.assertListEqual(list(chunks), ["ACGT", "GTAC", "ACGT", "GTTT"])
+
+        # no trailing chunk that only contains overlapping bases
+        data = StringIO(">seq1\nACGTAC\n")
+
+        iterator = parse_fasta_records_chunked(data, chunk_size=4, overlap=2)
+
+        _, chunks = next(iterator)
+        self.assertListEqual(list(chunks), ["ACGT", "GTAC"])
+
+    def test_long_line(self) -> None:
+        seq = "ACGTTGCAAG" * 100
+        expected = [seq[i : i + 64] for i in range(0, len(seq) - 7, 57)]
+
+        for width in (len(seq), 60, 7):
+            lines = "\n".join(seq[i : i + width] for i in range(0, len(seq), width))
+            _, chunks = next(parse_fasta_records_chunked(StringIO(f">seq1\n{lines}\n"), chunk_size=64, overlap=7))
+            self.assertListEqual(list(chunks), expected)
+
+    def test_matches_full_records(self) -> None:
+        fasta_string = ">seq1\nACGTAAAA\nTTTTG\n\n>seq2\nTGCA\n>seq3\n>seq4\nTTTTTTTTTTTTC"
+
+        expected = list(parse_fasta_records(StringIO(fasta_string)))
+        for chunk_size in range(1, 15):
+            result = [
+                (header, "".join(chunks))
+                for header, chunks in parse_fasta_records_chunked(StringIO(fasta_string), chunk_size=chunk_size)
+            ]
+            self.assertListEqual(result, expected)
+
+    def test_unconsumed_chunks(self) -> None:
+        data = StringIO(">seq1\nACGT\nACGT\nACGT\n>seq2\nTTTT\n")
+
+        iterator = parse_fasta_records_chunked(data, chunk_size=2)
+
+        header, chunks = next(iterator)
+        self.assertEqual(header, "seq1")
+        self.assertEqual(next(chunks), "AC")
+        header, chunks = next(iterator)
+        self.assertEqual(header, "seq2")
+        self.assertListEqual(list(chunks), ["TT", "TT"])
+        self.assertRaises(StopIteration, next, iterator)
+
+    def test_empty_record(self) -> None:
+        data = StringIO(">seq1\n>seq2\nAC\n")
+
+        iterator = parse_fasta_records_chunked(data)
+
+        header, chunks = next(iterator)
+        self.assertEqual(header, "seq1")
+        self.assertListEqual(list(chunks), [])
+        header, chunks = next(iterator)
+        self.assertEqual(header, "seq2")
+        self.assertListEqual(list(chunks), ["AC"])
+
+    def test_bad_parameters(self) -> None:
+        self.assertRaises(ValueError, next, parse_fasta_records_chunked(StringIO(">seq1\nA"), chunk_size=0))
+        self.assertRaises(ValueError, next, parse_fasta_records_chunked(StringIO(">seq1\nA"), overlap=-1))
+        self.assertRaises(ValueError, next, parse_fasta_records_chunked(StringIO(">seq1\nA"), chunk_size=4, overlap=4))
+
+
+class TestScanFastaRecords(unittest.TestCase):
+    def test_empty(self) -> None:
+        iterator = scan_fasta_records(BytesIO(b""))
+
+        # should return an empty generator
+        self.assertRaises(StopIteration, next, iterator)
+
+        iterator = scan_fasta_records(BytesIO(b"ACGT\n"))
+
+        self.assertRaises(StopIteration, next, iterator)
+
+    def test_lengths(self) -> None:
+        data = BytesIO(b">seq1 some text \nACGT\n  TGC \n\n>seq2\n>seq3\r\nTTTT\r\n")
+
+        result = list(scan_fasta_records(data))
+
+        self.assertListEqual(
+            result, [("seq1 some text", 7, None, None), ("seq2", 0, None, None), ("seq3", 4, None, None)]
+        )
+        self.assertEqual(result[0].header, "seq1 some text")
+        self.assertEqual(result[0].length, 7)
+
+    def test_base_counts(self) -> None:
+        data = BytesIO(b">seq1\nACGTNN\nggnaT\n>seq2\nTTTT\n")
+
+        result = list(scan_fasta_records(data, base_counts=True))
+
+        self.assertListEqual(result, [("seq1", 11, 4, 3), ("seq2", 4, 0, 0)])
+        self.assertEqual(result[0].gc_count, 4)
+        self.assertEqual(result[0].n_count, 3)
+
+    def test_matches_parser(self) -> None:
+        fasta_string = "header\n>seq1\nACGTAAAA\nTTTTG\n\n>seq2\nTGCA\n>seq3\n>seq4\nTTTTTTTTTTTTC"
+
+        expected = [(header, len(seq)) for header, seq in parse_fasta_records(StringIO(fasta_string))]
+        result = [(r.header, r.length) for r in scan_fasta_records(BytesIO(fasta_string.encode()))]
+
+        self.assertListEqual(result, expected)
+
 
 class TestWriteFastaRecord(unittest.TestCase):
     def test_single_line_write(self) -> None:
@@ -137,6 +302,78 @@ class TestWriteFastaRecord(unittest.TestCase):
 
         self.assertRaises(ValueError, write_fasta_record, outfile, header, seq)
 
+    def test_bad_width(self) -> None:
+        outfile = StringIO()
+
+        self.assertRaises(ValueError, write_fasta_record, outfile, "test", "ACGT", width=0)
+
+    def test_binary(self) -> None:
+        outfile = BytesIO()
+
+        write_fasta_record(outfile, b" test ", b"ACGT\nAC", width=4)
+
+        self.assertEqual(outfile.getvalue(), b">test\nACGT\nAC\n")
+        self.assertRaises(TypeError, write_fasta_record, outfile, "test", b"ACGT")
+        self.assertRaises(TypeError, write_fasta_record, outfile, b"test", "ACGT")
+
+
+class TestWriteFastaRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        self.records = [("test", "ACGTAAAA"), (" test 2 ", "AC\nGTA"), ("test3", "A")]
+
+    def test_matches_single_writer(self) -> None:
+        for width in (1, 3, 4, 60):
+            expected = StringIO()
+            for header, seq in self.records:
+                write_fasta_record(expected, header, seq, width=width)
+
+            outfile = StringIO()
+            count = write_fasta_records(outfile, self.records, width=width)
+
+            self.assertEqual(count, len(self.records))
+            self.assertEqual(outfile.getvalue(), expected.getvalue())
+
+    def test_small_buffer(self) -> None:
+        outfile = StringIO()
+
+        write_fasta_records(outfile, self.records, width=4, buffer_size=1)
+
+        self.assertEqual(outfile.getvalue(), ">test\nACGT\nAAAA\n>test 2\nACGT\nA\n>test3\nA\n")
+
+    def test_binary_handle(self) -> None:
+        outfile = BytesIO()
+
+        write_fasta_records(outfile, self.records, width=4)
+
+        self.assertEqual(outfile.getvalue(), b">test\nACGT\nAAAA\n>test 2\nACGT\nA\n>test3\nA\n")
+
+    def test_compressed_handle(self) -> None:
+        outfile = BytesIO()
+
+        with gzip.GzipFile(fileobj=outfile, mode="wb") as handle:
+            write_fasta_records(handle, self.records, width=4)
+
+        self.assertEqual(gzip.decompress(outfile.getvalue()), b">test\nACGT\nAAAA\n>test 2\nACGT\nA\n>test3\nA\n")
+
+    def test_binary_records(self) -> None:
+        outfile = BytesIO()
+        records = [(h.encode(), s.encode()) for h, s in self.records]
+
+        write_fasta_records(outfile, records, width=4, buffer_size=10)
+
+        self.assertEqual(outfile.getvalue(), b">test\nACGT\nAAAA\n>test 2\nACGT\nA\n>test3\nA\n")
+        self.assertRaises(TypeError, write_fasta_records, StringIO(), records)
+
+    def test_no_records(self) -> None:
+        outfile = StringIO()
+
+        self.assertEqual(write_fasta_records(outfile, []), 0)
+        self.assertEqual(outfile.getvalue(), "")
+
+    def test_empty_values(self) -> None:
+        self.assertRaises(ValueError, write_fasta_records, StringIO(), [("test", "ACGT"), ("", "ACGT")])
+        self.assertRaises(ValueError, write_fasta_records, StringIO(), [("test", "ACGT"), ("test", " ")])
+
 
 if __name__ == "__main__":
     unittest.main()
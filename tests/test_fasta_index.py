@@ -0,0 +1,68 @@
+import os
+import unittest
+import tempfile
+from io import StringIO
+from fqfa.fasta.fasta import parse_fasta_records
+from fqfa.fasta.index import FastaIndex
+
+
+class TestFastaIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.fasta_string = "comment line\n>seq1 description \nACGT\nTGCA\n\n>seq2\n  TTTT  \r\n>seq3\nGG"
+        handle, self.path = tempfile.mkstemp(suffix=".fa")
+        with os.fdopen(handle, "w", newline="") as f:
+            f.write(self.fasta_string)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_matches_parser(self) -> None:
+        expected = dict(parse_fasta_records(StringIO(self.fasta_string)))
+
+        with FastaIndex(self.path) as index:
+            self.assertListEqual(list(index), list(expected))
+            self.assertEqual(len(index), 3)
+            for header, seq in expected.items():
+                self.assertEqual(index[header], seq)
+
+    def test_missing_record(self) -> None:
+        with FastaIndex(self.path) as index:
+            self.assertRaises(KeyError, index.__getitem__, "seq4")
+            self.assertRaises(KeyError, index.__getitem__, ">seq1 description")
+            self.assertIn("seq2", index)
+            self.assertNotIn("seq4", index)
+            self.assertIsNone(index.get("seq4"))
+
+    def test_cache(self) -> None:
+        with FastaIndex(self.path, cache_size=2) as index:
+            self.assertEqual(index["seq2"], "TTTT")
+            self.assertEqual(index["seq3"], "GG")
+            self.assertEqual(index["seq2"], "TTTT")
+            self.assertEqual(index["seq1 description"], "ACGTTGCA")
+            self.assertListEqual(list(index._cache), ["seq2", "seq1 description"])
+
+        with FastaIndex(self.path, cache_size=0) as index:
+            self.assertEqual(index["seq2"], "TTTT")
+            self.assertEqual(len(index._cache), 0)
+
+        self.assertRaises(ValueError, FastaIndex, self.path, cache_size=-1)
+
+    def test_duplicate_header(self) -> None:
+        with open(self.path, "w") as f:
+            f.write(">seq1\nACGT\n>seq1\nAAAA\n")
+
+        self.assertRaises(ValueError, FastaIndex, self.path)
+
+    def test_empty(self) -> None:
+        with open(self.path, "w") as f:
+            f.write("ACGT\n")
+
+        with FastaIndex(self.path) as index:
+            self.assertEqual(len(index), 0)
+
+    def test_missing_file(self) -> None:
+        self.assertRaises(FileNotFoundError, FastaIndex, self.path + ".missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
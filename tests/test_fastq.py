@@ -1,5 +1,5 @@
 import unittest
-from io import StringIO
+from io import StringIO, BytesIO
 from fqfa.fastq.fastqread import FastqRead
 from fqfa.fastq.fastq import parse_fastq_reads, parse_fastq_pe_reads
 
@@ -33,6 +33,17 @@ class TestYieldFastqReads(unittest.TestCase):
 
         self.assertRaises(ValueError, next, iterator)
 
+    def test_binary(self) -> None:
+        data = BytesIO(b"@TEST:123:456 AAA\nAAGNCT\n+\n!~ABCD\n@TEST:123:457 AAA\nACGT\n+\nAAAA\n")
+
+        reads = list(parse_fastq_reads(data))
+
+        self.assertEqual(len(reads), 2)
+        self.assertEqual(reads[0].header, b"@TEST:123:456 AAA")
+        self.assertEqual(reads[0].sequence, b"AAGNCT")
+        self.assertListEqual(reads[0].quality, [0, 93, 32, 33, 34, 35])
+        self.assertEqual(reads[1].sequence, b"ACGT")
+
 
 class TestYieldFastqReadsPe(unittest.TestCase):
     def test_empty(self) -> None:
@@ -100,6 +111,39 @@ class TestYieldFastqReadsPe(unittest.TestCase):
         test_rev_read.reverse_complement()
         self.assertTupleEqual(next(iterator), (test_fwd_read, test_rev_read))
 
+    def test_binary_pair_rc(self) -> None:
+        fwd_data = BytesIO(b"@TEST:123:456 AAA\nAAGNCT\n+\n!~ABCD\n")
+        rev_data = BytesIO(b"@TEST:123:456 BBB\nACGTAA\n+\nAAA!CD\n")
+
+        fwd, rev = next(parse_fastq_pe_reads(fwd_data, rev_data, revcomp=True))
+
+        self.assertEqual(fwd.sequence, b"AAGNCT")
+        self.assertEqual(rev.sequence, b"TTACGT")
+
+    def test_rc_batches(self) -> None:
+        fwd_data = StringIO("".join(f"@TEST:{i}\nAAGNCT\n+\n!~ABCD\n" for i in range(2500)))
+        rev_data = StringIO("".join(f"@TEST:{i}\nACGTAA\n+\nAAA!CD\n" for i in range(2500)))
+
+        pairs = list(parse_fastq_pe_reads(fwd_data, rev_data, revcomp=True))
+
+        self.assertEqual(len(pairs), 2500)
+        for fwd, rev in pairs:
+            self.assertEqual(fwd.sequence, "AAGNCT")
+            self.assertEqual(rev.sequence, "TTACGT")
+            self.assertListEqual(rev.quality, [35, 34, 0, 32, 32, 32])
+
+    def test_rc_error_order(self) -> None:
+        fwd_data = StringIO("".join(f"@TEST:{i}\nAAGNCT\n+\n!~ABCD\n" for i in range(3)) + "@TEST:3\nAA")
+        rev_data = StringIO("".join(f"@TEST:{i}\nACGTAA\n+\nAAA!CD\n" for i in range(4)))
+
+        iterator = parse_fastq_pe_reads(fwd_data, rev_data, revcomp=True)
+
+        for i in range(3):
+            fwd, rev = next(iterator)
+            self.assertEqual(fwd.header, f"@TEST:{i}")
+            self.assertEqual(rev.sequence, "TTACGT")
+        self.assertRaises(ValueError, next, iterator)
+
     def test_truncated(self) -> None:
         fwd_data = StringIO("@TEST:123:456 AAA\nAAGN")
         test_rev_read = FastqRead(
@@ -45,6 +45,16 @@ class TestFastqRead(unittest.TestCase):
         test_kwargs["quality_string"] = test_kwargs["quality_string"] + "!"
         self.assertRaises(ValueError, FastqRead, **test_kwargs)
 
+    def test_creation_bad_base_position(self) -> None:
+        test_kwargs = self.test_kwargs.copy()
+        test_kwargs["sequence"] = "AAGNXT"
+        with self.assertRaisesRegex(ValueError, "position 5"):
+            FastqRead(**test_kwargs)
+
+        test_kwargs = {k: v.encode("ascii") if isinstance(v, str) else v for k, v in test_kwargs.items()}
+        with self.assertRaisesRegex(ValueError, "position 5"):
+            FastqRead(**test_kwargs)
+
     def test_creation_bad_bases(self) -> None:
         # bad first base/duplicate header
         test_kwargs = self.test_kwargs.copy()
@@ -87,6 +97,31 @@ class TestFastqRead(unittest.TestCase):
         test_read = FastqRead(**self.test_kwargs)
         self.assertEqual(str(test_read), "\n".join(list(self.test_kwargs.values())[:4]))
 
+    def test_bytes(self) -> None:
+        test_kwargs = {k: v.encode() if isinstance(v, str) else v for k, v in self.test_kwargs.items()}
+        test_read = FastqRead(**test_kwargs)
+        self.assertEqual(test_read.header, test_kwargs["header"])
+        self.assertEqual(test_read.sequence, test_kwargs["sequence"])
+        self.assertListEqual(test_read.quality, self.test_quality)
+        self.assertEqual(bytes(test_read), b"\n".join(list(test_kwargs.values())[:4]))
+        self.assertEqual(str(test_read), str(FastqRead(**self.test_kwargs)))
+        self.assertEqual(bytes(FastqRead(**self.test_kwargs)), bytes(test_read))
+
+        test_read.reverse_complement()
+        self.assertEqual(test_read.sequence, reverse_complement(test_kwargs["sequence"]))
+        self.assertListEqual(test_read.quality, self.test_quality[::-1])
+
+    def test_bytes_bad_values(self) -> None:
+        test_kwargs = {k: v.encode() if isinstance(v, str) else v for k, v in self.test_kwargs.items()}
+        for key, value in (("header", b"TEST"), ("header2", b"@"), ("sequence", b"AAGWCT")):
+            bad_kwargs = test_kwargs.copy()
+            bad_kwargs[key] = value
+            self.assertRaises(ValueError, FastqRead, **bad_kwargs)
+
+        mixed_kwargs = test_kwargs.copy()
+        mixed_kwargs["header"] = self.test_kwargs["header"]
+        self.assertRaises(TypeError, FastqRead, **mixed_kwargs)
+
     def test_average_quality(self) -> None:
         test_read = FastqRead(**self.test_kwargs)
         self.assertEqual(test_read.average_quality(), mean(self.test_quality))
@@ -229,6 +264,12 @@ class TestFastqRead(unittest.TestCase):
         self.assertListEqual(test_read.quality, self.test_quality[::-1])
         self.assertEqual(test_read.quality_encoding_value, self.test_kwargs["quality_encoding_value"])
 
+        # other references to the quality values are not modified
+        quality = test_read.quality
+        test_read.reverse_complement()
+        self.assertListEqual(test_read.quality, self.test_quality)
+        self.assertListEqual(quality, self.test_quality[::-1])
+
 
 if __name__ == "__main__":
     unittest.main()
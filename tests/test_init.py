@@ -0,0 +1,28 @@
+import subprocess
+import sys
+import unittest
+import fqfa
+
+
+class TestPackageImports(unittest.TestCase):
+    def test_lazy_modules_not_imported(self):
+        code = (
+            "import sys, fqfa; print(' '.join(m for m in ('asyncio', 'multiprocessing', 'numpy') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True)
+        self.assertEqual(result.stdout.strip(), b"")
+
+    def test_lazy_exports(self):
+        from fqfa.util.kmer import KmerCounter
+        from fqfa.util.parallel import parallel_map
+
+        self.assertIs(fqfa.KmerCounter, KmerCounter)
+        self.assertIs(fqfa.parallel_map, parallel_map)
+        self.assertIn("aparse_fastq_reads", dir(fqfa))
+        for name in fqfa.__all__:
+            self.assertTrue(hasattr(fqfa, name), name)
+        self.assertRaises(AttributeError, getattr, fqfa, "not_a_function")
+
+
+if __name__ == "__main__":
+    unittest.main()
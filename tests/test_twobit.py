@@ -0,0 +1,132 @@
+import random
+import struct
+import unittest
+from io import BytesIO
+from fqfa.twobit.twobit import PackedSequence, read_twobit, write_twobit
+
+
+class TestPackedSequence(unittest.TestCase):
+    def test_packing(self) -> None:
+        packed = PackedSequence.from_sequence("TCAGA")
+
+        self.assertEqual(packed.packed, b"\x1b\x80")
+        self.assertEqual(len(packed), 5)
+        self.assertEqual(packed.n_blocks, ())
+        self.assertEqual(packed.mask_blocks, ())
+        self.assertEqual(str(packed), "TCAGA")
+
+    def test_blocks(self) -> None:
+        seq = "NNACGTacgtnnNNAWGTa"
+
+        packed = PackedSequence.from_sequence(seq)
+
+        self.assertEqual(packed.n_blocks, ((0, 2), (10, 4), (15, 1)))
+        self.assertEqual(packed.mask_blocks, ((6, 6), (18, 1)))
+        self.assertEqual(str(packed), "NNACGTacgtnnNNANGTa")
+
+    def test_empty(self) -> None:
+        packed = PackedSequence.from_sequence("")
+
+        self.assertEqual(len(packed), 0)
+        self.assertEqual(str(packed), "")
+
+    def test_subsequence(self) -> None:
+        rng = random.Random(0)
+        seq = "".join(rng.choices("ACGTacgtN", k=200))
+        expected = seq.replace("n", "N")
+
+        packed = PackedSequence.from_sequence(seq)
+
+        self.assertEqual(str(packed), expected)
+        for _ in range(200):
+            start = rng.randrange(0, len(seq))
+            end = rng.randrange(start, len(seq) + 1)
+            self.assertEqual(packed.subsequence(start, end), expected[start:end])
+            self.assertEqual(packed[start:end], expected[start:end])
+            self.assertEqual(packed[start], expected[start])
+
+    def test_indexing(self) -> None:
+        packed = PackedSequence.from_sequence("ACGTNa")
+
+        self.assertEqual(packed[-1], "a")
+        self.assertEqual(packed[:3], "ACG")
+        self.assertEqual(packed[4:], "Na")
+        self.assertEqual(packed[5:2], "")
+        self.assertRaises(IndexError, packed.__getitem__, 6)
+        self.assertRaises(ValueError, packed.__getitem__, slice(None, None, 2))
+        self.assertRaises(ValueError, packed.subsequence, 3, 2)
+        self.assertRaises(ValueError, packed.subsequence, 0, 7)
+
+    def test_bad_length(self) -> None:
+        self.assertRaises(ValueError, PackedSequence, b"\x00", 5)
+
+
+class TestTwoBitFiles(unittest.TestCase):
+    def setUp(self) -> None:
+        self.records = [("chr1", "ACGTNNNNacgtTTGA"), ("chr2", "GGGA"), ("chrM", "nnnnACGTAGCCCA")]
+
+    def test_round_trip(self) -> None:
+        data = BytesIO()
+
+        write_twobit(data, self.records)
+        data.seek(0)
+        result = read_twobit(data)
+
+        self.assertListEqual(list(result), ["chr1", "chr2", "chrM"])
+        for name, seq in self.records:
+            self.assertEqual(str(result[name]), seq)
+
+    def test_packed_records(self) -> None:
+        data = BytesIO()
+
+        write_twobit(data, [(name, PackedSequence.from_sequence(seq)) for name, seq in self.records])
+        data.seek(0)
+        result = read_twobit(data)
+
+        self.assertDictEqual({k: str(v) for k, v in result.items()}, dict(self.records))
+
+    def test_file_layout(self) -> None:
+        data = BytesIO()
+
+        write_twobit(data, [("s", "NAcG")])
+
+        self.assertEqual(
+            data.getvalue(),
+            struct.pack("<IIII", 0x1A412743, 0, 1, 0)
+            + b"\x01s"
+            + struct.pack("<I", 22)
+            + struct.pack("<IIIIIIII", 4, 1, 0, 1, 1, 2, 1, 0)
+            + b"\x27",
+        )
+
+    def test_big_endian(self) -> None:
+        data = BytesIO(
+            struct.pack(">IIII", 0x1A412743, 0, 1, 0)
+            + b"\x01s"
+            + struct.pack(">I", 22)
+            + struct.pack(">IIIIIIII", 4, 1, 0, 1, 1, 2, 1, 0)
+            + b"\x27"
+        )
+
+        result = read_twobit(data)
+
+        self.assertEqual(str(result["s"]), "NAcG")
+
+    def test_bad_files(self) -> None:
+        self.assertRaises(ValueError, read_twobit, BytesIO(b""))
+        self.assertRaises(ValueError, read_twobit, BytesIO(b"\x00" * 16))
+        self.assertRaises(ValueError, read_twobit, BytesIO(struct.pack("<IIII", 0x1A412743, 2, 0, 0)))
+
+        data = BytesIO()
+        write_twobit(data, self.records)
+        self.assertRaises(ValueError, read_twobit, BytesIO(data.getvalue()[:-10]))
+
+    def test_bad_names(self) -> None:
+        self.assertRaises(ValueError, write_twobit, BytesIO(), [("", "ACGT")])
+        self.assertRaises(ValueError, write_twobit, BytesIO(), [("x" * 256, "ACGT")])
+        self.assertRaises(ValueError, write_twobit, BytesIO(), [("µ", "ACGT")])
+        self.assertRaises(ValueError, write_twobit, BytesIO(), [("a", "ACGT"), ("a", "ACGT")])
+
+
+if __name__ == "__main__":
+    unittest.main()
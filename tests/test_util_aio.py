@@ -0,0 +1,144 @@
+import os
+import gzip
+import shutil
+import asyncio
+import tempfile
+import unittest
+import unittest.mock as mock
+from io import StringIO
+from typing import List, Any
+from fqfa.fasta.fasta import parse_fasta_records
+from fqfa.fastq.fastq import parse_fastq_reads
+from fqfa.util.aio import aparse_fastq_reads, aparse_fasta_records
+from fqfa.util.file import open_compressed
+
+
+async def collect(iterator: Any) -> List[Any]:
+    return [x async for x in iterator]
+
+
+class TestAparseFastqReads(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = "".join(f"@TEST:{i}\nACGTN\n+\nAAAA{i % 10}\n" for i in range(1000))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+
+    def write_file(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "wb") as handle:
+            handle.write(data)
+        return path
+
+    def test_matches_parser(self) -> None:
+        expected = list(parse_fastq_reads(StringIO(self.data)))
+        path = self.write_file("file.fq.gz", gzip.compress(self.data.encode()))
+        for chunk_size in (1, 7, 100, 1 << 18):
+            result = asyncio.run(collect(aparse_fastq_reads(path, chunk_size=chunk_size)))
+            self.assertListEqual(result, expected)
+
+    def test_binary(self) -> None:
+        path = self.write_file("file.fq", self.data.encode())
+
+        result = asyncio.run(collect(aparse_fastq_reads(path, mode="rb", chunk_size=50)))
+
+        self.assertEqual(len(result), 1000)
+        self.assertEqual(result[0].header, b"@TEST:0")
+        self.assertEqual(result[0].sequence, b"ACGTN")
+
+    def test_no_trailing_newline(self) -> None:
+        path = self.write_file("file.fq", self.data.rstrip().encode())
+        self.assertEqual(len(asyncio.run(collect(aparse_fastq_reads(path)))), 1000)
+
+    def test_truncated(self) -> None:
+        path = self.write_file("file.fq", b"@TEST:123:456 AAA\nAAGN")
+        self.assertRaises(ValueError, asyncio.run, collect(aparse_fastq_reads(path)))
+
+    def test_bad_parameters(self) -> None:
+        path = self.write_file("file.fq", self.data.encode())
+        self.assertRaises(ValueError, asyncio.run, collect(aparse_fastq_reads(path, mode="w")))
+        self.assertRaises(ValueError, asyncio.run, collect(aparse_fastq_reads(path, chunk_size=0)))
+        self.assertRaises(
+            FileNotFoundError, asyncio.run, collect(aparse_fastq_reads(os.path.join(self.tmpdir, "missing.fq")))
+        )
+
+    def test_early_close(self) -> None:
+        path = self.write_file("file.fq", self.data.encode())
+        handles = list()
+
+        def open_and_record(*args: Any, **kwargs: Any) -> Any:
+            handles.append(open_compressed(*args, **kwargs))
+            return handles[-1]
+
+        async def read_one() -> None:
+            iterator = aparse_fastq_reads(path, chunk_size=10)
+            async for _ in iterator:
+                break
+            await iterator.aclose()
+
+        with mock.patch("fqfa.util.aio.open_compressed", side_effect=open_and_record):
+            asyncio.run(read_one())
+
+        self.assertEqual(len(handles), 1)
+        self.assertTrue(handles[0].closed)
+
+    def test_cancel(self) -> None:
+        path = self.write_file("file.fq", self.data.encode())
+
+        async def consume(event: asyncio.Event) -> None:
+            async for _ in aparse_fastq_reads(path, chunk_size=10):
+                event.set()
+                await asyncio.sleep(1)
+
+        async def run() -> None:
+            event = asyncio.Event()
+            task = asyncio.ensure_future(consume(event))
+            await event.wait()
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+    def test_concurrent(self) -> None:
+        paths = [self.write_file(f"file{i}.fq", self.data.encode()) for i in range(4)]
+
+        async def run() -> List[List[Any]]:
+            return list(await asyncio.gather(*[collect(aparse_fastq_reads(p, chunk_size=100)) for p in paths]))
+
+        for result in asyncio.run(run()):
+            self.assertEqual(len(result), 1000)
+
+
+class TestAparseFastaRecords(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = "ignored\n" + "".join(f">seq{i}\nACGT\n\nTT{'G' * i}\n" for i in range(100))
+        self.path = os.path.join(self.tmpdir, "file.fa")
+        with open(self.path, "w") as handle:
+            handle.write(self.data)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+
+    def test_matches_parser(self) -> None:
+        expected = list(parse_fasta_records(StringIO(self.data)))
+        for chunk_size in (1, 13, 1 << 18):
+            result = asyncio.run(collect(aparse_fasta_records(self.path, chunk_size=chunk_size)))
+            self.assertListEqual(result, expected)
+
+    def test_binary(self) -> None:
+        result = asyncio.run(collect(aparse_fasta_records(self.path, mode="rb", chunk_size=16)))
+
+        self.assertEqual(len(result), 100)
+        self.assertTupleEqual(result[2], (b"seq2", b"ACGTTTGG"))
+
+    def test_empty(self) -> None:
+        path = os.path.join(self.tmpdir, "empty.fa")
+        open(path, "w").close()
+        self.assertListEqual(asyncio.run(collect(aparse_fasta_records(path))), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
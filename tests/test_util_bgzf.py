@@ -0,0 +1,161 @@
+import io
+import os
+import gzip
+import shutil
+import tempfile
+import unittest
+from fqfa.util.bgzf import (
+    BgzfReader,
+    BgzfWriter,
+    bgzf_block_offsets,
+    make_virtual_offset,
+    split_virtual_offset,
+)
+from fqfa.util.file import open_compressed
+
+
+class TestVirtualOffsets(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        self.assertEqual(make_virtual_offset(0, 0), 0)
+        self.assertEqual(make_virtual_offset(1, 2), 65538)
+        self.assertTupleEqual(split_virtual_offset(65538), (1, 2))
+        self.assertTupleEqual(split_virtual_offset(make_virtual_offset(123456, 65535)), (123456, 65535))
+
+    def test_out_of_range(self) -> None:
+        self.assertRaises(ValueError, make_virtual_offset, 0, 65536)
+        self.assertRaises(ValueError, make_virtual_offset, -1, 0)
+        self.assertRaises(ValueError, make_virtual_offset, 2**48, 0)
+
+
+class TestBgzf(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "file.fq.gz")
+        self.records = [f"@TEST:{i}\nACGTACGTAC\n+\nAAAAAAAAAA\n".encode() for i in range(20000)]
+        self.data = b"".join(self.records)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+
+    def test_gzip_compatible(self) -> None:
+        for threads in (1, 3):
+            with BgzfWriter(self.path, threads=threads) as writer:
+                writer.write(self.data)
+
+            with gzip.open(self.path, "rb") as handle:
+                self.assertEqual(handle.read(), self.data)
+
+            with open(self.path, "rb") as handle:
+                self.assertEqual(
+                    handle.read()[-28:], bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+                )
+
+    def test_read(self) -> None:
+        with BgzfWriter(self.path, compresslevel=1) as writer:
+            for record in self.records:
+                writer.write(record)
+
+        for threads in (1, 4):
+            with BgzfReader(self.path, threads=threads) as reader:
+                self.assertEqual(reader.read(), self.data)
+                self.assertEqual(reader.read(), b"")
+
+            with BgzfReader(self.path, threads=threads) as reader:
+                self.assertListEqual(list(reader), self.data.splitlines(keepends=True))
+
+            with BgzfReader(self.path, threads=threads) as reader:
+                self.assertEqual(reader.read(5), self.data[:5])
+                self.assertEqual(reader.readline(), self.data[5 : self.data.index(b"\n") + 1])
+                self.assertEqual(reader.readline(3), b"ACG")
+
+    def test_virtual_offsets(self) -> None:
+        offsets = list()
+        with BgzfWriter(self.path, threads=2) as writer:
+            for record in self.records:
+                offsets.append(writer.tell())
+                writer.write(record)
+
+        with BgzfReader(self.path, threads=2) as reader:
+            for i in (0, 1, 5000, 12345, 19999, 3):
+                reader.seek(offsets[i])
+                self.assertEqual(reader.tell(), offsets[i])
+                self.assertEqual(reader.read(len(self.records[i])), self.records[i])
+
+            reader.seek(offsets[0])
+            for i in range(len(self.records)):
+                self.assertEqual(reader.tell(), offsets[i])
+                reader.readline()
+                reader.readline()
+                reader.readline()
+                reader.readline()
+
+            self.assertRaises(ValueError, reader.seek, 0, io.SEEK_END)
+
+    def test_append(self) -> None:
+        path = os.path.join(self.tmpdir, "file.fq.bgz")
+        with BgzfWriter(path) as writer:
+            writer.write(self.data)
+
+        for opener in (lambda: BgzfWriter(open(path, "ab")), lambda: open_compressed(path, mode="ab")):
+            with opener() as writer:
+                offset = writer.tell()
+                self.assertEqual(split_virtual_offset(offset), (os.path.getsize(path), 0))
+                writer.write(self.records[0])
+
+            with BgzfReader(path) as reader:
+                reader.seek(offset)
+                self.assertEqual(reader.read(), self.records[0])
+
+    def test_block_offsets(self) -> None:
+        with BgzfWriter(self.path) as writer:
+            writer.write(self.data)
+
+        with open(self.path, "rb") as handle:
+            blocks = bgzf_block_offsets(handle)
+
+        self.assertEqual(len(blocks), (len(self.data) + 0xFF00 - 1) // 0xFF00)
+        self.assertEqual(blocks[0], 0)
+
+        # reading from each block start gives all the data
+        chunks = list()
+        with BgzfReader(self.path) as reader:
+            for block in blocks:
+                reader.seek(make_virtual_offset(block, 0))
+                chunks.append(reader.read1())
+        self.assertEqual(b"".join(chunks), self.data)
+
+    def test_open_compressed(self) -> None:
+        with BgzfWriter(self.path) as writer:
+            writer.write(self.data)
+
+        for threads in (1, 2):
+            with open_compressed(self.path, threads=threads) as handle:
+                self.assertEqual(handle.read(), self.data.decode())
+
+    def test_empty(self) -> None:
+        with BgzfWriter(self.path):
+            pass
+
+        with BgzfReader(self.path) as reader:
+            self.assertEqual(reader.read(), b"")
+
+    def test_invalid(self) -> None:
+        with open(self.path, "wb") as handle:
+            handle.write(gzip.compress(self.data))
+
+        with BgzfReader(self.path) as reader:
+            self.assertRaises(ValueError, reader.read)
+
+        with BgzfWriter(self.path) as writer:
+            writer.write(self.data)
+        with open(self.path, "rb") as handle:
+            truncated = handle.read()[:1000]
+        with BgzfReader(io.BytesIO(truncated)) as reader:
+            self.assertRaises(ValueError, reader.read)
+
+        self.assertRaises(ValueError, BgzfReader, self.path, threads=0)
+        self.assertRaises(ValueError, BgzfWriter, io.BytesIO(), threads=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import random
+import unittest
+import unittest.mock as mock
+from itertools import combinations
+from typing import Optional
+from fqfa.util.distance import (
+    hamming_distance,
+    levenshtein_distance,
+    HammingLibrary,
+    find_pairs_within_distance,
+    _np,
+)
+
+
+def naive_levenshtein(a: str, b: str) -> int:
+    previous = list(range(len(b) + 1))
+    for i, x in enumerate(a, 1):
+        current = [i]
+        for j, y in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (x != y)))
+        previous = current
+    return previous[-1]
+
+
+class TestHammingDistance(unittest.TestCase):
+    def test_distance(self) -> None:
+        self.assertEqual(hamming_distance("ACGT", "ACGT"), 0)
+        self.assertEqual(hamming_distance("ACGT", "AGGA"), 2)
+        self.assertEqual(hamming_distance(b"ACGT", b"TGCA"), 4)
+        self.assertEqual(hamming_distance("", ""), 0)
+
+    def test_length_mismatch(self) -> None:
+        self.assertRaises(ValueError, hamming_distance, "ACGT", "ACG")
+
+
+class TestLevenshteinDistance(unittest.TestCase):
+    def test_distance(self) -> None:
+        self.assertEqual(levenshtein_distance("kitten", "sitting"), 3)
+        self.assertEqual(levenshtein_distance("", "ACG"), 3)
+        self.assertEqual(levenshtein_distance("ACGT", ""), 4)
+        self.assertEqual(levenshtein_distance(b"ACGT", b"AGT"), 1)
+
+    def test_matches_naive(self) -> None:
+        rng = random.Random(0)
+        for _ in range(300):
+            a = "".join(rng.choices("ACGT", k=rng.randint(0, 12)))
+            b = "".join(rng.choices("ACGT", k=rng.randint(0, 12)))
+            expected = naive_levenshtein(a, b)
+            self.assertEqual(levenshtein_distance(a, b), expected)
+            for max_distance in range(0, 6):
+                result = levenshtein_distance(a, b, max_distance=max_distance)
+                self.assertEqual(result, expected if expected <= max_distance else None)
+
+    def test_bad_parameters(self) -> None:
+        self.assertRaises(ValueError, levenshtein_distance, "A", "A", max_distance=-1)
+
+
+class TestHammingLibrary(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(1)
+        self.seqs = ["".join(rng.choices("ACGTN", k=12)) for _ in range(200)]
+        self.query = self.seqs[7][:6] + "ACGTAC"
+
+    def check(self, use_numpy: bool) -> None:
+        library = HammingLibrary(self.seqs, use_numpy=use_numpy)
+        expected = [hamming_distance(self.query, x) for x in self.seqs]
+        self.assertEqual(len(library), len(self.seqs))
+        self.assertListEqual(library.distances(self.query), expected)
+        self.assertListEqual(library.distances(self.query.encode()), expected)
+        self.assertListEqual(library.within(self.query, 6), [i for i, d in enumerate(expected) if d <= 6])
+        self.assertRaises(ValueError, library.distances, "ACGT")
+
+    def test_integers(self) -> None:
+        self.check(use_numpy=False)
+
+    @unittest.skipIf(_np is None, "requires numpy")
+    def test_numpy(self) -> None:
+        self.check(use_numpy=True)
+
+    def test_bad_parameters(self) -> None:
+        self.assertRaises(ValueError, HammingLibrary, ["ACGT", "ACG"])
+        self.assertRaises(ValueError, HammingLibrary, ["ACGT", "ACGÄ"])
+
+
+class TestFindPairsWithinDistance(unittest.TestCase):
+    def check(self, use_numpy: Optional[bool]) -> None:
+        rng = random.Random(2)
+        seqs = ["".join(rng.choices("ACGT", k=10)) for _ in range(100)]
+        seqs += [s[:3] + "A" + s[4:] for s in seqs[:20]]  # close pairs
+        seqs += seqs[:5]  # duplicates
+        for max_distance in (0, 1, 2, 3, 10, 12):
+            expected = [
+                (i, j, hamming_distance(seqs[i], seqs[j]))
+                for i, j in combinations(range(len(seqs)), 2)
+                if hamming_distance(seqs[i], seqs[j]) <= max_distance
+            ]
+            self.assertListEqual(find_pairs_within_distance(seqs, max_distance, use_numpy=use_numpy), expected)
+
+    def test_integers(self) -> None:
+        self.check(use_numpy=False)
+
+    @unittest.skipIf(_np is None, "requires numpy")
+    def test_numpy(self) -> None:
+        self.check(use_numpy=True)
+
+    @unittest.skipIf(_np is None, "requires numpy")
+    @mock.patch("fqfa.util.distance._PAIR_BLOCK_SIZE", 50)
+    def test_numpy_blocks(self) -> None:
+        self.check(use_numpy=True)
+
+    @unittest.skipIf(_np is None, "requires numpy")
+    @mock.patch("fqfa.util.distance._NUMPY_BUCKET_SIZE", 3)
+    def test_automatic(self) -> None:
+        # both small and large buckets are present
+        self.check(use_numpy=None)
+
+    def test_empty(self) -> None:
+        self.assertListEqual(find_pairs_within_distance([], 1), [])
+        self.assertListEqual(find_pairs_within_distance(["", ""], 1), [(0, 1, 0)])
+
+    def test_bad_parameters(self) -> None:
+        self.assertRaises(ValueError, find_pairs_within_distance, ["ACGT", "ACG"], 1)
+        self.assertRaises(ValueError, find_pairs_within_distance, ["ACGT"], -1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,39 +1,251 @@
+import os
+import io
+import bz2
+import gzip
+import lzma
+import shutil
+import tempfile
 import unittest
 import unittest.mock as mock
 
-from fqfa.util.file import open_compressed, has_fastq_ext, has_fasta_ext
+from fqfa.util.file import open_compressed, has_fastq_ext, has_fasta_ext, _ReadAheadReader, _WriteBehindWriter
+from fqfa.util.bgzf import bgzf_block_offsets
 
 
 class TestOpenCompressed(unittest.TestCase):
-    @mock.patch("fqfa.util.file.gzip.open")
-    @mock.patch("fqfa.util.file.os.path.isfile")
-    def test_open_gzip(self, mock_isfile, mock_gzip_open) -> None:
-        mock_isfile.return_value = False
-        self.assertRaises(FileNotFoundError, open_compressed, "file.fq.gz")
-
-        mock_isfile.return_value = True
-        mock_gzip_open.return_value = "opened gz"
-        self.assertEqual("opened gz", open_compressed("file.fq.gz"))
-
-    @mock.patch("fqfa.util.file.bz2.open")
-    @mock.patch("fqfa.util.file.os.path.isfile")
-    def test_open_bzip2(self, mock_isfile, mock_bz2_open) -> None:
-        mock_isfile.return_value = False
-        self.assertRaises(FileNotFoundError, open_compressed, "file.fq.bz2")
-
-        mock_isfile.return_value = True
-        mock_bz2_open.return_value = "opened bz2"
-        self.assertEqual("opened bz2", open_compressed("file.fq.bz2"))
-
-    @mock.patch("fqfa.util.file.open")
-    @mock.patch("fqfa.util.file.os.path.isfile")
-    def test_open_uncompressed(self, mock_isfile, mock_default_open) -> None:
-        mock_isfile.return_value = False
-        self.assertRaises(FileNotFoundError, open_compressed, "file.fq")
-
-        mock_isfile.return_value = True
-        mock_default_open.return_value = "opened uncompressed"
-        self.assertEqual("opened uncompressed", open_compressed("file.fq"))
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = "@TEST:123:456 AAA\nACGT\n+\nAAAA\n"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+
+    def write_file(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "wb") as handle:
+            handle.write(data)
+        return path
+
+    def test_missing_file(self) -> None:
+        self.assertRaises(FileNotFoundError, open_compressed, os.path.join(self.tmpdir, "file.fq.gz"))
+
+    def test_open_gzip(self) -> None:
+        path = self.write_file("file.fq.gz", gzip.compress(self.data.encode()))
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+    def test_open_bzip2(self) -> None:
+        path = self.write_file("file.fq.bz2", bz2.compress(self.data.encode()))
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+    def test_open_xz(self) -> None:
+        path = self.write_file("file.fq.xz", lzma.compress(self.data.encode()))
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+        path = self.write_file("file.fq.lzma", lzma.compress(self.data.encode(), format=lzma.FORMAT_ALONE))
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+    def test_open_uncompressed(self) -> None:
+        path = self.write_file("file.fq", self.data.encode())
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+        path = self.write_file("empty.fq", b"")
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), "")
+
+    def test_misnamed(self) -> None:
+        path = self.write_file("file.fq", gzip.compress(self.data.encode()))
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+        path = self.write_file("file.fq.gz", bz2.compress(self.data.encode()))
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+        path = self.write_file("file.fq.bz2", self.data.encode())
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+    def test_bzip2_signature(self) -> None:
+        # text starting with the bzip2 signature is not compressed
+        for data in ("BZh\n", "BZh9\n", "BZh91AY\nACGT\n"):
+            with self.subTest(data=data):
+                path = self.write_file("file.fa", data.encode())
+                with open_compressed(path) as handle:
+                    self.assertEqual(handle.read(), data)
+
+        path = self.write_file("empty.fa.bz2", bz2.compress(b""))
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), "")
+
+    def test_open_stream(self) -> None:
+        with open_compressed(io.BytesIO(gzip.compress(self.data.encode()))) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+        with open_compressed(io.BufferedReader(io.BytesIO(bz2.compress(self.data.encode())))) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+        with open_compressed(io.BytesIO(self.data.encode())) as handle:
+            self.assertEqual(handle.read(), self.data)
+
+    @mock.patch("fqfa.util.file._zstd", None)
+    def test_zstd_unavailable(self) -> None:
+        path = self.write_file("file.fq.zst", b"\x28\xb5\x2f\xfd" + bytes(8))
+        self.assertRaises(NotImplementedError, open_compressed, path)
+
+    @mock.patch("fqfa.util.file._zstd")
+    def test_zstd(self, mock_zstd) -> None:
+        path = self.write_file("file.fq.zst", b"\x28\xb5\x2f\xfd" + bytes(8))
+        mock_zstd.open.return_value = io.BytesIO(self.data.encode())
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data)
+        mock_zstd.open.assert_called_once_with(path, mode="rb")
+
+
+class TestReadAhead(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = "".join(f"@TEST:{i}\nACGT\n+\nAAAA\n" for i in range(10000))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+
+    def test_open_read_ahead(self) -> None:
+        for name, compress in (("file.fq", bytes), ("file.fq.gz", gzip.compress), ("file.fq.bz2", bz2.compress)):
+            path = os.path.join(self.tmpdir, name)
+            with open(path, "wb") as handle:
+                handle.write(compress(self.data.encode()))
+
+            with open_compressed(path, read_ahead=True) as handle:
+                self.assertListEqual(list(handle), self.data.splitlines(keepends=True))
+
+    def test_small_blocks(self) -> None:
+        reader = _ReadAheadReader(io.BytesIO(self.data.encode()), block_size=7, max_blocks=2)
+        with io.BufferedReader(reader, buffer_size=5) as handle:
+            self.assertEqual(handle.read(), self.data.encode())
+
+    def test_early_close(self) -> None:
+        source = io.BytesIO(self.data.encode())
+        reader = _ReadAheadReader(source, block_size=3, max_blocks=1)
+
+        self.assertEqual(reader.read(3), self.data.encode()[:3])
+        reader.close()
+
+        self.assertTrue(reader.closed)
+        self.assertTrue(source.closed)
+        self.assertFalse(reader._thread.is_alive())
+
+    def test_error(self) -> None:
+        source = mock.MagicMock()
+        source.read.side_effect = OSError("corrupt file")
+        with _ReadAheadReader(source) as reader:
+            self.assertRaises(OSError, reader.read, 10)
+
+
+class TestOpenCompressedWrite(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = "".join(f"@TEST:{i}\nACGT\n+\nAAAA\n" for i in range(10000))
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmpdir)
+
+    def test_round_trip(self) -> None:
+        expected = {
+            "file.fq": bytes,
+            "file.fq.gz": gzip.decompress,
+            "file.fq.bgz": gzip.decompress,
+            "file.fq.bz2": bz2.decompress,
+            "file.fq.xz": lzma.decompress,
+            "file.fq.lzma": lzma.decompress,
+        }
+        for name, decompress in expected.items():
+            for threads in (1, 3):
+                with self.subTest(name=name, threads=threads):
+                    path = os.path.join(self.tmpdir, name)
+                    with open_compressed(path, mode="w", threads=threads) as handle:
+                        handle.write(self.data)
+                    with open(path, "rb") as handle:
+                        self.assertEqual(decompress(handle.read()), self.data.encode())
+                    with open_compressed(path) as handle:
+                        self.assertEqual(handle.read(), self.data)
+
+    def test_threaded_gzip_is_bgzf(self) -> None:
+        path = os.path.join(self.tmpdir, "file.fq.gz")
+        with open_compressed(path, mode="wt", threads=2) as handle:
+            handle.write(self.data * 4)
+        with open(path, "rb") as handle:
+            self.assertGreater(len(bgzf_block_offsets(handle)), 2)
+
+    def test_compresslevel(self) -> None:
+        sizes = list()
+        for level in (1, 9):
+            path = os.path.join(self.tmpdir, f"level{level}.fq.gz")
+            with open_compressed(path, mode="w", compresslevel=level) as handle:
+                handle.write(self.data)
+            sizes.append(os.path.getsize(path))
+        self.assertGreater(sizes[0], sizes[1])
+
+    def test_default_compresslevel(self) -> None:
+        # the default level is the same for gzip and the BGZF output written using threads
+        sizes = list()
+        for threads, level in ((1, None), (1, 6), (2, None), (2, 6)):
+            path = os.path.join(self.tmpdir, f"threads{threads}.fq.gz")
+            with open_compressed(path, mode="w", compresslevel=level, threads=threads) as handle:
+                handle.write(self.data)
+            sizes.append(os.path.getsize(path))
+        self.assertEqual(sizes[0], sizes[1])
+        self.assertEqual(sizes[2], sizes[3])
+
+    def test_append(self) -> None:
+        path = os.path.join(self.tmpdir, "file.fq.gz")
+        for _ in range(2):
+            with open_compressed(path, mode="a") as handle:
+                handle.write(self.data)
+        with open_compressed(path) as handle:
+            self.assertEqual(handle.read(), self.data * 2)
+
+    def test_exclusive(self) -> None:
+        path = os.path.join(self.tmpdir, "file.fq.bz2")
+        with open_compressed(path, mode="x") as handle:
+            handle.write(self.data)
+        self.assertRaises(FileExistsError, open_compressed, path, mode="x")
+
+    def test_invalid(self) -> None:
+        path = os.path.join(self.tmpdir, "file.fq")
+        self.assertRaises(ValueError, open_compressed, path, mode="rw")
+        self.assertRaises(ValueError, open_compressed, path, mode="wb", encoding="utf-8")
+        self.assertRaises(ValueError, open_compressed, path, mode="w", threads=0)
+        self.assertRaises(ValueError, open_compressed, io.BytesIO(), mode="w")
+
+    def test_binary(self) -> None:
+        for name in ("file.fq", "file.fq.gz", "file.fq.bz2"):
+            with self.subTest(name=name):
+                path = os.path.join(self.tmpdir, name)
+                with open_compressed(path, mode="wb") as handle:
+                    handle.write(self.data.encode())
+                with open_compressed(path, mode="rb") as handle:
+                    self.assertListEqual(list(handle), self.data.encode().splitlines(keepends=True))
+                with open_compressed(path, mode="rb", read_ahead=True) as handle:
+                    self.assertEqual(handle.read(), self.data.encode())
+
+    @mock.patch("fqfa.util.file._zstd", None)
+    def test_zstd_unavailable(self) -> None:
+        path = os.path.join(self.tmpdir, "file.fq.zst")
+        self.assertRaises(NotImplementedError, open_compressed, path, mode="w")
+
+    def test_write_behind_error(self) -> None:
+        target = mock.MagicMock()
+        target.write.side_effect = OSError("disk full")
+        writer = _WriteBehindWriter(target)
+        writer.write(b"ACGT")
+        self.assertRaises(OSError, writer.close)
+        self.assertTrue(writer.closed)
+        target.close.assert_called_once_with()
 
 
 class TestHasFastqExt(unittest.TestCase):
@@ -88,6 +300,15 @@ class TestHasFastqExt(unittest.TestCase):
         self.assertTrue(has_fastq_ext("/abs/path/to/file.fq.gz"))
         self.assertTrue(has_fastq_ext("/abs/path/to/file.fastq.gz"))
 
+    def test_compressed_other(self) -> None:
+        for ext in (".xz", ".lzma", ".zst"):
+            self.assertTrue(has_fastq_ext("file.fq" + ext))
+            self.assertTrue(has_fastq_ext("file.fastq" + ext))
+            self.assertTrue(has_fastq_ext(("file.fastq" + ext).upper()))
+
+            self.assertFalse(has_fastq_ext("file" + ext))
+            self.assertFalse(has_fastq_ext("file.txt" + ext))
+
 
 class TestHasFastaExt(unittest.TestCase):
     def test_uncompressed(self) -> None:
@@ -141,6 +362,15 @@ class TestHasFastaExt(unittest.TestCase):
         self.assertTrue(has_fasta_ext("/abs/path/to/file.fa.gz"))
         self.assertTrue(has_fasta_ext("/abs/path/to/file.fasta.gz"))
 
+    def test_compressed_other(self) -> None:
+        for ext in (".xz", ".lzma", ".zst"):
+            self.assertTrue(has_fasta_ext("file.fa" + ext))
+            self.assertTrue(has_fasta_ext("file.fasta" + ext))
+            self.assertTrue(has_fasta_ext(("file.fasta" + ext).upper()))
+
+            self.assertFalse(has_fasta_ext("file" + ext))
+            self.assertFalse(has_fasta_ext("file.txt" + ext))
+
 
 if __name__ == "__main__":
     unittest.main()
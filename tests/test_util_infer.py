@@ -1,5 +1,16 @@
+import gzip
+import os
+import random
+import tempfile
 import unittest
-from fqfa.util.infer import infer_sequence_type, infer_all_sequence_types
+from fqfa.util.infer import infer_sequence_type, infer_all_sequence_types, infer_file_sequence_type
+from fqfa.validator.validator import (
+    dna_bases_validator,
+    dna_characters_validator,
+    rna_bases_validator,
+    amino_acids_validator,
+    amino_acids_all_validator,
+)
 
 
 class TestInferSequenceType(unittest.TestCase):
@@ -32,6 +43,10 @@ class TestInferSequenceType(unittest.TestCase):
         self.assertIsNone(infer_sequence_type("LITVO"))
         self.assertIsNone(infer_sequence_type("AC.GT"))
         self.assertIsNone(infer_sequence_type("TTT88AG"))
+        self.assertIsNone(infer_sequence_type("ACGT\u00c9"))
+
+    def test_empty(self):
+        self.assertIsNone(infer_sequence_type(""))
 
 
 class TestInferAllSequenceTypes(unittest.TestCase):
@@ -85,6 +100,127 @@ class TestInferAllSequenceTypes(unittest.TestCase):
         self.assertIsNone(infer_all_sequence_types("LITVO"))
         self.assertIsNone(infer_all_sequence_types("AC.GT"))
         self.assertIsNone(infer_all_sequence_types("TTT88AG"))
+        self.assertIsNone(infer_all_sequence_types("ACGT\u00c9"))
+
+    def test_empty(self):
+        self.assertIsNone(infer_all_sequence_types(""))
+
+    def test_matches_validators(self):
+        validators = {
+            "dna": dna_bases_validator,
+            "dna-iupac": dna_characters_validator,
+            "rna": rna_bases_validator,
+            "protein": amino_acids_validator,
+            "protein-iupac": amino_acids_all_validator,
+        }
+        rng = random.Random(0)
+        for _ in range(1000):
+            seq = "".join(rng.choices("ACGTUNBZX*LWacgt.", k=rng.randint(1, 5)))
+            with self.subTest(seq=seq):
+                expected = [name for name, validator in validators.items() if validator(seq)]
+                self.assertListEqual(infer_all_sequence_types(seq) or list(), expected)
+
+
+class TestInferFileSequenceType(unittest.TestCase):
+    def setUp(self) -> None:
+        self.paths = list()
+
+    def tearDown(self) -> None:
+        for path in self.paths:
+            os.remove(path)
+
+    def write_fasta(self, records, suffix=".fa"):
+        handle, path = tempfile.mkstemp(suffix=suffix)
+        os.close(handle)
+        self.paths.append(path)
+        data = "".join(f">{header}\n{seq}\n" for header, seq in records).encode("ascii")
+        opener = gzip.open if suffix.endswith(".gz") else open
+        with opener(path, "wb") as f:
+            f.write(data)
+        return path
+
+    def test_complete(self):
+        path = self.write_fasta([("a", "ACGT"), ("b", "ACGB"), ("c", "TTTT")])
+        report = infer_file_sequence_type(path)
+        self.assertEqual(report.seq_type, "dna-iupac")
+        self.assertEqual(report.confidence, 1.0)
+        self.assertEqual(report.records, 3)
+        self.assertListEqual(report.conflicts, [])
+        self.assertTrue(report.complete)
+        self.assertEqual(infer_file_sequence_type(path, report_iupac=False).seq_type, "dna")
+
+    def test_protein_with_dna_records(self):
+        path = self.write_fasta([("a", "ACGT"), ("b", "MKLVW"), ("c", "GGCA")])
+        self.assertEqual(infer_file_sequence_type(path).seq_type, "protein")
+
+    def test_conflicts(self):
+        path = self.write_fasta([("a", "ACGT"), ("b", "AC.G"), ("c", "TTTT"), ("d", "GGCA")])
+        report = infer_file_sequence_type(path)
+        self.assertEqual(report.seq_type, "dna")
+        self.assertEqual(report.confidence, 0.75)
+        self.assertListEqual(report.conflicts, ["b"])
+
+    def test_no_type(self):
+        path = self.write_fasta([("a", "AC.G"), ("b", "88")])
+        report = infer_file_sequence_type(path)
+        self.assertIsNone(report.seq_type)
+        self.assertEqual(report.confidence, 0.0)
+        self.assertListEqual(report.conflicts, ["a", "b"])
+
+    def test_empty(self):
+        path = self.write_fasta([])
+        self.assertEqual(infer_file_sequence_type(path), (None, 0.0, 0, [], True))
+
+    def test_early_exit(self):
+        rng = random.Random(0)
+        records = [(f"r{i}", "".join(rng.choices("ACGT", k=50))) for i in range(1000)]
+        for suffix in (".fa", ".fa.gz"):
+            with self.subTest(suffix=suffix):
+                path = self.write_fasta(records, suffix=suffix)
+                report = infer_file_sequence_type(path, stop_after=10, seed=0)
+                self.assertEqual(report.seq_type, "dna")
+                self.assertFalse(report.complete)
+                self.assertLess(report.records, 30)
+
+    def test_early_exit_on_last_record(self):
+        for suffix in (".fa", ".fa.gz"):
+            with self.subTest(suffix=suffix):
+                path = self.write_fasta([("a", "ACGT"), ("b", "TTGA"), ("c", "GGCA")], suffix=suffix)
+                report = infer_file_sequence_type(path, stop_after=2)
+                self.assertEqual(report.records, 3)
+                self.assertTrue(report.complete)
+                report = infer_file_sequence_type(path, head=3)
+                self.assertEqual(report.records, 3)
+                self.assertTrue(report.complete)
+
+                # a header-only record after the early exit is not sampled
+                path = self.write_fasta([("a", "ACGT"), ("b", "TTGA"), ("c", "")], suffix=suffix)
+                report = infer_file_sequence_type(path, stop_after=1)
+                self.assertEqual(report.records, 2)
+                self.assertFalse(report.complete)
+
+    def test_random_samples(self):
+        rng = random.Random(0)
+        records = [(f"r{i}", "".join(rng.choices("ACGT", k=50))) for i in range(1000)]
+        records += [(f"p{i}", "".join(rng.choices("MKLVW", k=50))) for i in range(1000)]
+        path = self.write_fasta(records)
+        report = infer_file_sequence_type(path, head=10, samples=50, seed=0)
+        self.assertEqual(report.seq_type, "protein")
+        self.assertFalse(report.complete)
+        self.assertLessEqual(report.records, 60)
+
+        # compressed files are only sampled at the start
+        path = self.write_fasta(records, suffix=".fa.gz")
+        report = infer_file_sequence_type(path, head=10, samples=50, seed=0)
+        self.assertEqual(report.seq_type, "dna")
+        self.assertEqual(report.records, 10)
+
+    def test_invalid_arguments(self):
+        path = self.write_fasta([("a", "ACGT")])
+        self.assertRaises(ValueError, infer_file_sequence_type, path, head=0)
+        self.assertRaises(ValueError, infer_file_sequence_type, path, samples=-1)
+        self.assertRaises(ValueError, infer_file_sequence_type, path, stop_after=0)
+        self.assertRaises(FileNotFoundError, infer_file_sequence_type, path + ".missing")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,130 @@
+import random
+import unittest
+import unittest.mock as mock
+from collections import Counter
+from fqfa.util.kmer import encode_kmer, decode_kmer, kmer_codes, KmerCounter, _np
+from fqfa.util.nucleotide import reverse_complement
+
+
+def naive_kmers(seq: str, k: int, canonical: bool = False) -> list:
+    result = list()
+    for i in range(len(seq) - k + 1):
+        kmer = seq[i : i + k]
+        if all(c in "ACGT" for c in kmer):
+            if canonical:
+                kmer = min(kmer, reverse_complement(kmer))
+            result.append(kmer)
+    return result
+
+
+class TestEncodeKmer(unittest.TestCase):
+    def test_encode(self) -> None:
+        self.assertEqual(encode_kmer("A"), 0)
+        self.assertEqual(encode_kmer("T"), 3)
+        self.assertEqual(encode_kmer("ACGT"), 0b00011011)
+        self.assertEqual(encode_kmer(b"CA"), 4)
+
+    def test_invalid(self) -> None:
+        self.assertRaises(ValueError, encode_kmer, "ACNT")
+        self.assertRaises(ValueError, encode_kmer, "acgt")
+
+    def test_round_trip(self) -> None:
+        for kmer in ("A", "ACGT", "TTTTGCA", "G" * 40):
+            self.assertEqual(decode_kmer(encode_kmer(kmer), len(kmer)), kmer)
+
+    def test_order(self) -> None:
+        kmers = ["ACG", "AAA", "TGA", "CTT", "GGG"]
+        self.assertListEqual(sorted(kmers), sorted(kmers, key=encode_kmer))
+
+
+class TestKmerCodes(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.seqs = ["".join(rng.choices("ACGTNR", weights=[10, 10, 10, 10, 1, 1], k=200)) for _ in range(20)]
+
+    def test_matches_naive(self) -> None:
+        for canonical in (False, True):
+            for k in (1, 3, 11, 31, 40):
+                for seq in self.seqs:
+                    expected = [encode_kmer(x) for x in naive_kmers(seq, k, canonical)]
+                    self.assertListEqual(list(kmer_codes(seq, k, canonical=canonical)), expected)
+
+    def test_canonical(self) -> None:
+        self.assertListEqual(list(kmer_codes("TTT", 3, canonical=True)), [encode_kmer("AAA")])
+        self.assertListEqual(list(kmer_codes("ACGTTA", 6, canonical=True)), [encode_kmer("ACGTTA")])
+
+    def test_breaks(self) -> None:
+        self.assertListEqual(list(kmer_codes("ACNGT", 2)), [encode_kmer("AC"), encode_kmer("GT")])
+        self.assertListEqual(list(kmer_codes("ACNGT", 3)), [])
+        self.assertListEqual(list(kmer_codes("", 3)), [])
+
+    def test_bytes(self) -> None:
+        self.assertListEqual(list(kmer_codes(b"ACGTN", 2)), list(kmer_codes("ACGTN", 2)))
+
+    def test_bad_k(self) -> None:
+        self.assertRaises(ValueError, list, kmer_codes("ACGT", 0))
+
+
+class TestKmerCounter(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(1)
+        self.seqs = ["".join(rng.choices("ACGTN", weights=[10, 10, 10, 10, 1], k=100)) for _ in range(200)]
+
+    def expected(self, k: int, canonical: bool) -> dict:
+        counter: Counter = Counter()
+        for seq in self.seqs:
+            counter.update(encode_kmer(x) for x in naive_kmers(seq, k, canonical))
+        return dict(counter)
+
+    def check(self, use_numpy: bool) -> None:
+        for canonical in (False, True):
+            for k in (1, 5, 21, 32):
+                counter = KmerCounter(k, canonical=canonical, use_numpy=use_numpy)
+                for seq in self.seqs:
+                    counter.update(seq)
+                self.assertDictEqual(counter.counts(), self.expected(k, canonical))
+
+    def test_dict(self) -> None:
+        self.check(use_numpy=False)
+
+    @unittest.skipIf(_np is None, "requires numpy")
+    def test_numpy(self) -> None:
+        self.check(use_numpy=True)
+
+    @unittest.skipIf(_np is None, "requires numpy")
+    @mock.patch("fqfa.util.kmer._NUMPY_BATCH_SIZE", 50)
+    @mock.patch("fqfa.util.kmer._NUMPY_COMPACT_SIZE", 100)
+    def test_numpy_compaction(self) -> None:
+        counter = KmerCounter(3, use_numpy=True)
+        for seq in self.seqs:
+            counter.update(seq)
+            counter.update(seq.encode())
+        counts = counter.counts()
+        self.assertDictEqual(counts, {key: 2 * value for key, value in self.expected(3, False).items()})
+
+    @unittest.skipIf(_np is None, "requires numpy")
+    def test_arrays(self) -> None:
+        counter = KmerCounter(5, use_numpy=True)
+        for seq in self.seqs:
+            counter.update(seq)
+        values, counts = counter.arrays()
+        self.assertListEqual(values.tolist(), sorted(self.expected(5, False)))
+        self.assertDictEqual(dict(zip(values.tolist(), counts.tolist())), self.expected(5, False))
+        self.assertRaises(NotImplementedError, KmerCounter(5, use_numpy=False).arrays)
+
+    def test_most_common(self) -> None:
+        counter = KmerCounter(2, use_numpy=False)
+        counter.update("AAAAC")
+        counter.update("ACNTT")
+        self.assertListEqual(counter.most_common(2), [(encode_kmer("AA"), 3), (encode_kmer("AC"), 2)])
+        self.assertEqual(len(counter.most_common()), 3)
+
+    def test_bad_parameters(self) -> None:
+        self.assertRaises(ValueError, KmerCounter, 0)
+        if _np is not None:
+            self.assertRaises(ValueError, KmerCounter, 33, use_numpy=True)
+        self.assertFalse(KmerCounter(33)._use_numpy)
+
+
+if __name__ == "__main__":
+    unittest.main()
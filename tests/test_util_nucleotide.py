@@ -3,6 +3,12 @@ from fqfa.util.nucleotide import (
     reverse_complement,
     convert_rna_to_dna,
     convert_dna_to_rna,
+    reverse_complement_inplace,
+    convert_rna_to_dna_inplace,
+    convert_dna_to_rna_inplace,
+    reverse_complement_batch,
+    convert_rna_to_dna_batch,
+    convert_dna_to_rna_batch,
 )
 
 
@@ -19,6 +25,13 @@ class TestReverseComplement(unittest.TestCase):
         self.assertEqual("4321", reverse_complement("1234"))
         self.assertEqual("GT4321", reverse_complement("1234AC"))
 
+    def test_bytes(self) -> None:
+        self.assertEqual(b"TTCC", reverse_complement(b"GGAA"))
+        self.assertEqual(b"GT4321", reverse_complement(b"1234AC"))
+        self.assertEqual(b"NRYK", reverse_complement(b"MRYN"))
+        self.assertEqual(bytearray(b"TTCC"), reverse_complement(bytearray(b"GGAA")))
+        self.assertEqual(b"TTCC", reverse_complement(memoryview(b"GGAA")))
+
 
 class TestConvertRnaToDna(unittest.TestCase):
     def test_single_nt(self) -> None:
@@ -42,5 +55,43 @@ class TestConvertDnaToRna(unittest.TestCase):
         self.assertEqual("GGAA", convert_dna_to_rna("GGAA"))
 
 
+class TestInplace(unittest.TestCase):
+    def test_bytearray(self) -> None:
+        seq = bytearray(b"GGAAU")
+        reverse_complement_inplace(seq)
+        self.assertEqual(seq, bytearray(b"UTTCC"))
+        convert_rna_to_dna_inplace(seq)
+        self.assertEqual(seq, bytearray(b"TTTCC"))
+        convert_dna_to_rna_inplace(seq)
+        self.assertEqual(seq, bytearray(b"UUUCC"))
+
+    def test_memoryview(self) -> None:
+        buffer = bytearray(b"AAAA\nGGAC\nTTTT")
+        reverse_complement_inplace(memoryview(buffer)[5:9])
+        self.assertEqual(buffer, bytearray(b"AAAA\nGTCC\nTTTT"))
+
+    def test_immutable(self) -> None:
+        self.assertRaises(TypeError, reverse_complement_inplace, b"ACGT")
+        self.assertRaises(TypeError, reverse_complement_inplace, "ACGT")
+        self.assertRaises(TypeError, convert_dna_to_rna_inplace, memoryview(b"ACGT"))
+
+
+class TestBatch(unittest.TestCase):
+    def test_reverse_complement(self) -> None:
+        seqs = ["GGAA", "A", "", "ACGTN"]
+        self.assertListEqual(reverse_complement_batch(seqs), [reverse_complement(x) for x in seqs])
+        bseqs = [x.encode() for x in seqs]
+        self.assertListEqual(reverse_complement_batch(bseqs), [reverse_complement(x) for x in bseqs])
+        self.assertListEqual(reverse_complement_batch([]), [])
+
+    def test_separator(self) -> None:
+        seqs = ["GG\nAA", "AC"]
+        self.assertListEqual(reverse_complement_batch(seqs), ["TT\nCC", "GT"])
+
+    def test_conversion(self) -> None:
+        self.assertListEqual(convert_rna_to_dna_batch(["ACGU", "UU"]), ["ACGT", "TT"])
+        self.assertListEqual(convert_dna_to_rna_batch([b"ACGT", bytearray(b"TT")]), [b"ACGU", b"UU"])
+
+
 if __name__ == "__main__":
     unittest.main()
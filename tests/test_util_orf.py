@@ -0,0 +1,51 @@
+import io
+import unittest
+from fqfa.fasta.fasta import parse_fasta_records
+from fqfa.util.orf import Orf, find_orfs, find_orfs_in_records
+from fqfa.util.translate import TranslationTable
+from fqfa.constants.translation.table import CODON_TABLE
+
+
+class TestFindOrfs(unittest.TestCase):
+    def test_forward(self) -> None:
+        seq = "CC" + "ATG" + "AAA" * 3 + "TAA" + "GG"
+        self.assertListEqual(find_orfs(seq, min_length=0, both_strands=False), [Orf(2, 17, "+", 2, "MKKK", True)])
+        self.assertListEqual(find_orfs(seq, min_length=16, both_strands=False), [])
+
+    def test_reverse(self) -> None:
+        seq = "GG" + "TTA" + "TTT" * 3 + "CAT" + "CC"
+        self.assertListEqual(find_orfs(seq, min_length=0), [Orf(2, 17, "-", 2, "MKKK", True)])
+        self.assertListEqual(find_orfs(seq, min_length=0, both_strands=False), [])
+
+    def test_nested(self) -> None:
+        seq = "ATGATGAAATGA"
+        self.assertListEqual(find_orfs(seq, min_length=0, both_strands=False), [Orf(0, 12, "+", 0, "MMK", True)])
+
+    def test_require_stop(self) -> None:
+        seq = "ATGAAAAAA"
+        self.assertListEqual(find_orfs(seq, min_length=0, both_strands=False), [])
+        self.assertListEqual(
+            find_orfs(seq, min_length=0, require_stop=False, both_strands=False), [Orf(0, 9, "+", 0, "MKK", False)]
+        )
+
+    def test_lower_case_and_n(self) -> None:
+        seq = "atgNNNaaataa"
+        self.assertListEqual(find_orfs(seq, min_length=0, both_strands=False), [Orf(0, 12, "+", 0, "MXK", True)])
+
+    def test_alternative_starts(self) -> None:
+        seq = "TTGAAATAA"
+        self.assertListEqual(find_orfs(seq, min_length=0, both_strands=False), [])
+        table = TranslationTable(CODON_TABLE, starts=["ATG", "TTG"])
+        self.assertListEqual(find_orfs(seq, table, min_length=0, both_strands=False), [Orf(0, 9, "+", 0, "MK", True)])
+        self.assertListEqual(find_orfs("TTATTTCAA", table, min_length=0), [Orf(0, 9, "-", 0, "MK", True)])
+
+    def test_no_starts(self) -> None:
+        table = TranslationTable(CODON_TABLE, starts=[])
+        self.assertListEqual(find_orfs("ATGAAATAA", table, min_length=0), [])
+
+
+class TestFindOrfsInRecords(unittest.TestCase):
+    def test_fasta(self) -> None:
+        data = ">seq1\nCCATGAAA\nTAAGG\n>seq2\nAAAA\n>seq3\nATGTGA\n"
+        orfs = list(find_orfs_in_records(parse_fasta_records(io.StringIO(data)), min_length=6, both_strands=False))
+        self.assertListEqual(orfs, [("seq1", Orf(2, 11, "+", 2, "MK", True)), ("seq3", Orf(0, 6, "+", 0, "M", True))])
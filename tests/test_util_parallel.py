@@ -0,0 +1,49 @@
+import unittest
+from io import StringIO
+from functools import partial
+from fqfa.util.parallel import parallel_map, parallel_map_fasta_records
+from fqfa.util.translate import translate_dna
+from fqfa.util.infer import infer_sequence_type
+
+
+class TestParallelMap(unittest.TestCase):
+    def test_order(self) -> None:
+        items = ["A" * (i % 7) + "C" for i in range(103)]
+
+        result = list(parallel_map(len, items, processes=2, batch_size=4, max_pending=3))
+
+        self.assertListEqual(result, [len(x) for x in items])
+
+    def test_empty(self) -> None:
+        self.assertListEqual(list(parallel_map(len, [], processes=2)), [])
+
+    def test_exception(self) -> None:
+        iterator = parallel_map(translate_dna, ["AAA", "NNN"], processes=1, batch_size=1)
+
+        self.assertTupleEqual(next(iterator), ("K", None))
+        self.assertRaises(KeyError, next, iterator)
+
+    def test_bad_parameters(self) -> None:
+        self.assertRaises(ValueError, next, parallel_map(len, ["A"], processes=0))
+        self.assertRaises(ValueError, next, parallel_map(len, ["A"], batch_size=0))
+        self.assertRaises(ValueError, next, parallel_map(len, ["A"], max_pending=0))
+
+
+class TestParallelMapFastaRecords(unittest.TestCase):
+    def test_infer(self) -> None:
+        data = StringIO(">seq1\nACGT\n>seq2\nMDLSALRVEE\n>seq3\nACGU\n")
+
+        result = list(parallel_map_fasta_records(data, infer_sequence_type, processes=2, batch_size=1))
+
+        self.assertListEqual(result, [("seq1", "dna"), ("seq2", "protein"), ("seq3", "rna")])
+
+    def test_partial(self) -> None:
+        data = StringIO(">seq1\nAAAT\nGA\n>seq2\nCAAA\n")
+
+        result = list(parallel_map_fasta_records(data, partial(translate_dna, frame=1), processes=2))
+
+        self.assertListEqual(result, [("seq1", ("N", "GA")), ("seq2", ("K", None))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,19 @@
+import random
 import unittest
-from fqfa.util.translate import translate_dna, ncbi_genetic_code_to_dict
+import unittest.mock
+from fqfa.util.translate import (
+    translate_dna,
+    translate_six_frames,
+    ncbi_genetic_code_to_dict,
+    ncbi_genetic_code_to_table,
+    ncbi_translation_table,
+    TranslationTable,
+    TranslationCache,
+    _numpy,
+)
+from fqfa.util.nucleotide import reverse_complement
 from fqfa.constants.translation.table import CODON_TABLE
+from fqfa.constants.translation.ncbi import NCBI_GENETIC_CODES, NCBI_BASE1, NCBI_BASE2, NCBI_BASE3
 
 
 class TestTranslateDna(unittest.TestCase):
@@ -29,6 +42,244 @@ class TestTranslateDna(unittest.TestCase):
         self.assertTupleEqual(("K", "AA"), translate_dna("AAAAA"))
         self.assertTupleEqual(("DVPLPA", "G"), translate_dna("GACGTTCCACTGCCGGCTG"))
 
+    def test_frame(self) -> None:
+        self.assertTupleEqual(("K", None), translate_dna("TAAA", frame=1))
+        self.assertTupleEqual(("K", "C"), translate_dna("TTAAAC", frame=2))
+
+    def test_error_position(self) -> None:
+        with self.assertRaisesRegex(KeyError, "'ANA' at nt position 7"):
+            translate_dna("AAAAAAANA")
+        with self.assertRaisesRegex(KeyError, "'ANA' at nt position 8"):
+            translate_dna("CAAAAAAANA", frame=1)
+
+    def test_dict_table(self) -> None:
+        table = dict(CODON_TABLE)
+        table["TGA"] = "W"
+        self.assertTupleEqual(("WK", None), translate_dna("TGAAAA", table=table))
+        with self.assertRaisesRegex(KeyError, "position 4"):
+            translate_dna("TGANNN", table=table)
+
+
+class TestTranslationTable(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        self.seqs = ["".join(rng.choices("ACGT", k=rng.randint(0, 400))) for _ in range(200)]
+
+    def test_mapping(self) -> None:
+        table = TranslationTable()
+        self.assertEqual(len(table), 64)
+        self.assertEqual(table["ATG"], "M")
+        self.assertDictEqual(dict(table), CODON_TABLE)
+        with self.assertRaises(TypeError):
+            table["ATG"] = "X"  # type: ignore[index]
+
+    def test_matches_dict(self) -> None:
+        for use_numpy in (False, True):
+            if use_numpy and _numpy() is None:
+                continue
+            with self.subTest(use_numpy=use_numpy):
+                table = TranslationTable(CODON_TABLE, use_numpy=use_numpy)
+                for seq in self.seqs:
+                    for frame in (0, 1, 2):
+                        self.assertTupleEqual(
+                            table.translate(seq, frame), translate_dna(seq, table=CODON_TABLE, frame=frame)
+                        )
+
+    def test_error_position(self) -> None:
+        for use_numpy in (False, True):
+            if use_numpy and _numpy() is None:
+                continue
+            with self.subTest(use_numpy=use_numpy):
+                table = TranslationTable(use_numpy=use_numpy)
+                seq = "ACG" * 200 + "AcA" + "ACG" * 10
+                with self.assertRaisesRegex(KeyError, "'AcA' at nt position 601"):
+                    table.translate(seq)
+                with self.assertRaisesRegex(KeyError, "at nt position 601"):
+                    table.translate(seq.replace("c", "\u00e9"))
+
+    def test_extra_codons(self) -> None:
+        codons = dict(CODON_TABLE)
+        codons["NNN"] = "X"
+        table = TranslationTable(codons)
+        self.assertTupleEqual(("KXK", "A"), table.translate("AAANNNAAAA"))
+
+    def test_translate_dna(self) -> None:
+        codons = dict(CODON_TABLE)
+        codons["TGA"] = "W"
+        table = TranslationTable(codons)
+        self.assertTupleEqual(("WK", None), translate_dna("TGAAAA", table=table))
+
+    @unittest.skipIf(_numpy() is None, "requires numpy")
+    def test_incomplete_numpy(self) -> None:
+        codons = dict(CODON_TABLE)
+        del codons["TGA"]
+        self.assertRaises(ValueError, TranslationTable, codons, use_numpy=True)
+        table = TranslationTable(codons)
+        with self.assertRaisesRegex(KeyError, "position 301"):
+            table.translate("AAA" * 100 + "TGA" + "AAA" * 100)
+
+    def test_missing_numpy(self) -> None:
+        with unittest.mock.patch("fqfa.util.translate._numpy", lambda: None):
+            self.assertRaises(NotImplementedError, TranslationTable, use_numpy=True)
+
+
+class TestAmbiguousTranslation(unittest.TestCase):
+    def test_codons(self) -> None:
+        table = TranslationTable(ambiguous=True)
+        self.assertTrue(table.ambiguous)
+        self.assertEqual(len(table), 15**3)
+        self.assertEqual(table["GCN"], "A")
+        self.assertEqual(table["TAY"], "Y")
+        self.assertEqual(table["TAR"], "*")
+        self.assertEqual(table["YTR"], "L")
+        self.assertEqual(table["ATH"], "I")
+        self.assertEqual(table["ATN"], "X")
+        self.assertEqual(table["NNN"], "X")
+
+    def test_matches_expansion(self) -> None:
+        rng = random.Random(0)
+        table = TranslationTable(ambiguous=True)
+        expansions = {"A": "A", "C": "C", "G": "G", "T": "T", "R": "AG", "Y": "CT", "N": "ACGT", "B": "CGT"}
+        for _ in range(200):
+            codon = "".join(rng.choices(list(expansions), k=3))
+            aas = {
+                CODON_TABLE[a + b + c]
+                for a in expansions[codon[0]]
+                for b in expansions[codon[1]]
+                for c in expansions[codon[2]]
+            }
+            self.assertEqual(table[codon], aas.pop() if len(aas) == 1 else "X")
+
+    def test_translate_dna(self) -> None:
+        self.assertTupleEqual(translate_dna("ATGGCNNNNTARA", ambiguous=True), ("MAX*", "A"))
+        self.assertRaises(KeyError, translate_dna, "ATGGCN")
+        with self.assertRaisesRegex(KeyError, "position 4"):
+            translate_dna("ATGGGGNCN", ambiguous=True, table=TranslationTable({"ATG": "M"}, ambiguous=True))
+        self.assertTupleEqual(translate_dna("ATGGCN", CODON_TABLE, ambiguous=True), ("MA", None))
+        self.assertRaises(ValueError, translate_dna, "ATGGCN", TranslationTable(), ambiguous=True)
+
+    def test_numpy_fallback(self) -> None:
+        seq = "GCT" * 100 + "GCN" + "GCT" * 100
+        self.assertTupleEqual(translate_dna(seq, ambiguous=True), ("A" * 201, None))
+
+    def test_ncbi(self) -> None:
+        table = ncbi_translation_table(2, ambiguous=True)
+        self.assertEqual(table["AGR"], "*")
+        self.assertEqual(table["TGR"], "W")
+        self.assertIn("ATA", table.starts)
+
+
+class TestTranslationCache(unittest.TestCase):
+    def test_translate(self) -> None:
+        cache = TranslationCache()
+        self.assertTupleEqual(cache.translate("ATGAAAA"), ("MK", "A"))
+        self.assertTupleEqual(cache.translate("ATGAAAA"), ("MK", "A"))
+        self.assertTupleEqual(cache.translate("ATGAAAA", frame=1), ("*K", None))
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        cache.cache_clear()
+        self.assertEqual(cache.cache_info().currsize, 0)
+
+    def test_maxsize(self) -> None:
+        cache = TranslationCache(maxsize=2)
+        self.assertListEqual(
+            cache.translate_batch(["AAA", "CCC", "GGG", "AAA"]), [("K", None), ("P", None), ("G", None), ("K", None)]
+        )
+        self.assertEqual(cache.cache_info().currsize, 2)
+        self.assertEqual(cache.cache_info().hits, 0)
+
+    def test_translate_counts(self) -> None:
+        cache = TranslationCache()
+        counts = [("AAAGGG", 3), ("AAGGGG", 2), ("CCCGGG", 1), ("AAAGGG", 4), ("AAAGGGA", 1)]
+        self.assertDictEqual(cache.translate_counts(counts), {"KG": 10, "PG": 1})
+        self.assertEqual(cache.cache_info().misses, 4)
+        self.assertDictEqual(cache.translate_counts(counts[:1]), {"KG": 3})
+        self.assertEqual(cache.cache_info().hits, 1)
+
+    def test_table(self) -> None:
+        codons = dict(CODON_TABLE)
+        codons["TGA"] = "W"
+        self.assertTupleEqual(TranslationCache(codons).translate("TGA"), ("W", None))
+        self.assertTupleEqual(TranslationCache(ambiguous=True).translate("GCN"), ("A", None))
+        self.assertRaises(ValueError, TranslationCache, TranslationTable(), ambiguous=True)
+        self.assertRaises(KeyError, TranslationCache().translate, "GCN")
+
+
+class TestTranslateSixFrames(unittest.TestCase):
+    def test_short(self) -> None:
+        self.assertListEqual(translate_six_frames("ATGAAAT"), ["MK", "*N", "E", "IS", "FH", "F"])
+        self.assertListEqual(translate_six_frames("AT"), [""] * 6)
+
+    def test_matches_translate_dna(self) -> None:
+        rng = random.Random(0)
+        for use_numpy in (False, True):
+            if use_numpy and _numpy() is None:
+                continue
+            with self.subTest(use_numpy=use_numpy):
+                table = TranslationTable(use_numpy=use_numpy)
+                for _ in range(100):
+                    seq = "".join(rng.choices("ACGT", k=rng.randint(0, 600)))
+                    expected = [translate_dna(x, frame=f)[0] for x in (seq, reverse_complement(seq)) for f in range(3)]
+                    self.assertListEqual(translate_six_frames(seq, table), expected)
+
+    def test_bad_codon(self) -> None:
+        self.assertRaises(KeyError, translate_six_frames, "ACGT" * 100 + "N")
+
+    def test_dict_table(self) -> None:
+        table = dict(CODON_TABLE)
+        table["TGA"] = "W"
+        self.assertListEqual(translate_six_frames("TGA", table), ["W", "", "", "S", "", ""])
+
+
+class TestNcbiGeneticCodeToTable(unittest.TestCase):
+    def test_starts(self) -> None:
+        transl_table = """
+          AAs  = FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG
+          Starts = ---M------**--*----M---------------M----------------------------
+          Base1  = TTTTTTTTTTTTTTTTCCCCCCCCCCCCCCCCAAAAAAAAAAAAAAAAGGGGGGGGGGGGGGGG
+          Base2  = TTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGGTTTTCCCCAAAAGGGG
+          Base3  = TCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAGTCAG
+        """
+        table = ncbi_genetic_code_to_table(transl_table)
+        self.assertDictEqual(dict(table), CODON_TABLE)
+        self.assertSetEqual(set(table.starts), {"TTG", "CTG", "ATG"})
+        self.assertSetEqual(set(TranslationTable().starts), {"ATG"})
+
+
+class TestNcbiTranslationTable(unittest.TestCase):
+    def test_all_codes(self) -> None:
+        self.assertEqual(len(NCBI_GENETIC_CODES), 26)
+        for table_id, code in NCBI_GENETIC_CODES.items():
+            with self.subTest(table_id=table_id):
+                transl_table = (
+                    f"AAs = {code.aas}\nStarts = {code.starts}\n"
+                    f"Base1 = {NCBI_BASE1}\nBase2 = {NCBI_BASE2}\nBase3 = {NCBI_BASE3}\n"
+                )
+                expected = ncbi_genetic_code_to_table(transl_table)
+                table = ncbi_translation_table(table_id)
+                self.assertDictEqual(dict(table), dict(expected))
+                self.assertSetEqual(table.starts, expected.starts)
+                self.assertIn("ATG", table.starts)
+
+    def test_standard(self) -> None:
+        table = ncbi_translation_table(1)
+        self.assertDictEqual(dict(table), CODON_TABLE)
+        self.assertSetEqual(set(table.starts), {"TTG", "CTG", "ATG"})
+
+    def test_variants(self) -> None:
+        self.assertTupleEqual(translate_dna("TGAAGAATA", ncbi_translation_table(2)), ("W*M", None))
+        self.assertTupleEqual(translate_dna("TGA", ncbi_translation_table(11)), ("*", None))
+        self.assertIn("GTG", ncbi_translation_table(11).starts)
+
+    def test_cached(self) -> None:
+        self.assertIs(ncbi_translation_table(11), ncbi_translation_table(11))
+        with self.assertRaises(AttributeError):
+            ncbi_translation_table(11).starts = frozenset()  # type: ignore[misc]
+
+    def test_unknown(self) -> None:
+        self.assertRaises(ValueError, ncbi_translation_table, 7)
+
 
 class TestNcbiGeneticCodeToDict(unittest.TestCase):
     def test_parsing_default_table(self) -> None:
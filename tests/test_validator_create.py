@@ -1,6 +1,7 @@
+import random
 import unittest
 
-from fqfa.validator.create import create_validator
+from fqfa.validator.create import create_validator, create_lookup_validator
 
 
 class TestCreateValidator(unittest.TestCase):
@@ -68,6 +69,85 @@ class TestCreateValidator(unittest.TestCase):
         self.assertRaises(ValueError, create_validator, ["A", "C", ""])
         self.assertRaises(ValueError, create_validator, ["A", "C", ""], case_sensitive=False)
 
+    def test_cached(self) -> None:
+        validator = create_validator("ACGT")
+        self.assertIs(create_validator("TGCA"), validator)
+        self.assertIs(create_validator(list("GATCA")), validator)
+        self.assertIs(create_validator("acgt", case_sensitive=False), create_validator("ACGTacgt"))
+        self.assertIsNot(create_validator("ACGT", binary=True), validator)
+
+    def test_special_characters(self) -> None:
+        validator = create_validator("^]-\\")
+        self.assertIsNotNone(validator("^]-\\"))
+        self.assertIsNone(validator("A"))
+
+        validator = create_validator("A-C")
+        self.assertIsNotNone(validator("A-C"))
+        self.assertIsNone(validator("B"))
+
+        validator = create_validator(["]", "-", "a"], case_sensitive=False, binary=True)
+        self.assertIsNotNone(validator(b"A-]a"))
+        self.assertIsNone(validator(b"B"))
+        self.assertIsNone(validator(b"\\"))
+
+    def test_binary(self) -> None:
+        validator = create_validator("ACGT", binary=True)
+        self.assertIsNotNone(validator(b"ACGT"))
+        self.assertIsNotNone(validator(bytearray(b"ACGT")))
+        self.assertIsNone(validator(b"ACGN"))
+        self.assertIsNone(validator(b""))
+        self.assertRaises(TypeError, validator, "ACGT")
+
+        validator = create_validator("ACGT", case_sensitive=False, binary=True)
+        self.assertIsNotNone(validator(b"ACgt"))
+
+        self.assertRaises(ValueError, create_validator, "ACG\u00c9", binary=True)
+
+
+class TestCreateLookupValidator(unittest.TestCase):
+    def test_create(self) -> None:
+        validator = create_lookup_validator("ACGT")
+        self.assertTrue(validator("ACGT"))
+        self.assertTrue(validator("AAAAAAA"))
+        self.assertFalse(validator("acgt"))
+        self.assertFalse(validator(""))
+        self.assertFalse(validator("AAAA AAA"))
+        self.assertFalse(validator("AAA\u00c5"))
+
+        validator = create_lookup_validator(list("ACGT"), case_sensitive=False)
+        self.assertTrue(validator("acgT"))
+        self.assertFalse(validator("acgN"))
+
+        self.assertRaises(ValueError, create_lookup_validator, ["A", "C", "GT"])
+        self.assertRaises(ValueError, create_lookup_validator, "ACGT\u00c5")
+
+    def test_bytes(self) -> None:
+        validator = create_lookup_validator("ACGT")
+        self.assertTrue(validator(b"ACGT"))
+        self.assertTrue(validator(bytearray(b"ACGT")))
+        self.assertTrue(validator(memoryview(b"ACGT")))
+        self.assertFalse(validator(b"ACGN"))
+        self.assertFalse(validator(b""))
+
+    def test_report_position(self) -> None:
+        validator = create_lookup_validator("ACGT", report_position=True)
+        self.assertIsNone(validator("ACGT"))
+        self.assertIsNone(validator(""))
+        self.assertEqual(validator("NCGT"), 0)
+        self.assertEqual(validator("ACGTacgt"), 4)
+        self.assertEqual(validator(b"ACGTN"), 4)
+        self.assertEqual(validator(memoryview(b"ACNT")), 2)
+        self.assertEqual(validator("AC\u00c5T"), 2)
+
+    def test_matches_regex(self) -> None:
+        rng = random.Random(0)
+        for case_sensitive in (True, False):
+            regex_validator = create_validator("ACGTN", case_sensitive=case_sensitive)
+            lookup_validator = create_lookup_validator("ACGTN", case_sensitive=case_sensitive)
+            for _ in range(1000):
+                seq = "".join(rng.choices("ACGTNacgtn-X", weights=[20] * 5 + [1] * 7, k=rng.randint(0, 20)))
+                self.assertEqual(regex_validator(seq) is not None, lookup_validator(seq))
+
 
 if __name__ == "__main__":
     unittest.main()